@@ -0,0 +1,95 @@
+"""
+Benchmark suite of the core hot paths.
+
+    python -m benchmarks run -o results.json
+    python -m benchmarks compare baseline.json results.json --threshold 0.1
+
+`compare` exits with status 1 when a benchmark is slower than the baseline
+by more than the threshold.
+"""
+import argparse
+import datetime
+import json
+import platform
+import sys
+
+import numpy as np
+
+from .macro import run_macro
+from .micro import run_micro
+
+
+def run(output: str | None, only: str | None):
+    results = {}
+    if only in (None, 'micro'):
+        results.update(run_micro())
+    if only in (None, 'macro'):
+        results.update(run_macro())
+    report = {
+        'meta': {
+            'timestamp': datetime.datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+    for name, result in results.items():
+        print('{:50s} {:12.0f} ns/op'.format(name, result['ns_per_op']))
+    if output:
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+def compare(baseline: dict, current: dict,
+            threshold: float) -> list[tuple[str, float]]:
+    """
+    Compare two reports.
+
+    Returns:
+        list[tuple[str, float]]: Benchmarks slower than `1 + threshold`
+            times the baseline, with their time ratio.
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        if name not in baseline['results']:
+            continue
+        ratio = result['ns_per_op'] / baseline['results'][name]['ns_per_op']
+        if ratio > 1 + threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Tetris benchmark suite.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    run_parser = subparsers.add_parser('run', help='Run the benchmarks.')
+    run_parser.add_argument('-o', '--output', help='JSON report to write.')
+    run_parser.add_argument('--only', choices=['micro', 'macro'])
+    compare_parser = subparsers.add_parser(
+        'compare', help='Flag regressions against a baseline report.')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help='Allowed slowdown ratio (0.1 = 10%%).')
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        run(args.output, args.only)
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, args.threshold)
+    for name, ratio in regressions:
+        print('REGRESSION {:50s} {:6.2f}x slower'.format(name, ratio))
+    if not regressions:
+        print('No regression above {:.0%}.'.format(args.threshold))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
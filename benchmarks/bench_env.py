@@ -0,0 +1,57 @@
+import argparse
+import random
+import time
+
+from tetris.core.bit_board import BitBoard
+from tetris.core.board import Board, MoveType
+from tetris.scenes.tetris_env import TetrisEnv
+
+
+BOARD_CLASSES = {'board': Board, 'bit_board': BitBoard}
+
+
+def bench_env(n_steps: int, seed: int, board_class: type[Board]) -> dict:
+    """
+    Step TetrisEnv with uniformly random actions.
+
+    Args:
+        n_steps (int): Number of steps to run, over as many episodes as needed.
+        seed (int): Seed of the actions and of every episode.
+        board_class (type[Board]): Board engine of the environment.
+
+    Returns:
+        dict: Steps, episodes, elapsed seconds and steps per second.
+    """
+    rng = random.Random(seed)
+    actions = list(MoveType)
+    env = TetrisEnv(board_class=board_class)
+    env.reset(seed)
+    n_episodes = 1
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        _, done = env.step(rng.choice(actions))
+        if done:
+            env.reset(seed + n_episodes)
+            n_episodes += 1
+    elapsed = time.perf_counter() - start
+    return {
+        'steps': n_steps,
+        'episodes': n_episodes,
+        'seconds': elapsed,
+        'steps_per_second': n_steps / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='TetrisEnv throughput.')
+    parser.add_argument('--steps', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--board', choices=BOARD_CLASSES, default='board')
+    args = parser.parse_args()
+    result = bench_env(args.steps, args.seed, BOARD_CLASSES[args.board])
+    print('{steps} steps, {episodes} episodes in {seconds:.2f} s: '
+          '{steps_per_second:.0f} steps/s'.format(**result))
+
+
+if __name__ == '__main__':
+    main()
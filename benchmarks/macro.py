@@ -0,0 +1,46 @@
+import random
+import time
+
+from tetris.core.board import Board
+from tetris.scenes.tetris_cli_controller import TetrisCli
+
+from .bench_env import bench_env
+
+
+def bench_cli_games(n_games: int = 20, seed: int = 0,
+                    max_steps: int = 5000) -> dict:
+    """
+    Play random games through `TetrisCli`, one random input per step
+    followed by `TetrisCli.step` as in the CLI example.
+    """
+    rng = random.Random(seed)
+    n_steps = 0
+    start = time.perf_counter()
+    for game in range(n_games):
+        controller = TetrisCli(seed=seed + game)
+        inputs = [controller.move_left, controller.move_right,
+                  controller.move_down, controller.rotate_cw,
+                  controller.rotate_ccw, controller.drop]
+        controller.create_new_tetrimino()
+        for _ in range(max_steps):
+            if controller.is_game_over():
+                break
+            rng.choice(inputs)()
+            controller.step()
+            n_steps += 1
+    elapsed = time.perf_counter() - start
+    return {
+        'ns_per_op': elapsed / n_steps * 1e9,
+        'ops_per_second': n_steps / elapsed,
+        'steps': n_steps,
+        'games': n_games,
+    }
+
+
+def run_macro() -> dict[str, dict]:
+    env_result = bench_env(50000, 0, Board)
+    env_result['ns_per_op'] = 1e9 / env_result['steps_per_second']
+    return {
+        'tetris_cli.random_games': bench_cli_games(),
+        'tetris_env.random_steps': env_result,
+    }
@@ -0,0 +1,98 @@
+import numpy as np
+
+from tetris.core.bit_board import BitBoard
+from tetris.core.board import Board, MoveType
+from tetris.core.tetrimino import Tetrimino
+from tetris.core.tetrimino_type import TetriminoType
+
+from .timing import time_call, time_call_with_setup
+
+
+BOARD_CLASSES = {'board': Board, 'bit_board': BitBoard}
+
+
+def _board_with_tetrimino(board_class: type[Board]) -> Board:
+    # T in the middle of a half filled field, free to move anywhere
+    board = board_class()
+    y = board.ceil_margin + board.height
+    x1 = board.side_margin
+    board.tetris_field[y - 6:y, x1:x1 + board.width - 1] = 7
+    board.sync_field()
+    board.create_new_tetrimino(TetriminoType.T, 0)
+    board.move_tetrimino(MoveType.DOWN)
+    return board
+
+
+def bench_is_overlapping(board_class: type[Board]) -> dict:
+    board = _board_with_tetrimino(board_class)
+    tetrimino = board.active_tetrimino
+    return time_call(lambda: board._is_overlapping(tetrimino))
+
+
+def bench_move(board_class: type[Board], move: MoveType) -> dict:
+    board = _board_with_tetrimino(board_class)
+    tetrimino = board.active_tetrimino
+
+    def move_once():
+        board.active_tetrimino = tetrimino
+        board.move_tetrimino(move)
+
+    return time_call(move_once)
+
+
+def bench_update_play_field(board_class: type[Board],
+                            n_lines: int) -> dict:
+    # The bottom 8 rows are full but for the rightmost column, which a
+    # vertical I fills in the bottom 4 rows. Rows above the bottom `n_lines`
+    # also miss the cell at x1 + 1, so exactly `n_lines` (at most 4) are
+    # cleared. setup() restores the field before every call.
+    board = board_class()
+    y = board.ceil_margin + board.height
+    x1 = board.side_margin
+    x2 = board.side_margin + board.width
+    template = board.tetris_field.copy()
+    template[y - 8:y, x1:x2 - 1] = 3
+    template[y - 8:y - n_lines, x1 + 1] = 0
+    pos_x = x2 - 3
+    pos_y = y - 4
+
+    def setup():
+        np.copyto(board.tetris_field, template)
+        board.sync_field()
+        board.active_tetrimino = Tetrimino(TetriminoType.I, pos_x, pos_y, 1)
+
+    return time_call_with_setup(board.update_play_field, setup)
+
+
+def bench_shape() -> dict:
+    return time_call(lambda: TetriminoType.T.shape(2))
+
+
+def bench_get_play_field(board_class: type[Board]) -> dict:
+    board = _board_with_tetrimino(board_class)
+    return time_call(board.get_play_field)
+
+
+def bench_get_active_field(board_class: type[Board]) -> dict:
+    board = _board_with_tetrimino(board_class)
+    return time_call(board.get_active_field)
+
+
+def run_micro() -> dict[str, dict]:
+    results = {}
+    moves = [m for m in MoveType if m != MoveType.NO_MOVE]
+    for name, board_class in BOARD_CLASSES.items():
+        results['{}.is_overlapping'.format(name)] = \
+            bench_is_overlapping(board_class)
+        for move in moves:
+            results['{}.move_tetrimino.{}'.format(name, move.name)] = \
+                bench_move(board_class, move)
+        for n_lines in range(5):
+            results['{}.update_play_field.{}_lines'.format(name, n_lines)] = \
+                bench_update_play_field(board_class, n_lines)
+        results['{}.get_play_field'.format(name)] = \
+            bench_get_play_field(board_class)
+        results['{}.get_active_field'.format(name)] = \
+            bench_get_active_field(board_class)
+    results['tetrimino_type.shape'] = bench_shape()
+    return results
@@ -0,0 +1,49 @@
+import time
+import timeit
+
+from typing import Callable
+
+
+def time_call(func: Callable[[], object], repeat: int = 5,
+              min_seconds: float = 0.05) -> dict:
+    """
+    Time a call with timeit, calibrating the number of loops.
+
+    Returns:
+        dict: Best and median nanoseconds per call over the repeats.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_seconds / 0.2))
+    times = sorted(t / number * 1e9 for t in timer.repeat(repeat, number))
+    return _result(times)
+
+
+def time_call_with_setup(func: Callable[[], object],
+                         setup: Callable[[], object],
+                         number: int = 2000, repeat: int = 5) -> dict:
+    """
+    Time a call that needs a fresh state, excluding the setup.
+
+    Every call is timed on its own, so the timer overhead (about 100 ns) is
+    included. Use it only for calls in the microsecond range.
+    """
+    times = []
+    for _ in range(repeat):
+        elapsed = 0
+        for _ in range(number):
+            setup()
+            start = time.perf_counter_ns()
+            func()
+            elapsed += time.perf_counter_ns() - start
+        times.append(elapsed / number)
+    return _result(sorted(times))
+
+
+def _result(times: list[float]) -> dict:
+    best = times[0]
+    return {
+        'ns_per_op': best,
+        'median_ns_per_op': times[len(times) // 2],
+        'ops_per_second': 1e9 / best,
+    }
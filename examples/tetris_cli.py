@@ -1,45 +1,17 @@
-import os
-
+from tetris.scenes.terminal_renderer import TerminalRenderer
 from tetris.scenes.tetris_cli_controller import TetrisCli
 
-
-def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
-
-
-def render_board(data: dict) -> str:
-    lines = []
-    for y in range(data['board'].shape[0]):
-        line = ''
-        for x in range(data['board'].shape[1]):
-            cell1 = data['board'][y, x]
-            cell2 = data['active'][y, x]
-            if cell1 != 0:
-                line += '#'
-            elif cell2 != 0:
-                line += 'o'
-            else:
-                line += '.'
-        lines.append(line)
-    return '\n'.join(lines)
-
-
-def render_status(data: dict) -> str:
-    return '\n SCORE: {}\n'.format(data['score'])
+ACTIONS = ('ACTIONS: a=LEFT, d=RIGHT, s=DOWN, x=DROP, e=CLOCKWISE, '
+           'w=COUNTERCLOCKWISE, q=EXIT')
 
 
 def tetris_cli():
     controller = TetrisCli()
+    renderer = TerminalRenderer()
 
     controller.create_new_tetrimino()
     while True:
-        clear_screen()
-
-        view_data = controller.render_data()
-        print(render_board(view_data))
-        print(render_status(view_data))
-        print('ACTIONS: a=LEFT, d=RIGHT, s=DOWN, e=CLOCKWISE, '
-              'w=COUNTERCLOCKWISE, q=EXIT')
+        renderer.render(controller.render_data(), footer=['', ACTIONS])
 
         if controller.is_game_over():
             print('Game Over!')
@@ -56,6 +28,8 @@ def tetris_cli():
             controller.move_right()
         elif key == 's':
             controller.move_down()
+        elif key == 'x':
+            controller.drop()
         elif key == 'e':
             controller.rotate_cw()
         elif key == 'w':
@@ -0,0 +1,46 @@
+import asyncio
+import sys
+import termios
+import tty
+
+from tetris.scenes.scene_runner import SceneRunner
+from tetris.scenes.terminal_renderer import TerminalRenderer
+from tetris.scenes.tetris_scene import TetrisScene
+
+ACTIONS = ('ACTIONS: a=LEFT, d=RIGHT, s=DOWN, x=DROP, e=CLOCKWISE, '
+           'w=COUNTERCLOCKWISE, q=EXIT')
+
+
+async def tetris_realtime():
+    scene = TetrisScene()
+    renderer = TerminalRenderer()
+    runner = SceneRunner(
+        scene, on_frame=lambda data: renderer.render(data, ['', ACTIONS]))
+
+    def read_key():
+        key = sys.stdin.read(1)
+        if key == 'q':
+            runner.stop()
+        elif key:
+            runner.post_input(ord(key))
+
+    loop = asyncio.get_running_loop()
+    loop.add_reader(sys.stdin.fileno(), read_key)
+    try:
+        await runner.run()
+    finally:
+        loop.remove_reader(sys.stdin.fileno())
+    print('Game Over!' if scene.is_finished() else 'Exit tetris. See again!')
+    jitter = runner.stats()['wakeup_jitter']
+    print('{} ticks, {} frames, mean loop jitter {:.3f} ms'.format(
+        runner.n_ticks, runner.n_frames,
+        1e3 * jitter['sum'] / max(jitter['count'], 1)))
+
+
+if __name__ == '__main__':
+    attrs = termios.tcgetattr(sys.stdin)
+    tty.setcbreak(sys.stdin.fileno())
+    try:
+        asyncio.run(tetris_realtime())
+    finally:
+        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, attrs)
@@ -0,0 +1,79 @@
+import unittest
+
+import numpy as np
+
+from tetris.simulation.beam_search import BeamSearchAgent, SearchNode
+from tetris.scenes.tetris_env import TetrisEnv
+
+
+class TestBeamSearch(unittest.TestCase):
+    def test_play(self):
+        """Test if the agent clears lines and leaves the board unchanged."""
+        env = TetrisEnv()
+        env.reset(1234)
+        agent = BeamSearchAgent(beam_width=4, depth=2)
+        n_nodes = 0
+        for _ in range(60):
+            field = env.board.tetris_field.copy()
+            field_hash = env.board.field_hash
+            tetrimino = env.board.active_tetrimino
+            pose = (tetrimino.type, tetrimino.pos_x, tetrimino.pos_y,
+                    tetrimino.rot)
+            preview = env.tetrimino_factory.peek(1)
+            result = agent.search(env.board, preview)
+            np.testing.assert_array_equal(env.board.tetris_field, field)
+            self.assertEqual(env.board.field_hash, field_hash)
+            tetrimino = env.board.active_tetrimino
+            self.assertEqual((tetrimino.type, tetrimino.pos_x,
+                              tetrimino.pos_y, tetrimino.rot), pose)
+            self.assertEqual(env.board.undo_stack, [])
+            self.assertEqual(result.depth, 2)
+            self.assertEqual(len(result.line), 2)
+            self.assertEqual(result.line[0], result.placement)
+            self.assertGreater(result.nodes_per_second, 0)
+            n_nodes += result.n_nodes
+            agent.act(env)
+            self.assertTrue(env.is_playing)
+        self.assertGreater(env.player_status.lines, 0)
+        self.assertGreater(n_nodes, 0)
+
+    def test_node_budget(self):
+        """Test if the search stops at the node budget."""
+        env = TetrisEnv()
+        env.reset(1234)
+        agent = BeamSearchAgent(beam_width=8, depth=3, max_nodes=1)
+        result = agent.search(env.board, env.tetrimino_factory.peek(2))
+        self.assertEqual(result.depth, 1)
+        self.assertIsNotNone(result.placement)
+        self.assertLess(result.n_nodes, 60)
+
+    def test_merge_keeps_best(self):
+        """Test if children with the same field keep the best score."""
+        env = TetrisEnv()
+        env.reset(1234)
+        board = env.board
+        agent = BeamSearchAgent()
+        tetrimino = board.active_tetrimino
+        piece = (tetrimino.type, tetrimino.rot)
+        placements, _ = board.enumerate_placements()
+        board.push_undo()
+        agent._lock(board, tetrimino.type, placements[0])
+        field_hash = board.field_hash
+        field = board.get_field_view().copy()
+        board.pop_undo()
+        # A worse child with the field of the first placement
+        children = [SearchNode([], -1, 0.0)]
+        fields = [field]
+        seen = {field_hash: 0}
+        n_nodes = agent._expand(board, SearchNode([], 0, 0.0), piece,
+                                children, fields, seen)
+        self.assertEqual(n_nodes, len(placements))
+        self.assertEqual(len(children), len(seen))
+        self.assertEqual(len(fields), len(seen))
+        self.assertEqual(children[0].n_lines, 0)
+        self.assertEqual(children[0].placements,
+                         [(tetrimino.type, placements[0])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from unittest import mock
+
+from benchmarks.__main__ import compare, main
+
+
+def make_report(ns_per_op: dict[str, float]) -> dict:
+    return {
+        'meta': {'python': '3.11'},
+        'results': {name: {'ns_per_op': ns}
+                    for name, ns in ns_per_op.items()},
+    }
+
+
+class TestBenchmarks(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.baseline = os.path.join(self.directory.name, 'baseline.json')
+        self.current = os.path.join(self.directory.name, 'current.json')
+        with open(self.baseline, 'w') as f:
+            json.dump(make_report({'a': 100.0, 'b': 100.0, 'c': 100.0,
+                                   'removed': 100.0}), f)
+        with open(self.current, 'w') as f:
+            json.dump(make_report({'a': 90.0, 'b': 110.0, 'c': 150.0,
+                                   'added': 1000.0}), f)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_compare(self):
+        """Test if only benchmarks slower than the threshold are flagged."""
+        with open(self.baseline) as f:
+            baseline = json.load(f)
+        with open(self.current) as f:
+            current = json.load(f)
+        self.assertEqual(compare(baseline, current, 0.2), [('c', 1.5)])
+        self.assertEqual(compare(baseline, current, 0.05),
+                         [('b', 1.1), ('c', 1.5)])
+        self.assertEqual(compare(baseline, current, 1.0), [])
+        self.assertEqual(compare(baseline, baseline, 0.0), [])
+
+    def test_compare_exit_status(self):
+        """Test if the compare command fails on regressions only."""
+        for threshold, status in [('0.2', 1), ('1.0', 0)]:
+            argv = ['benchmarks', 'compare', self.baseline, self.current,
+                    '--threshold', threshold]
+            stdout = io.StringIO()
+            with mock.patch.object(sys, 'argv', argv), \
+                    contextlib.redirect_stdout(stdout):
+                self.assertEqual(main(), status)
+            self.assertEqual('REGRESSION' in stdout.getvalue(),
+                             bool(status))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import random
+import unittest
+
+import numpy.testing as npt
+
+from tetris.core.bit_board import BitBoard
+from tetris.core.board import Board, MoveType
+from tetris.core.tetrimino_factory import TetriminoFactory
+from tetris.core.tetrimino_type import TetriminoType
+
+
+class TestBitBoard(unittest.TestCase):
+    def test_same_field_as_board(self):
+        """Test if random games give identical fields on both engines."""
+        rng = random.Random(1234)
+        tetrimino_factory = TetriminoFactory(1234)
+        moves = [MoveType.LEFT, MoveType.RIGHT, MoveType.DOWN,
+                 MoveType.ROTATE_CW, MoveType.ROTATE_CCW]
+        board = Board()
+        bit_board = BitBoard()
+        for _ in range(200):
+            tetrimino, rot = tetrimino_factory.generate_random()
+            created = board.create_new_tetrimino(tetrimino, rot)
+            self.assertEqual(bit_board.create_new_tetrimino(tetrimino, rot),
+                             created)
+            if not created:
+                break
+            while True:
+                move = rng.choice(moves)
+                moved = board.move_tetrimino(move)
+                self.assertEqual(bit_board.move_tetrimino(move), moved)
+                if move == MoveType.DOWN and not moved:
+                    break
+            npt.assert_array_equal(bit_board.get_active_field(),
+                                   board.get_active_field())
+            self.assertEqual(bit_board.update_play_field(),
+                             board.update_play_field())
+            npt.assert_array_equal(bit_board.get_play_field(),
+                                   board.get_play_field())
+
+    def test_lock_and_delete_line(self):
+        """Test if a full line is deleted and row masks are shifted."""
+        board = BitBoard()
+        x1 = board.side_margin + 1
+        x2 = board.side_margin + board.width
+        y1 = board.ceil_margin + board.height - 4
+        y2 = board.ceil_margin + board.height
+        board.tetris_field[y1:y2, x1:x2] = 3
+        board.sync_field()
+
+        board.create_new_tetrimino(TetriminoType.I, 1)
+        while board.move_tetrimino(MoveType.LEFT):
+            pass
+        while board.move_tetrimino(MoveType.DOWN):
+            pass
+        self.assertEqual(board.update_play_field(), 4)
+        self.assertFalse(board.get_play_field().any())
+        self.assertEqual(board.row_masks[y1:y2],
+                         [board.empty_row_mask] * 4)
+
+    def test_wall_collision(self):
+        """Test if walls are detected by the row masks."""
+        board = BitBoard()
+        board.create_new_tetrimino(TetriminoType.I, 1)
+        n_moves = 0
+        while board.move_tetrimino(MoveType.LEFT):
+            n_moves += 1
+        self.assertEqual(board.active_tetrimino.pos_x, 0)
+        self.assertEqual(n_moves, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
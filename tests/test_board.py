@@ -1,5 +1,8 @@
 import unittest
 
+import numpy as np
+
+from tetris.core.bit_board import BitBoard
 from tetris.core.board import Board, MoveType
 from tetris.core.tetrimino import Tetrimino
 from tetris.core.tetrimino_factory import TetriminoFactory
@@ -73,3 +76,386 @@ class TestBoard(unittest.TestCase):
 
         self.assertEqual(board.active_tetrimino.pos_x, 7)
 
+    def test_enumerate_placements(self):
+        """Test if all resting placements are found on an empty field."""
+        # Number of distinct footprints on an empty 10-wide field
+        expected = {'O': 9, 'I': 17, 'T': 34, 'S': 17, 'Z': 17,
+                    'J': 34, 'L': 34}
+        tetrimino_factory = TetriminoFactory()
+        for name, n_placements in expected.items():
+            board = Board()
+            tetrimino, rot = tetrimino_factory.generate_fixed(name, 0)
+            board.create_new_tetrimino(tetrimino, rot)
+            placements, n_expanded = board.enumerate_placements()
+            self.assertEqual(len(placements), n_placements)
+            self.assertGreaterEqual(n_expanded, n_placements)
+
+    def test_enumerate_placements_paths(self):
+        """Test if every move path reaches its resting placement."""
+        board = Board()
+        x1 = board.side_margin
+        x2 = board.side_margin + board.width
+        y = board.ceil_margin + board.height - 1
+        board.tetris_field[y - 2:y + 1, x1:x2 - 2] = 7
+        board.tetris_field[y - 5, x1 + 3:x2] = 7
+        board.create_new_tetrimino(TetriminoType.T, 0)
+        placements, _ = board.enumerate_placements()
+        bit_board = BitBoard()
+        bit_board.tetris_field[:] = board.tetris_field
+        bit_board.sync_field()
+        bit_board.create_new_tetrimino(TetriminoType.T, 0)
+        self.assertEqual(bit_board.enumerate_placements(),
+                         board.enumerate_placements())
+        for placement in placements:
+            start = board.active_tetrimino
+            for move in placement.path:
+                self.assertTrue(board.move_tetrimino(move))
+            self.assertEqual(
+                (board.active_tetrimino.rot % 4,
+                 board.active_tetrimino.pos_x,
+                 board.active_tetrimino.pos_y),
+                (placement.rot, placement.pos_x, placement.pos_y))
+            self.assertFalse(board.move_tetrimino(MoveType.DOWN))
+            board.active_tetrimino = start
+        # Slide under the overhang on the right
+        self.assertTrue(any(p.pos_y > y - 5 for p in placements
+                            if p.pos_x > x1 + 3))
+
+    def test_drop(self):
+        """Test if hard drop lands on the highest filled cell below."""
+        for board in [Board(), BitBoard()]:
+            board.create_new_tetrimino(TetriminoType.O, 0)
+            y = board.ceil_margin + board.height
+            self.assertEqual(board.get_ghost_position(),
+                             (board.active_tetrimino.pos_x, y - 2))
+            self.assertTrue(board.move_tetrimino(MoveType.DROP))
+            self.assertEqual(board.drop_distance(), 0)
+            self.assertFalse(board.move_tetrimino(MoveType.DOWN))
+            board.update_play_field()
+
+            # Land on top of the locked O
+            board.create_new_tetrimino(TetriminoType.T, 0)
+            board.move_tetrimino(MoveType.DROP)
+            self.assertEqual(board.active_tetrimino.pos_y, y - 4)
+            board.update_play_field()
+            self.assertEqual(board.column_tops,
+                             np.argmax(board.tetris_field > 0, axis=0)
+                             .tolist())
+
+    def test_move_replaces_tetrimino(self):
+        """Test if only accepted moves replace the active Tetrimino."""
+        for board in [Board(), BitBoard()]:
+            board.create_new_tetrimino(TetriminoType.I, 1)
+            while board.move_tetrimino(MoveType.LEFT):
+                pass
+            tetrimino = board.active_tetrimino
+            self.assertFalse(board.move_tetrimino(MoveType.LEFT))
+            self.assertIs(board.active_tetrimino, tetrimino)
+            self.assertTrue(board.will_collide(MoveType.LEFT)[0])
+            self.assertTrue(board.move_tetrimino(MoveType.RIGHT))
+            self.assertIsNot(board.active_tetrimino, tetrimino)
+            self.assertEqual(board.active_tetrimino.pos_x,
+                             tetrimino.pos_x + 1)
+            with self.assertRaises(ValueError):
+                board.move_tetrimino(MoveType.NO_MOVE)
+
+    def test_legal_moves(self):
+        """Test if the legal moves are the moves accepted by the board."""
+        rng = np.random.default_rng(1234)
+        moves = [MoveType.LEFT, MoveType.RIGHT, MoveType.DOWN,
+                 MoveType.ROTATE_CW, MoveType.ROTATE_CCW]
+        for board in [Board(), BitBoard()]:
+            self.assertEqual(board.legal_moves(), 0)
+            tetrimino_factory = TetriminoFactory(1234)
+            for _ in range(200):
+                if board.active_tetrimino is None and \
+                        not board.create_new_tetrimino(
+                            *tetrimino_factory.generate_random()):
+                    break
+                legal = board.legal_moves()
+                self.assertFalse(legal & (1 << MoveType.NO_MOVE.value))
+                self.assertTrue(legal & (1 << MoveType.DROP.value))
+                tetrimino = board.active_tetrimino
+                for move in moves:
+                    self.assertEqual(board.move_tetrimino(move),
+                                     bool(legal & (1 << move.value)))
+                    board.active_tetrimino = tetrimino
+                move = moves[rng.integers(len(moves))]
+                if not board.move_tetrimino(move) and move == MoveType.DOWN:
+                    board.update_play_field()
+
+    def test_versioned_views(self):
+        """Test if cached frames are rebuilt only after a change."""
+        board = Board()
+        board.create_new_tetrimino(TetriminoType.T, 0)
+        for _ in range(5):
+            board.move_tetrimino(MoveType.DOWN)
+        frame = board.get_frame()
+        self.assertFalse(frame.flags.writeable)
+        self.assertFalse(board.get_field_view().flags.writeable)
+        self.assertTrue(board.tetris_field.flags.writeable)
+        self.assertIs(board.get_frame(), frame)
+        self.assertIs(board.get_active_view(), board.get_active_view())
+        np.testing.assert_array_equal(
+            frame, board.get_play_field() + board.get_active_field())
+
+        versions = (board.field_version, board.active_version)
+        self.assertTrue(board.move_tetrimino(MoveType.ROTATE_CW))
+        self.assertEqual(board.field_version, versions[0])
+        self.assertGreater(board.active_version, versions[1])
+        self.assertIsNot(board.get_frame(), frame)
+
+        field_version = board.field_version
+        board.move_tetrimino(MoveType.DROP)
+        board.update_play_field()
+        self.assertGreater(board.field_version, field_version)
+        self.assertFalse(board.get_active_view().any())
+        np.testing.assert_array_equal(board.get_frame(),
+                                      board.get_play_field())
+
+    def test_views_follow_moves_in_place(self):
+        """Test if cached frames follow a Tetrimino moved in place."""
+        board = Board()
+        board.create_new_tetrimino(TetriminoType.T, 0)
+        for _ in range(5):
+            board.move_tetrimino(MoveType.DOWN)
+        active = board.get_active_view()
+        frame = board.get_frame()
+        version = board.active_version
+        board.active_tetrimino.move_left()
+        self.assertGreater(board.active_version, version)
+        np.testing.assert_array_equal(board.get_active_view(),
+                                      board.get_active_field())
+        self.assertFalse((board.get_active_view() == active).all())
+        np.testing.assert_array_equal(
+            board.get_frame(),
+            board.get_play_field() + board.get_active_field())
+        self.assertIsNot(board.get_frame(), frame)
+        version = board.active_version
+        self.assertEqual(board.active_version, version)
+
+    def test_field_view_after_change(self):
+        """Test if views taken after line clears and garbage are current."""
+        for board in [Board(), BitBoard()]:
+            x1 = board.side_margin
+            bottom = board.max_height - board.floor_margin
+            board.tetris_field[bottom - 10:bottom, x1:x1 + board.width] = 7
+            board.tetris_field[bottom - 10:bottom - 4, x1] = 0
+            board.sync_field()
+            field_version = board.field_version
+            # Four cleared lines below six rows slide the row store window
+            board.delete_lines(list(range(bottom - 4, bottom)))
+            self.assertGreater(board.field_version, field_version)
+            for view in [board.get_field_view(), board.get_frame()]:
+                np.testing.assert_array_equal(view, board.get_play_field())
+            self.assertTrue(board.insert_garbage(2, 0))
+            np.testing.assert_array_equal(board.get_field_view(False),
+                                          board.tetris_field)
+            np.testing.assert_array_equal(board.get_frame(),
+                                          board.get_play_field())
+            self.assertEqual(np.count_nonzero(
+                board.get_field_view() == board.wall_id), 0)
+
+    def test_drop_under_overhang(self):
+        """Test if hard drop works for a Tetrimino below an overhang."""
+        board = Board()
+        x1 = board.side_margin
+        y = board.ceil_margin + board.height - 1
+        board.tetris_field[y - 6, x1:x1 + 4] = 7
+        board.tetris_field[y, x1 + 1] = 7
+        board.sync_field()
+        board.active_tetrimino = Tetrimino(TetriminoType.I, pos_x=x1 - 2,
+                                           pos_y=y - 5, rot=1)
+        self.assertEqual(board.drop_distance(), 2)
+        board.active_tetrimino = Tetrimino(TetriminoType.I, pos_x=x1 - 1,
+                                           pos_y=y - 5, rot=1)
+        self.assertEqual(board.drop_distance(), 1)
+
+    def test_delete_lines_in_place(self):
+        """Test if lines are compacted in the same row store."""
+        rng = np.random.default_rng(1234)
+        for _ in range(50):
+            board = Board()
+            x1 = board.side_margin
+            x2 = board.side_margin + board.width
+            y1 = board.ceil_margin + 5
+            y2 = board.ceil_margin + board.height
+            board.tetris_field[y1:y2, x1:x2] = rng.integers(
+                1, 8, size=(y2 - y1, x2 - x1)) * (rng.random(
+                    (y2 - y1, x2 - x1)) < 0.6)
+            board.sync_field()
+            cleared_lines = sorted(rng.choice(
+                np.arange(y1, y2), size=rng.integers(1, 5), replace=False))
+            expected = np.delete(board.tetris_field, cleared_lines, axis=0)
+            expected = np.vstack([np.tile(board.empty_row,
+                                          (len(cleared_lines), 1)),
+                                  expected])
+            field = board.tetris_field
+            board.delete_lines(cleared_lines)
+            # Same row store, the window may have slid
+            self.assertIs(board.tetris_field.base, field.base)
+            np.testing.assert_array_equal(board.tetris_field, expected)
+            self.assertEqual(board.column_tops,
+                             np.argmax(expected > 0, axis=0).tolist())
+
+    def test_insert_garbage(self):
+        """Test if garbage and line clears match a reference field."""
+        rng = np.random.default_rng(1234)
+        for board in [Board(), BitBoard()]:
+            x1 = board.side_margin
+            bottom = board.max_height - board.floor_margin
+            expected = board.tetris_field.copy()
+            for _ in range(300):
+                if rng.random() < 0.5:
+                    n_rows = int(rng.integers(1, 4))
+                    hole = int(rng.integers(board.width))
+                    top = min(board.column_tops[x1:x1 + board.width])
+                    inserted = board.insert_garbage(n_rows, hole)
+                    self.assertEqual(inserted, top >= n_rows)
+                    if inserted:
+                        garbage = np.tile(board.empty_row, (n_rows, 1))
+                        garbage[:, x1:x1 + board.width] = board.garbage_id
+                        garbage[:, x1 + hole] = 0
+                        expected = np.vstack([expected[n_rows:bottom],
+                                              garbage, expected[bottom:]])
+                else:
+                    playable = expected[:bottom, x1:x1 + board.width]
+                    rows = np.nonzero(playable.any(axis=1))[0]
+                    if not len(rows):
+                        continue
+                    cleared = sorted(rng.choice(
+                        rows, size=min(len(rows), int(rng.integers(1, 5))),
+                        replace=False).tolist())
+                    board.delete_lines(cleared)
+                    expected = np.vstack([
+                        np.tile(board.empty_row, (len(cleared), 1)),
+                        np.delete(expected, cleared, axis=0)])
+                np.testing.assert_array_equal(board.tetris_field, expected)
+                self.assertEqual(board.column_tops,
+                                 np.argmax(expected > 0, axis=0).tolist())
+                self.assertEqual(board.field_hash,
+                                 board.zobrist.hash_field(expected))
+                if isinstance(board, BitBoard):
+                    self.assertEqual(board.row_masks,
+                                     board._init_row_masks())
+
+            board.push_undo()
+            board.insert_garbage(2, 0)
+            board.pop_undo()
+            np.testing.assert_array_equal(board.tetris_field, expected)
+
+    def test_garbage_id(self):
+        """Test if garbage cells are not Tetrimino or wall cells."""
+        board = Board()
+        self.assertTrue(board.insert_garbage(2, 3))
+        bottom = board.max_height - board.floor_margin
+        x1 = board.side_margin
+        cells = board.tetris_field[bottom - 2:bottom, x1:x1 + board.width]
+        garbage = set(cells[cells != 0].tolist())
+        self.assertEqual(garbage, {board.garbage_id})
+        for cell in garbage:
+            self.assertNotIn(cell, [t.id for t in TetriminoType])
+            self.assertNotEqual(cell, board.wall_id)
+
+    def test_garbage_pushes_tetrimino(self):
+        """Test if an overlapping Tetrimino is pushed above the garbage."""
+        board = Board()
+        board.create_new_tetrimino(TetriminoType.O, 0)
+        board.move_tetrimino(MoveType.DROP)
+        pos_y = board.active_tetrimino.pos_y
+        self.assertTrue(board.insert_garbage(2, 0))
+        self.assertEqual(board.active_tetrimino.pos_y, pos_y - 2)
+        self.assertFalse(board._is_overlapping(board.active_tetrimino))
+        with self.assertRaises(ValueError):
+            board.insert_garbage(1, board.width)
+
+    def test_garbage_tops_out_tetrimino(self):
+        """Test if a Tetrimino which can not be pushed clear tops out."""
+        for board in [Board(), BitBoard()]:
+            x1 = board.side_margin
+            bottom = board.max_height - board.floor_margin
+            board.tetris_field[4:bottom, x1:x1 + board.width - 1] = 7
+            board.sync_field()
+            self.assertTrue(board.create_new_tetrimino(TetriminoType.O, 0))
+            self.assertFalse(board.insert_garbage(3, board.width - 1))
+            self.assertIsNone(board.active_tetrimino)
+            self.assertEqual(board.field_hash,
+                             board.zobrist.hash_field(board.tetris_field))
+            self.assertEqual(board.column_tops,
+                             np.argmax(board.tetris_field > 0, axis=0)
+                             .tolist())
+
+    def test_undo(self):
+        """Test if pop_undo rolls back nested locks and line clears."""
+        rng = np.random.default_rng(1234)
+        for board in [Board(), BitBoard()]:
+            y2 = board.ceil_margin + board.height
+            x1 = board.side_margin
+            for y in range(y2 - 6, y2):
+                board.tetris_field[y, x1:x1 + board.width] = 7
+                board.tetris_field[y, x1 + rng.integers(board.width)] = 0
+            board.sync_field()
+            snapshot = board.snapshot()
+            fields = []
+            total_cleared = 0
+            for _ in range(6):
+                fields.append(board.tetris_field.copy())
+                tetrimino = list(TetriminoType)[rng.integers(7)]
+                self.assertTrue(board.create_new_tetrimino(tetrimino, 0))
+                board.push_undo()
+                placements, _ = board.enumerate_placements()
+                # Try every placement and keep the one clearing most lines
+                n_cleared = []
+                for placement in placements:
+                    board.push_undo()
+                    board.active_tetrimino = Tetrimino(
+                        tetrimino, placement.pos_x, placement.pos_y,
+                        placement.rot)
+                    n_cleared.append(board.update_play_field())
+                    board.pop_undo()
+                    np.testing.assert_array_equal(board.tetris_field,
+                                                  fields[-1])
+                placement = placements[int(np.argmax(n_cleared))]
+                for move in placement.path:
+                    board.move_tetrimino(move)
+                total_cleared += board.update_play_field()
+            self.assertGreater(total_cleared, 0)
+            while board.undo_stack:
+                board.pop_undo()
+                self.assertIsNotNone(board.active_tetrimino)
+                np.testing.assert_array_equal(board.tetris_field,
+                                              fields.pop())
+                self.assertEqual(board.column_tops,
+                                 np.argmax(board.tetris_field > 0, axis=0)
+                                 .tolist())
+                self.assertEqual(board.field_hash,
+                                 board.zobrist.hash_field(board.tetris_field))
+                if isinstance(board, BitBoard):
+                    self.assertEqual(board.row_masks,
+                                     board._init_row_masks())
+            board.restore(snapshot)
+            np.testing.assert_array_equal(board.tetris_field,
+                                          snapshot.tetris_field)
+
+    def test_snapshot_keeps_pose(self):
+        """Test if restore brings back the pose at snapshot time."""
+        board = Board()
+        self.assertTrue(board.create_new_tetrimino(TetriminoType.T, 0))
+        tetrimino = board.active_tetrimino
+        pose = (tetrimino.pos_x, tetrimino.pos_y, tetrimino.rot)
+        snapshot = board.snapshot()
+        board.push_undo()
+        for _ in range(2):
+            tetrimino.move_left()
+            tetrimino.move_down()
+            tetrimino.rotate_clockwise()
+            board.pop_undo()
+            restored = board.active_tetrimino
+            self.assertEqual((restored.pos_x, restored.pos_y, restored.rot),
+                             pose)
+            board.restore(snapshot)
+            restored = board.active_tetrimino
+            self.assertEqual((restored.pos_x, restored.pos_y, restored.rot),
+                             pose)
+            tetrimino = restored
+            board.push_undo()
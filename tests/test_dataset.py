@@ -0,0 +1,64 @@
+import random
+import tempfile
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+
+from tetris.core.board import MoveType
+from tetris.scenes.tetris_env import TetrisEnv
+from tetris.simulation.dataset import DatasetReader, DatasetWriter
+
+
+class TestDataset(unittest.TestCase):
+    def test_write_and_read(self):
+        """Test if recorded steps are read back across shards."""
+        rng = random.Random(1234)
+        env = TetrisEnv()
+        env.reset(1234)
+        expected = []
+        with tempfile.TemporaryDirectory() as directory:
+            with DatasetWriter(directory, shard_size=1000, buffer_size=64,
+                               max_pending=2) as writer:
+                for _ in range(2500):
+                    field = env.board.get_play_field() != 0
+                    piece = env.board.active_tetrimino.type.id
+                    action = rng.choice(list(MoveType))
+                    reward, done = writer.record_step(env, action)
+                    expected.append((field, piece, action.value, reward,
+                                     done))
+                    if done:
+                        env.reset(rng.getrandbits(32))
+            reader = DatasetReader(directory)
+            self.assertEqual(len(reader), 2500)
+            self.assertEqual([len(shard) for shard in reader.shards],
+                             [1000, 1000, 500])
+            for i in [0, 999, 1000, 2499]:
+                field, piece, action, reward, done = expected[i]
+                record = reader[i]
+                npt.assert_array_equal(reader.unpack_fields(record), field)
+                self.assertEqual(
+                    (record['piece'], record['action'], record['reward'],
+                     record['done']), (piece, action, reward, done))
+            self.assertTrue(any(step[4] for step in expected))
+
+            view = reader[1000:1100]
+            self.assertFalse(view.flags.owndata)
+            self.assertEqual(len(view), 100)
+            with self.assertRaises(IndexError):
+                reader[900:1100]
+
+            batch = reader.sample(256, np.random.default_rng(0))
+            self.assertEqual(batch.shape, (256,))
+            self.assertEqual(reader.unpack_fields(batch).shape,
+                             (256, env.height, env.width))
+            npt.assert_array_equal(
+                batch, reader.sample(256, np.random.default_rng(0)))
+            indices = np.random.default_rng(0).integers(0, 2500, 256)
+            npt.assert_array_equal(batch, np.array(
+                [reader[i] for i in indices], dtype=reader.dtype))
+            del view, record, batch, reader
+
+
+if __name__ == '__main__':
+    unittest.main()
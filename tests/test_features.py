@@ -0,0 +1,77 @@
+import random
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+
+from tetris.core.board import Board, MoveType
+from tetris.core.features import IncrementalFeatures, extract_features
+from tetris.core.tetrimino_factory import TetriminoFactory
+
+
+def naive_features(field):
+    height, width = field.shape
+    heights = []
+    holes = []
+    for col in range(width):
+        column = [field[row, col] != 0 for row in range(height)]
+        top = column.index(True) if True in column else height
+        heights.append(height - top)
+        holes.append(sum(not cell for cell in column[top:]))
+    transitions = 0
+    for row in range(height):
+        cells = [True] + [field[row, col] != 0 for col in range(width)] \
+            + [True]
+        transitions += sum(a != b for a, b in zip(cells, cells[1:]))
+    padded = [height] + heights + [height]
+    wells = [max(min(padded[i], padded[i + 2]) - padded[i + 1], 0)
+             for i in range(width)]
+    bumps = sum(abs(a - b) for a, b in zip(heights, heights[1:]))
+    return heights, holes, bumps, transitions, wells
+
+
+class TestFeatures(unittest.TestCase):
+    def assert_features(self, features, field):
+        heights, holes, bumps, transitions, wells = naive_features(field)
+        npt.assert_array_equal(features.heights, heights)
+        npt.assert_array_equal(features.holes, holes)
+        self.assertEqual(features.bumpiness, bumps)
+        self.assertEqual(features.row_transitions, transitions)
+        npt.assert_array_equal(features.well_depths, wells)
+
+    def test_extract_features(self):
+        """Test if single and batched features match a naive count."""
+        rng = np.random.default_rng(1234)
+        fields = rng.integers(0, 8, size=(8, 20, 10), dtype=np.uint8)
+        fields *= rng.random((8, 20, 10)) < np.linspace(0, 1, 20)[:, None]
+        fields[0] = 0
+        batched = extract_features(fields)
+        for i, field in enumerate(fields):
+            self.assert_features(extract_features(field), field)
+            npt.assert_array_equal(batched.heights[i],
+                                   extract_features(field).heights)
+            self.assertEqual(batched.row_transitions[i],
+                             extract_features(field).row_transitions)
+
+    def test_incremental_features(self):
+        """Test if incremental updates match a full extraction."""
+        rng = random.Random(1234)
+        tetrimino_factory = TetriminoFactory(1234)
+        moves = [MoveType.LEFT, MoveType.RIGHT, MoveType.ROTATE_CW]
+        board = Board()
+        features = IncrementalFeatures(board)
+        for _ in range(200):
+            if not board.create_new_tetrimino(
+                    *tetrimino_factory.generate_random()):
+                break
+            for _ in range(rng.randrange(6)):
+                board.move_tetrimino(rng.choice(moves))
+            board.move_tetrimino(MoveType.DROP)
+            tetrimino = board.active_tetrimino
+            features.update(tetrimino, board.update_play_field())
+            self.assert_features(features.get_features(),
+                                 board.get_play_field())
+
+
+if __name__ == '__main__':
+    unittest.main()
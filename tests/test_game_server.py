@@ -0,0 +1,131 @@
+import asyncio
+import json
+import unittest
+
+import numpy as np
+
+from tetris.scenes.game_server import GameServer
+
+
+class FakeTransport:
+    def __init__(self):
+        self.buffer_size = 0
+
+    def get_write_buffer_size(self) -> int:
+        return self.buffer_size
+
+
+class FakeWriter:
+    def __init__(self):
+        self.transport = FakeTransport()
+        self.data = b''
+        self.is_closed = False
+
+    def write(self, data: bytes):
+        self.data += data
+
+    def is_closing(self) -> bool:
+        return self.is_closed
+
+    def close(self):
+        self.is_closed = True
+
+    def messages(self) -> list[dict]:
+        return [json.loads(line) for line in self.data.splitlines()]
+
+
+class TestGameServer(unittest.TestCase):
+    def test_deltas_rebuild_state(self):
+        """Test if applying deltas gives the state of the session."""
+        server = GameServer(gravity_interval=0.05)
+        writer = FakeWriter()
+        session = server.add_session(writer, seed=1234)
+        board = active = score = None
+        for i in range(1000):
+            if i % 7 == 0:
+                session.inputs.append(ord('x' if i % 2 else 'a'))
+            server.tick()
+            for message in writer.messages():
+                if message['type'] == 'full':
+                    board = np.array(message['board'])
+                    active = message['active']
+                    score = message['score']
+                for row, cells in message.get('rows', {}).items():
+                    board[int(row)] = cells
+                active = message.get('active', active)
+                score = message.get('score', score)
+            writer.data = b''
+            if session.session_id not in server.sessions:
+                break
+            np.testing.assert_array_equal(
+                board, session.controller.board.get_field_view())
+            self.assertEqual(active, session._active_cells())
+            self.assertEqual(score, session.controller.player_status.score)
+        self.assertTrue(writer.is_closed)
+        self.assertTrue(message.get('game_over'))
+        self.assertEqual(server.stats()['finished'], 1)
+        self.assertEqual(server.stats()['tick_latency']['count'], i + 1)
+        self.assertGreater(server.stats()['sessions_per_core'], 0)
+
+    def test_game_over_when_congested(self):
+        """Test if a congested client still gets the final state."""
+        server = GameServer(max_write_buffer=0)
+        writer = FakeWriter()
+        session = server.add_session(writer, seed=1234)
+        writer.data = b''
+        writer.transport.buffer_size = 1
+        for _ in range(100):
+            session.inputs.append(ord('x'))
+            server.tick()
+            if session.session_id not in server.sessions:
+                break
+        messages = writer.messages()
+        self.assertEqual(len(messages), 1)
+        self.assertTrue(messages[0]['game_over'])
+        self.assertIn('rows', messages[0])
+        self.assertTrue(writer.is_closed)
+        self.assertEqual(server.stats()['finished'], 1)
+        self.assertEqual(server.stats()['evicted'], 0)
+
+    def test_idle_eviction(self):
+        """Test if sessions without input are evicted."""
+        server = GameServer(idle_timeout=0.0)
+        server.add_session(seed=1)
+        server.add_session(seed=2)
+        server.tick()
+        self.assertEqual(len(server.sessions), 0)
+        self.assertEqual(server.stats()['evicted'], 2)
+
+    def test_tcp_session(self):
+        """Test if a client gets the full state and deltas over TCP."""
+        async def play():
+            server = GameServer(tick_rate=200)
+            await server.start()
+            reader, writer = await asyncio.open_connection('127.0.0.1',
+                                                           server.port)
+            full = json.loads(await reader.readline())
+            writer.write(b'x\n')
+            await writer.drain()
+            delta = {}
+            while 'rows' not in delta:
+                delta = json.loads(await asyncio.wait_for(reader.readline(),
+                                                          1.0))
+            writer.write(b'q\n')
+            await writer.drain()
+            self.assertEqual(await asyncio.wait_for(reader.read(), 1.0), b'')
+            writer.close()
+            stats = server.stats()
+            await server.close()
+            return full, delta, stats
+
+        full, delta, stats = asyncio.run(play())
+        self.assertEqual(full['type'], 'full')
+        self.assertEqual(len(full['board']), full['height'])
+        self.assertEqual(delta['type'], 'delta')
+        self.assertEqual(sum(np.count_nonzero(row)
+                             for row in delta['rows'].values()), 4)
+        self.assertEqual(stats['sessions'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
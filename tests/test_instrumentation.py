@@ -0,0 +1,91 @@
+import json
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from tetris.core.board import Board, MoveType
+from tetris.core.instrumentation import (InMemorySink, Instrumentation,
+                                         JsonLinesSink, LatencyHistogram,
+                                         PrometheusTextSink)
+from tetris.core.tetrimino_type import TetriminoType
+from tetris.scenes.tetris_cli_controller import TetrisCli
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_board_counters(self):
+        """Test if moves, rejections and locks are counted."""
+        instrumentation = Instrumentation()
+        board = Board()
+        board.instrumentation = instrumentation
+        board.create_new_tetrimino(TetriminoType.I, 1)
+        for _ in range(8):
+            board.move_tetrimino(MoveType.LEFT)
+        board.move_tetrimino(MoveType.DROP)
+        board.update_play_field()
+        self.assertEqual(
+            instrumentation.get_count('tetris_moves_total', move='LEFT'), 8)
+        self.assertEqual(
+            instrumentation.get_count('tetris_moves_rejected_total',
+                                      move='LEFT'), 3)
+        self.assertEqual(
+            instrumentation.get_count('tetris_moves_rejected_total',
+                                      move='DROP'), 0)
+        self.assertEqual(instrumentation.get_count('tetris_locks_total'), 1)
+        self.assertEqual(
+            instrumentation.get_count('tetris_line_clears_total', lines='0'),
+            1)
+        histogram = instrumentation.get_histogram('tetris_move_seconds',
+                                                  move='LEFT')
+        self.assertEqual(histogram.count, 8)
+        self.assertEqual(sum(histogram.counts), 8)
+
+    def test_cli_game(self):
+        """Test if a CLI game reports steps and game over."""
+        sink = InMemorySink()
+        instrumentation = Instrumentation(sinks=[sink])
+        controller = TetrisCli(seed=1234, instrumentation=instrumentation)
+        controller.create_new_tetrimino()
+        while not controller.is_game_over():
+            controller.drop()
+            controller.step()
+        instrumentation.flush()
+        self.assertEqual(
+            instrumentation.get_count('tetris_games_over_total'), 1)
+        names = {h['name'] for h in sink.snapshots[0]['histograms']}
+        self.assertEqual(names, {'tetris_move_seconds', 'tetris_lock_seconds',
+                                 'tetris_step_seconds'})
+
+    def test_histogram_buckets(self):
+        """Test if values fall into the first bucket they fit in."""
+        histogram = LatencyHistogram(buckets=(1.0, 2.0))
+        for value in [0.5, 1.0, 1.5, 3.0]:
+            histogram.observe(value)
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual(histogram.sum, 6.0)
+
+    def test_file_sinks(self):
+        """Test JSON lines and Prometheus text outputs."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_path = Path(tmp_dir) / 'metrics.jsonl'
+            prom_path = Path(tmp_dir) / 'metrics.prom'
+            sinks = [JsonLinesSink(json_path), PrometheusTextSink(prom_path)]
+            instrumentation = Instrumentation(sinks=sinks, buckets=(1.0,))
+            instrumentation.count('tetris_moves_total', move='DOWN')
+            instrumentation.observe('tetris_lock_seconds', 0.5)
+            instrumentation.flush()
+            instrumentation.flush()
+
+            lines = json_path.read_text().splitlines()
+            self.assertEqual(len(lines), 2)
+            self.assertEqual(json.loads(lines[0])['counters'][0]['value'], 1)
+            text = prom_path.read_text()
+            self.assertIn('# TYPE tetris_moves_total counter', text)
+            self.assertIn('tetris_moves_total{move="DOWN"} 1', text)
+            self.assertIn('tetris_lock_seconds_bucket{le="1.0"} 1', text)
+            self.assertIn('tetris_lock_seconds_bucket{le="+Inf"} 1', text)
+            self.assertIn('tetris_lock_seconds_count 1', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import io
+import random
+import unittest
+
+import numpy as np
+
+from tetris.core.board import GARBAGE_ID
+from tetris.core.replay import (MOVE, ReplayReader, ReplayRecorder,
+                                pack_cells, read_varint, unpack_cells,
+                                write_varint)
+from tetris.scenes.tetris_cli_controller import TetrisCli
+
+
+class TestReplay(unittest.TestCase):
+    def _record_game(self, seed: int, keyframe_interval: int
+                     ) -> tuple[bytes, list]:
+        # Returns the replay and the field after each event
+        rng = random.Random(seed)
+        stream = io.BytesIO()
+        recorder = ReplayRecorder(stream, keyframe_interval)
+        controller = TetrisCli(seed=seed, recorder=recorder)
+        states = [(controller.board.get_play_field(), 0)]
+        controller.create_new_tetrimino()
+        inputs = [controller.move_left, controller.move_right,
+                  controller.rotate_cw, controller.rotate_ccw,
+                  controller.move_down, controller.drop]
+        while not controller.is_game_over():
+            n_events = recorder.n_events
+            rng.choice(inputs)()
+            controller.step()
+            # Sample the state after the last event of this input
+            while len(states) <= recorder.n_events:
+                states.append(None)
+            states[recorder.n_events] = (controller.board.get_play_field(),
+                                         controller.player_status.score)
+            self.assertGreater(recorder.n_events, n_events)
+        recorder.close()
+        return stream.getvalue(), states
+
+    def test_varint(self):
+        """Test varint round trip."""
+        stream = io.BytesIO()
+        values = [0, 1, 127, 128, 300, 2 ** 40]
+        for value in values:
+            write_varint(stream, value)
+        stream.seek(0)
+        self.assertEqual([read_varint(stream) for _ in values], values)
+        self.assertEqual(len(stream.getvalue()), 1 + 1 + 1 + 2 + 2 + 6)
+
+    def test_pack_cells(self):
+        """Test 3-bit cell packing round trip."""
+        cells = np.random.default_rng(0).integers(0, 8, 230).astype(np.uint8)
+        data = pack_cells(cells, 3)
+        self.assertEqual(len(data), 87)
+        np.testing.assert_array_equal(unpack_cells(data, 230, 3), cells)
+
+    def test_pack_garbage_cells(self):
+        """Test if wall and garbage ids survive the packing round trip."""
+        cells = np.random.default_rng(0).integers(
+            0, GARBAGE_ID + 1, 230).astype(np.uint8)
+        data = pack_cells(cells)
+        self.assertEqual(len(data), 115)
+        np.testing.assert_array_equal(unpack_cells(data, 230), cells)
+        with self.assertRaises(ValueError):
+            pack_cells(cells, 3)
+
+    def test_seek(self):
+        """Test if seeking restores the recorded state."""
+        data, states = self._record_game(1234, keyframe_interval=16)
+        reader = ReplayReader(io.BytesIO(data))
+        self.assertEqual(reader.header.width, 10)
+        self.assertEqual(reader.header.seed, 1234)
+        n_events = len(states) - 1
+        for event_index in [0, 1, 15, 16, 17, n_events // 2, n_events]:
+            if states[event_index] is None:
+                continue
+            field, score = states[event_index]
+            state = reader.seek(event_index)
+            self.assertEqual(state.event_index, event_index)
+            np.testing.assert_array_equal(state.board.get_play_field(),
+                                          field)
+            self.assertEqual(state.player_status.score, score)
+        with self.assertRaises(IndexError):
+            reader.seek(n_events + 1)
+
+    def test_stream_events(self):
+        """Test if events stream in order and one byte each."""
+        data, states = self._record_game(42, keyframe_interval=1000)
+        reader = ReplayReader(io.BytesIO(data))
+        events = list(reader.events())
+        self.assertEqual(len(events), len(states) - 1)
+        n_moves = sum(event.kind == MOVE for event in events)
+        self.assertGreater(n_moves, 0)
+        self.assertLess(len(data), len(events) + 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+from tetris.simulation.runner import (StatsAccumulator, episode_seeds,
+                                      evaluate, run_episode)
+
+
+class TestRunner(unittest.TestCase):
+    def test_same_aggregates_for_any_worker_count(self):
+        """Test if aggregates do not depend on workers and chunks."""
+        seeds = episode_seeds(1234, 40)
+        result0 = evaluate(seeds, n_workers=1, chunk_size=40)
+        result1 = evaluate(seeds, n_workers=2, chunk_size=3)
+        self.assertEqual(result0, result1)
+        self.assertEqual(result0.n_episodes, 40)
+        self.assertEqual(result0.steps.count, 40)
+
+    def test_run_episode_reproducible(self):
+        """Test if an episode only depends on its seed."""
+        self.assertEqual(run_episode(42), run_episode(42))
+
+    def test_stats_accumulator(self):
+        """Test summary statistics of the accumulator."""
+        acc = StatsAccumulator()
+        for value in [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]:
+            acc.add(value)
+        summary = acc.summary()
+        self.assertEqual(summary.mean, 5.5)
+        self.assertAlmostEqual(summary.std, 3.0276503540974917)
+        self.assertLess(summary.ci_low, 5.5)
+        self.assertGreater(summary.ci_high, 5.5)
+        self.assertEqual(summary.percentiles[50], 5)
+        self.assertEqual(summary.percentiles[95], 10)
+        self.assertEqual((summary.min, summary.max), (1, 10))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import asyncio
+import unittest
+
+from tetris.scenes.base_scene import BaseScene
+from tetris.scenes.scene_runner import SceneRunner
+from tetris.scenes.tetris_cli_controller import TetrisCli
+from tetris.scenes.tetris_scene import TetrisScene
+
+
+class CountingScene(BaseScene):
+    def __init__(self):
+        self.game_time = 0.0
+        self.keys = []
+
+    def update(self, dt: float):
+        self.game_time += dt
+
+    def render(self) -> float:
+        return self.game_time
+
+    def handle_input(self, key: int):
+        self.keys.append(key)
+
+
+class FakeClock:
+    """Time that only advances in `sleep`, by `stall` more on request."""
+    def __init__(self):
+        self.now = 0.0
+        self.stall = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float):
+        self.now += delay + self.stall
+        self.stall = 0.0
+        await asyncio.sleep(0)
+
+
+class TestSceneRunner(unittest.TestCase):
+    def test_fixed_timestep(self):
+        """Test if game time follows the clock at a capped frame rate."""
+        scene = CountingScene()
+        frames = []
+        clock = FakeClock()
+        runner = SceneRunner(scene, tick_rate=64, max_fps=16,
+                             on_frame=frames.append, clock=clock,
+                             sleep=clock.sleep)
+
+        async def play():
+            task = asyncio.create_task(runner.run(duration=0.5))
+            runner.post_input(1)
+            runner.post_input(2)
+            await task
+
+        asyncio.run(play())
+        self.assertEqual(scene.keys, [1, 2])
+        # One tick per wakeup until the clock reaches 0.5 s
+        self.assertEqual(runner.n_ticks, 31)
+        self.assertEqual(runner.n_dropped_ticks, 0)
+        self.assertEqual(scene.game_time, 31 / 64)
+        # Every 4 ticks, plus the first and last frames
+        self.assertEqual(runner.n_frames, 9)
+        self.assertEqual(frames[1:-1], [i / 16 for i in range(1, 8)])
+        stats = runner.stats()
+        self.assertEqual(stats['frame_jitter']['count'], 7)
+        self.assertEqual(stats['wakeup_jitter']['count'], 32)
+
+    def test_catch_up(self):
+        """Test if a stall runs at most max_catch_up ticks at once."""
+        scene = CountingScene()
+        clock = FakeClock()
+        runner = SceneRunner(scene, tick_rate=64, max_fps=16,
+                             max_catch_up=5, clock=clock, sleep=clock.sleep)
+        clock.stall = 10 / 64
+        asyncio.run(runner.run(duration=0.5))
+        # The stall is 11 ticks late: 5 run and 6 are dropped
+        self.assertEqual(runner.n_dropped_ticks, 6)
+        self.assertEqual(runner.n_ticks + runner.n_dropped_ticks, 31)
+        self.assertEqual(scene.game_time, runner.n_ticks / 64)
+
+    def test_tetris_scene(self):
+        """Test if the Tetris scene applies gravity and inputs."""
+        scene = TetrisScene(TetrisCli(seed=1234), gravity_interval=0.1)
+        pos_y = scene.controller.board.active_tetrimino.pos_y
+        scene.update(0.25)
+        self.assertEqual(scene.controller.board.active_tetrimino.pos_y,
+                         pos_y + 2)
+        scene.handle_input(ord('x'))
+        self.assertGreater(scene.controller.board.field_version, 0)
+        while not scene.is_finished():
+            scene.handle_input(ord('x'))
+        self.assertFalse(scene.render()['active'].any())
+
+
+if __name__ == '__main__':
+    unittest.main()
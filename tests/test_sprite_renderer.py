@@ -0,0 +1,156 @@
+import gc
+import importlib.util
+import unittest
+import weakref
+
+import numpy as np
+import numpy.testing as npt
+
+from tetris.core.board import WALL_ID, Board, MoveType
+from tetris.core.tetrimino_factory import TetriminoFactory
+from tetris.core.vector_board import VectorBoard
+from tetris.scenes.sprite_renderer import (FALLBACK_ID, N_IDS,
+                                           SpriteRenderer,
+                                           build_sprite_atlas,
+                                           load_sprite_atlas)
+
+
+def make_atlas(tile_height=3, tile_width=2):
+    rng = np.random.default_rng(1234)
+    tiles = {i: rng.integers(0, 256, (tile_height, tile_width, 3),
+                             dtype=np.uint8)
+             for i in range(1, WALL_ID)}
+    return build_sprite_atlas(tiles)
+
+
+def naive_frame(atlas, field, active):
+    _, tile_height, tile_width, _ = atlas.shape
+    frame = np.zeros((field.shape[0] * tile_height,
+                      field.shape[1] * tile_width, 3), dtype=np.uint8)
+    for y in range(field.shape[0]):
+        for x in range(field.shape[1]):
+            cell = active[y, x] if active[y, x] else field[y, x]
+            frame[y * tile_height:(y + 1) * tile_height,
+                  x * tile_width:(x + 1) * tile_width] = atlas[cell]
+    return frame
+
+
+def play(board, n_pieces, seed=1234):
+    tetrimino_factory = TetriminoFactory(seed)
+    for _ in range(n_pieces):
+        board.create_new_tetrimino(*tetrimino_factory.generate_random())
+        board.move_tetrimino(MoveType.DROP)
+        board.update_play_field()
+    board.create_new_tetrimino(*tetrimino_factory.generate_random())
+    for _ in range(3):
+        board.move_tetrimino(MoveType.DOWN)
+
+
+class TestSpriteRenderer(unittest.TestCase):
+    def test_build_sprite_atlas(self):
+        """Test if transparent pixels are blended over the background."""
+        tile = np.zeros((2, 2, 4), dtype=np.uint8)
+        tile[..., 0] = 200
+        tile[0, :, 3] = 255
+        tile[1, :, 3] = 0
+        atlas = build_sprite_atlas({1: tile}, background=(10, 20, 30))
+        self.assertEqual(atlas.shape, (N_IDS + 1, 2, 2, 3))
+        npt.assert_array_equal(atlas[1, 0], [[200, 0, 0]] * 2)
+        npt.assert_array_equal(atlas[1, 1], [[10, 20, 30]] * 2)
+        npt.assert_array_equal(atlas[0], np.full((2, 2, 3), [10, 20, 30]))
+        self.assertFalse(atlas.flags.writeable)
+        with self.assertRaises(ValueError):
+            build_sprite_atlas({1: tile, 2: np.zeros((3, 2, 3))})
+
+    def test_compose(self):
+        """Test if the composed frame matches a tile by tile paste."""
+        atlas = make_atlas()
+        renderer = SpriteRenderer(atlas)
+        board = Board()
+        play(board, 8)
+        field = board.get_play_field()
+        active = board.get_active_field()
+        frame = renderer.compose(field, active)
+        self.assertEqual(frame.shape, (board.height * 3, board.width * 2, 3))
+        npt.assert_array_equal(frame, naive_frame(atlas, field, active))
+        npt.assert_array_equal(renderer.compose(field),
+                               naive_frame(atlas, field,
+                                           np.zeros_like(field)))
+
+    def test_reuse_buffer(self):
+        """Test if frames are written to the same buffer."""
+        renderer = SpriteRenderer(make_atlas())
+        board = Board()
+        frame = renderer.render(board)
+        play(board, 5)
+        self.assertIs(renderer.render(board), frame)
+        self.assertTrue(frame.any())
+        expected = frame.copy()
+        frame[:] = 0
+        # Unchanged board: the frame is not composed again
+        renderer.render(board)
+        self.assertFalse(frame.any())
+        renderer.invalidate()
+        npt.assert_array_equal(renderer.render(board), expected)
+
+    def test_fallback_tile(self):
+        """Test if ids without a tile are drawn with the fallback tile."""
+        atlas = make_atlas()
+        renderer = SpriteRenderer(atlas)
+        field = np.array([[0, N_IDS], [255, 1]], dtype=np.uint8)
+        frame = renderer.compose(field)
+        npt.assert_array_equal(frame[:3, 2:], atlas[FALLBACK_ID])
+        npt.assert_array_equal(frame[3:, :2], atlas[FALLBACK_ID])
+        npt.assert_array_equal(frame[3:, 2:], atlas[1])
+
+    def test_new_board(self):
+        """Test if a new board with the same versions is composed."""
+        atlas = make_atlas()
+        renderer = SpriteRenderer(atlas)
+        board = Board()
+        play(board, 2)
+        renderer.render(board)
+        versions = (board.field_version, board.active_version)
+        board_ref = weakref.ref(board)
+        del board
+        gc.collect()
+        # The renderer does not keep the board alive
+        self.assertIsNone(board_ref())
+        # Possibly at the address of the freed board
+        board = Board()
+        play(board, 6)
+        # Read once so the pose of the active Tetrimino is seen
+        board.get_active_view()
+        board.field_version, board.active_version = versions
+        npt.assert_array_equal(renderer.render(board), naive_frame(
+            atlas, board.get_field_view(), board.get_active_view()))
+
+    def test_batch(self):
+        """Test if a batch of fields is composed like single fields."""
+        atlas = make_atlas()
+        renderer = SpriteRenderer(atlas)
+        vector_board = VectorBoard(4)
+        tetrimino_factory = TetriminoFactory(1234)
+        for _ in range(8):
+            type_ids, rots = tetrimino_factory.generate_bulk(4)
+            vector_board.create_new_tetrimino(type_ids, rots)
+            vector_board.step(np.full(4, MoveType.DROP.value))
+        fields = vector_board.get_play_field()
+        frames = renderer.compose(fields)
+        self.assertEqual(frames.shape[0], 4)
+        for field, frame in zip(fields, frames):
+            npt.assert_array_equal(frame, naive_frame(
+                atlas, field, np.zeros_like(field)))
+
+    @unittest.skipIf(importlib.util.find_spec('cv2') is None,
+                     'OpenCV is not installed.')
+    def test_load_sprite_atlas(self):
+        """Test if the bundled tiles are loaded once."""
+        atlas = load_sprite_atlas()
+        self.assertIs(load_sprite_atlas(), atlas)
+        self.assertEqual(atlas.shape, (N_IDS + 1, 60, 60, 3))
+        self.assertTrue((atlas[1:WALL_ID] != atlas[0]).any())
+
+
+if __name__ == '__main__':
+    unittest.main()
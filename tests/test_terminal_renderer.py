@@ -0,0 +1,86 @@
+import io
+import unittest
+
+import numpy as np
+
+from tetris.core.board import MoveType
+from tetris.scenes.terminal_renderer import TerminalRenderer
+from tetris.scenes.tetris_cli_controller import TetrisCli
+
+
+def naive_frame(data):
+    lines = []
+    for y in range(data['board'].shape[0]):
+        line = ''
+        for x in range(data['board'].shape[1]):
+            if data['board'][y, x] != 0:
+                line += '#'
+            elif data['active'][y, x] != 0:
+                line += 'o'
+            else:
+                line += '.'
+        lines.append(line)
+    return lines
+
+
+class TestTerminalRenderer(unittest.TestCase):
+    def test_build_frame(self):
+        """Test if the vectorized frame matches a cell by cell render."""
+        controller = TetrisCli(seed=1234)
+        controller.create_new_tetrimino()
+        renderer = TerminalRenderer(io.StringIO())
+        for _ in range(5):
+            for _ in range(10):
+                controller.move_down()
+            data = controller.render_data()
+            self.assertEqual(renderer.build_frame(data['board'],
+                                                  data['active']),
+                             naive_frame(data))
+            controller.drop()
+
+    def test_wide_glyphs(self):
+        """Test if glyphs longer than one character are joined per row."""
+        renderer = TerminalRenderer(io.StringIO(), empty='  ', block='[]',
+                                    active='()')
+        board = np.zeros((2, 3), dtype=np.uint8)
+        active = np.zeros((2, 3), dtype=np.uint8)
+        board[1, 0] = 3
+        active[0, 2] = 5
+        self.assertEqual(renderer.build_frame(board, active),
+                         ['    ()', '[]    '])
+        with self.assertRaises(ValueError):
+            TerminalRenderer(io.StringIO(), block='[]')
+
+    def test_byte_order(self):
+        """Test if rows are joined whatever the byte order of the glyphs."""
+        board = np.array([[0, 3], [8, 0]], dtype=np.uint8)
+        active = np.array([[1, 0], [0, 0]], dtype=np.uint8)
+        for byte_order in '<>':
+            renderer = TerminalRenderer(io.StringIO(), empty='  ',
+                                        block='[]', active='()')
+            renderer.lut = renderer.lut.astype(byte_order + 'U2')
+            self.assertEqual(renderer.build_frame(board, active),
+                             ['()[]', '[]  '])
+
+    def test_diff_only(self):
+        """Test if only changed rows are sent to the terminal."""
+        stream = io.StringIO()
+        controller = TetrisCli(seed=1234)
+        controller.create_new_tetrimino()
+        for _ in range(5):
+            controller.board.move_tetrimino(MoveType.DOWN)
+        renderer = TerminalRenderer(stream)
+        n_rows = controller.board.height + 2
+        self.assertEqual(renderer.render(controller.render_data()), n_rows)
+        self.assertIn('\x1b[2J', stream.getvalue())
+        self.assertEqual(renderer.render(controller.render_data()), 0)
+        controller.board.move_tetrimino(MoveType.LEFT)
+        n_written = renderer.render(controller.render_data())
+        self.assertGreater(n_written, 0)
+        self.assertLessEqual(n_written, 4)
+        renderer.invalidate()
+        self.assertEqual(renderer.render(controller.render_data()), n_rows)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -48,6 +48,54 @@ class TestTetriminoFactory(unittest.TestCase):
             tgt, rot = tetrimino_factory.generate_fixed(name, rot)            
             npt.assert_array_equal(tgt, ref)
 
+    def test_independent_factories(self):
+        """Test if interleaved factories keep their own sequences."""
+        seed = 1234
+        reference = TetriminoFactory(seed)
+        expected = [reference.generate_random() for _ in range(100)]
+        tetrimino_factory0 = TetriminoFactory(seed)
+        tetrimino_factory1 = TetriminoFactory(seed + 1)
+        tetriminos0 = []
+        for _ in range(100):
+            tetriminos0.append(tetrimino_factory0.generate_random())
+            tetrimino_factory1.generate_random()
+        self.assertEqual(tetriminos0, expected)
+
+    def test_bulk_and_peek(self):
+        """Test if bulk generation and peek follow the same sequence."""
+        tetrimino_factory0 = TetriminoFactory(1234, buffer_size=16)
+        tetrimino_factory1 = TetriminoFactory(1234, buffer_size=16)
+        peeked = tetrimino_factory0.peek(40)
+        self.assertEqual(tetrimino_factory0.peek(40), peeked)
+        type_ids, rots = tetrimino_factory1.generate_bulk(40)
+        expected = [tetrimino_factory0.generate_random() for _ in range(40)]
+        self.assertEqual(peeked, expected)
+        self.assertEqual(list(zip(type_ids.tolist(), rots.tolist())),
+                         [(t.id, rot) for t, rot in expected])
+        self.assertEqual(tetrimino_factory0.generate_random(),
+                         tetrimino_factory1.generate_random())
+
+    def test_buffer_size(self):
+        """Test if the sequence of a seed does not depend on buffer_size."""
+        for bag in [False, True]:
+            sequences = []
+            for buffer_size in [1, 100, 1024, 5000]:
+                tetrimino_factory = TetriminoFactory(1234, bag=bag,
+                                                     buffer_size=buffer_size)
+                sequences.append([tetrimino_factory.generate_random()
+                                  for _ in range(3000)])
+            for sequence in sequences[1:]:
+                self.assertEqual(sequence, sequences[0])
+
+    def test_bag(self):
+        """Test if every bag holds each Tetrimino once."""
+        tetrimino_factory = TetriminoFactory(1234, bag=True, buffer_size=10)
+        names = [tetrimino_factory.generate_random()[0].name
+                 for _ in range(70)]
+        for i in range(0, 70, 7):
+            self.assertEqual(sorted(names[i:i + 7]),
+                             sorted(tetrimino_factory.tetrimino_choices))
+
 
 if __name__ == '__main__':
     unittest.main()
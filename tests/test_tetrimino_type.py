@@ -45,6 +45,33 @@ class TestTetriminoType(unittest.TestCase):
                 self.assertEqual(shape.shape[0], shape.shape[1])
                 self.assertEqual(shape.shape[0], t.size)
 
+    def test_shape_is_read_only(self):
+        """Test if shared shapes can not be modified."""
+        for t in TetriminoType:
+            for rot in range(len(t.shapes)):
+                self.assertEqual(t.shape(rot).dtype, np.uint8)
+                self.assertFalse(t.shape(rot).flags.writeable)
+                self.assertIs(t.shape(rot), t.shape(rot))
+
+    def test_shape_info_matches_shape(self):
+        """Test if precomputed tables describe the shape matrix."""
+        for t in TetriminoType:
+            for rot, shape in enumerate(t.shapes):
+                info = t.shape_info(rot)
+                self.assertIs(info.shape, shape)
+                self.assertEqual(sorted(info.cells),
+                                 [tuple(c) for c in np.argwhere(shape)])
+                rows, cols = np.nonzero(shape)
+                self.assertEqual(info.bbox, (cols.min(), rows.min(),
+                                             cols.max(), rows.max()))
+                for col in range(t.size):
+                    filled = np.nonzero(shape[:, col])[0]
+                    expected = filled.max() if len(filled) > 0 else -1
+                    self.assertEqual(info.bottom_depths[col], expected)
+                for row, mask in info.row_masks:
+                    bits = [(mask >> col) & 1 for col in range(t.size)]
+                    self.assertEqual(bits, (shape[row] > 0).tolist())
+
     def test_get_rot(self):
         target_shape = np.array([[0, 0, 0],
                                  [3, 3, 3],
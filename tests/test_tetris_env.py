@@ -0,0 +1,93 @@
+import random
+import unittest
+
+import numpy as np
+
+from tetris.core.board import MoveType
+from tetris.scenes.tetris_cli_controller import TetrisCli
+from tetris.scenes.tetris_env import TetrisEnv
+
+
+class TestTetrisEnv(unittest.TestCase):
+    def _play(self, seed: int) -> tuple[list[int], dict]:
+        rng = random.Random(seed)
+        env = TetrisEnv()
+        env.reset(seed)
+        rewards = []
+        done = False
+        while not done:
+            reward, done = env.step(rng.choice(list(MoveType)))
+            rewards.append(reward)
+        return rewards, env.observe()
+
+    def test_same_seed(self):
+        """Test if episodes are reproducible with the same seed."""
+        rewards0, obs0 = self._play(1234)
+        rewards1, obs1 = self._play(1234)
+        self.assertEqual(rewards0, rewards1)
+        np.testing.assert_array_equal(obs0['board'], obs1['board'])
+        self.assertEqual(obs0['score'], obs1['score'])
+
+    def test_same_game_as_cli(self):
+        """Test if the env plays by the rules of TetrisCli."""
+        rng = random.Random(1234)
+        env = TetrisEnv()
+        env.reset(1234)
+        controller = TetrisCli(seed=1234)
+        controller.create_new_tetrimino()
+        inputs = {
+            MoveType.NO_MOVE: lambda: None,
+            MoveType.LEFT: controller.move_left,
+            MoveType.RIGHT: controller.move_right,
+            MoveType.ROTATE_CW: controller.rotate_cw,
+            MoveType.ROTATE_CCW: controller.rotate_ccw,
+        }
+        done = False
+        while not done:
+            action = rng.choice(list(MoveType))
+            _, done = env.step(action)
+            if action == MoveType.DROP:
+                controller.drop()
+            elif action == MoveType.DOWN:
+                controller.board.move_tetrimino(MoveType.DOWN)
+                controller.step()
+            else:
+                inputs[action]()
+                controller.step()
+            np.testing.assert_array_equal(env.board.get_play_field(),
+                                          controller.board.get_play_field())
+            self.assertEqual(env.player_status.score,
+                             controller.player_status.score)
+        self.assertTrue(controller.is_game_over())
+
+    def test_action_mask(self):
+        """Test if the mask agrees with the moves accepted by the board."""
+        env = TetrisEnv()
+        env.reset(1234)
+        for _ in range(20):
+            mask = env.action_mask()
+            self.assertTrue(mask[MoveType.NO_MOVE.value])
+            self.assertTrue(mask[MoveType.DROP.value])
+            for move in [MoveType.LEFT, MoveType.RIGHT, MoveType.ROTATE_CW,
+                         MoveType.ROTATE_CCW]:
+                board = env.board
+                tetrimino = board.active_tetrimino
+                self.assertEqual(board.move_tetrimino(move),
+                                 mask[move.value])
+                board.active_tetrimino = tetrimino
+            env.step(MoveType.LEFT)
+
+    def test_step_after_game_over(self):
+        """Test if stepping a finished game is rejected."""
+        env = TetrisEnv()
+        env.reset(1234)
+        done = False
+        while not done:
+            _, done = env.step(MoveType.DROP)
+        self.assertFalse(env.action_mask().any())
+        with self.assertRaises(RuntimeError):
+            env.step(MoveType.NO_MOVE)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+from tetris.core.transposition_table import (ReplacementPolicy,
+                                             TranspositionTable)
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def test_lru(self):
+        """Test if the least recently used entry is evicted."""
+        table = TranspositionTable(2)
+        table.put(1, 'a')
+        table.put(2, 'b')
+        self.assertEqual(table.get(1), 'a')
+        table.put(3, 'c')
+        self.assertIsNone(table.get(2))
+        self.assertEqual(table.get(1), 'a')
+        self.assertEqual(table.get(3), 'c')
+        self.assertEqual(len(table), 2)
+        self.assertAlmostEqual(table.hit_rate, 0.75)
+
+    def test_depth_preferred(self):
+        """Test if shallow entries do not replace deeper ones."""
+        table = TranspositionTable(4, ReplacementPolicy.DEPTH)
+        table.put(1, 'deep', depth=3)
+        table.put(5, 'shallow', depth=1)
+        self.assertEqual(table.get(1), 'deep')
+        self.assertIsNone(table.get(5))
+        self.assertIsNone(table.get(1, min_depth=4))
+        table.put(5, 'deeper', depth=3)
+        self.assertEqual(table.get(5), 'deeper')
+        self.assertIsNone(table.get(1))
+        self.assertAlmostEqual(table.hit_rate, 0.4)
+        table.clear()
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.hit_rate, 0.0)
+
+    def test_invalid_capacity(self):
+        """Test if a non-positive capacity is rejected."""
+        with self.assertRaises(ValueError):
+            TranspositionTable(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
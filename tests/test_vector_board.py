@@ -0,0 +1,111 @@
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+
+from tetris.core.board import Board, MoveType
+from tetris.core.tetrimino_factory import TetriminoFactory
+from tetris.core.tetrimino_type import TetriminoType
+from tetris.core.vector_board import VectorBoard
+
+
+class TestVectorBoard(unittest.TestCase):
+    def test_same_fields_as_boards(self):
+        """Test if batched steps match independent boards."""
+        n_boards = 16
+        rng = np.random.default_rng(1234)
+        tetrimino_factory = TetriminoFactory(42)
+        actions = [MoveType.NO_MOVE, MoveType.LEFT, MoveType.RIGHT,
+                   MoveType.DOWN, MoveType.DOWN, MoveType.DOWN,
+                   MoveType.ROTATE_CW, MoveType.ROTATE_CCW, MoveType.DROP]
+        probs = np.array([1, 1, 1, 1, 1, 1, 1, 1, 0.1])
+        boards = [Board() for _ in range(n_boards)]
+        vector_board = VectorBoard(n_boards)
+        is_playing = np.ones(n_boards, dtype=bool)
+        # Garbage with one hole per row, so that random play clears lines
+        y2 = vector_board.ceil_margin + vector_board.height
+        x1 = vector_board.side_margin
+        for i in range(n_boards):
+            for y in range(y2 - 4, y2):
+                x = x1 + rng.integers(vector_board.width)
+                boards[i].tetris_field[y, x1:x1 + vector_board.width] = 7
+                boards[i].tetris_field[y, x] = 0
+            boards[i].sync_field()
+            vector_board.tetris_fields[i] = boards[i].tetris_field
+        total_cleared = 0
+        for _ in range(2000):
+            # Spawn a new Tetrimino where the previous one was locked
+            spawn = is_playing & ~vector_board.is_active
+            pieces = [tetrimino_factory.generate_random()
+                      for _ in range(n_boards)]
+            type_ids = np.array([t.id for t, _ in pieces])
+            rots = np.array([rot for _, rot in pieces])
+            created = vector_board.create_new_tetrimino(type_ids, rots, spawn)
+            for i in np.nonzero(spawn)[0]:
+                status = boards[i].create_new_tetrimino(*pieces[i])
+                self.assertEqual(created[i], status)
+                is_playing[i] = status
+            if not is_playing.any():
+                break
+
+            legal = vector_board.legal_moves()
+            self.assertFalse(legal[:, MoveType.NO_MOVE.value].any())
+            for i in range(n_boards):
+                bits = boards[i].legal_moves() if is_playing[i] else 0
+                npt.assert_array_equal(
+                    legal[i], [bool(bits & (1 << m.value)) for m in MoveType])
+
+            moves = rng.choice(actions, size=n_boards, p=probs / probs.sum())
+            moves = np.array([m.value for m in moves])
+            cleared = vector_board.step(np.where(is_playing, moves, 0))
+            for i in np.nonzero(is_playing)[0]:
+                move = MoveType(moves[i])
+                n_cleared = 0
+                if move != MoveType.NO_MOVE:
+                    moved = boards[i].move_tetrimino(move)
+                    if move == MoveType.DROP or (
+                            move == MoveType.DOWN and not moved):
+                        n_cleared = boards[i].update_play_field()
+                self.assertEqual(cleared[i], n_cleared)
+                total_cleared += n_cleared
+
+            fields = vector_board.get_play_field()
+            active_fields = vector_board.get_active_field()
+            for i in np.nonzero(is_playing)[0]:
+                npt.assert_array_equal(fields[i], boards[i].get_play_field())
+                if vector_board.is_active[i]:
+                    npt.assert_array_equal(active_fields[i],
+                                           boards[i].get_active_field())
+        self.assertGreater(total_cleared, 0)
+
+    def test_clear_lines(self):
+        """Test if only filled lines are cleared on each board."""
+        vector_board = VectorBoard(2)
+        y = vector_board.ceil_margin + vector_board.height - 1
+        x1 = vector_board.side_margin + 1
+        x2 = vector_board.side_margin + vector_board.width
+        vector_board.tetris_fields[:, y - 3:y + 1, x1:x2] = 3
+        vector_board.tetris_fields[1, y - 10, x1:x2] = 5
+        type_ids = np.full(2, TetriminoType.I.id)
+        vector_board.create_new_tetrimino(type_ids, np.ones(2))
+        for _ in range(5):
+            vector_board.move_tetrimino(np.full(2, MoveType.LEFT.value))
+        while vector_board.move_tetrimino(
+                np.full(2, MoveType.DOWN.value)).any():
+            pass
+        cleared = vector_board.update_play_field()
+        npt.assert_array_equal(cleared, [4, 4])
+        fields = vector_board.get_play_field()
+        self.assertFalse(fields[0].any())
+        self.assertEqual(np.count_nonzero(fields[1]), vector_board.width - 1)
+        self.assertTrue(fields[1, -7, 1:].all())
+
+    def test_unknown_move(self):
+        """Test if an unsupported MoveType is rejected."""
+        vector_board = VectorBoard(2)
+        with self.assertRaises(ValueError):
+            vector_board.move_tetrimino(np.array([7, 0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
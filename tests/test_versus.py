@@ -0,0 +1,58 @@
+import random
+import unittest
+
+from tetris.core.board import MoveType
+from tetris.scenes.tetris_env import TetrisEnv
+from tetris.simulation.beam_search import BeamSearchAgent
+from tetris.simulation.versus import VersusMatch
+
+
+class RandomDropAgent:
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+
+    def act(self, env: TetrisEnv):
+        for _ in range(self.rng.randrange(5)):
+            env.board.move_tetrimino(self.rng.choice(
+                [MoveType.LEFT, MoveType.RIGHT, MoveType.ROTATE_CW]))
+        env.step(MoveType.DROP)
+
+
+class TestVersus(unittest.TestCase):
+    def test_match(self):
+        """Test if attacks are routed and the strongest player wins."""
+        agents = [RandomDropAgent(1), BeamSearchAgent(beam_width=2, depth=1),
+                  RandomDropAgent(2)]
+        match = VersusMatch(agents, seed=1234, attack_table=(0, 1, 2, 3, 4))
+        result = match.run(max_rounds=500)
+        self.assertEqual(result.winner, 1)
+        self.assertGreater(result.lines_sent[1], 0)
+        self.assertEqual(sum(result.lines_sent),
+                         sum(result.lines_received)
+                         + sum(sum(p) for p in match.pending))
+        self.assertFalse(match.is_alive(0))
+        self.assertFalse(match.is_alive(2))
+
+    def test_garbage_top_out(self):
+        """Test if a player is out when garbage traps its Tetrimino."""
+        match = VersusMatch([RandomDropAgent(1), RandomDropAgent(2)],
+                            seed=1234)
+        board = match.envs[0].board
+        x1 = board.side_margin
+        bottom = board.max_height - board.floor_margin
+        board.tetris_field[4:bottom, x1:x1 + board.width - 1] = 7
+        board.sync_field()
+        match.pending[0].append(3)
+        field_hash = board.field_hash
+        match.play_turn(0)
+        self.assertFalse(match.is_alive(0))
+        # Out before the agent locked anything on the garbage
+        self.assertIsNone(board.active_tetrimino)
+        self.assertNotEqual(board.field_hash, field_hash)
+        self.assertEqual(board.field_hash,
+                         board.zobrist.hash_field(board.tetris_field))
+        self.assertTrue(match.is_alive(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
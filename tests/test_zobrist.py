@@ -0,0 +1,101 @@
+import random
+import unittest
+
+import numpy as np
+
+from tetris.core.bit_board import BitBoard
+from tetris.core.board import Board, MoveType
+from tetris.core.tetrimino import Tetrimino
+from tetris.core.tetrimino_factory import TetriminoFactory
+from tetris.core.tetrimino_type import TetriminoType
+
+
+class TestZobrist(unittest.TestCase):
+    def test_incremental_hash(self):
+        """Test if the incremental hash matches a full rehash."""
+        rng = random.Random(1234)
+        moves = [MoveType.LEFT, MoveType.RIGHT, MoveType.DOWN,
+                 MoveType.ROTATE_CW, MoveType.ROTATE_CCW]
+        for board in [Board(), BitBoard()]:
+            tetrimino_factory = TetriminoFactory(1234)
+            y2 = board.ceil_margin + board.height
+            x1 = board.side_margin
+            for y in range(y2 - 4, y2):
+                board.tetris_field[y, x1:x1 + board.width] = 7
+                board.tetris_field[y, x1 + rng.randrange(board.width)] = 0
+            board.sync_field()
+            total_cleared = 0
+            for _ in range(100):
+                if not board.create_new_tetrimino(
+                        *tetrimino_factory.generate_random()):
+                    break
+                while board.move_tetrimino(rng.choice(moves)):
+                    pass
+                board.move_tetrimino(MoveType.DROP)
+                total_cleared += board.update_play_field()
+                self.assertEqual(board.field_hash,
+                                 board.zobrist.hash_field(board.tetris_field))
+            # Fill a well to clear lines below the random stack
+            board.tetris_field[:y2, x1:x1 + board.width] = 0
+            board.tetris_field[y2 - 8:y2, x1:x1 + board.width - 1] = 7
+            board.sync_field()
+            for _ in range(2):
+                board.create_new_tetrimino(TetriminoType.I, 1)
+                while board.move_tetrimino(MoveType.RIGHT):
+                    pass
+                board.move_tetrimino(MoveType.DROP)
+                total_cleared += board.update_play_field()
+                self.assertEqual(board.field_hash,
+                                 board.zobrist.hash_field(board.tetris_field))
+            self.assertGreater(total_cleared, 0)
+
+    def test_shift_up(self):
+        """Test if shifting the hash matches hashing the shifted field."""
+        board = Board()
+        field = board.tetris_field.copy()
+        x1 = board.side_margin
+        bottom = board.max_height - board.floor_margin
+        rng = np.random.default_rng(1234)
+        field[bottom - 6:bottom, x1:x1 + board.width] = rng.integers(
+            0, board.garbage_id + 1, size=(6, board.width))
+        for n_rows in range(1, 4):
+            shifted = field.copy()
+            shifted[:bottom - n_rows] = field[n_rows:bottom]
+            shifted[bottom - n_rows:bottom] = board.empty_row
+            self.assertEqual(
+                board.zobrist.shift_up(board.zobrist.hash_field(field),
+                                       n_rows),
+                board.zobrist.hash_field(shifted))
+
+    def test_state_hash(self):
+        """Test if the state hash depends on the active Tetrimino."""
+        board = Board()
+        self.assertEqual(board.state_hash(), board.field_hash)
+        board.create_new_tetrimino(TetriminoType.T, 0)
+        hashes = {board.state_hash()}
+        for move in [MoveType.LEFT, MoveType.ROTATE_CW, MoveType.DOWN]:
+            board.move_tetrimino(move)
+            hashes.add(board.state_hash())
+        self.assertEqual(len(hashes), 4)
+        # Same state reached through another path gives the same hash
+        other = Board()
+        other.active_tetrimino = Tetrimino(
+            TetriminoType.T, board.active_tetrimino.pos_x,
+            board.active_tetrimino.pos_y, board.active_tetrimino.rot + 4)
+        self.assertEqual(other.state_hash(), board.state_hash())
+
+    def test_same_field_same_hash(self):
+        """Test if boards with equal fields have equal hashes."""
+        board = Board()
+        board.create_new_tetrimino(TetriminoType.O, 0)
+        board.move_tetrimino(MoveType.DROP)
+        board.update_play_field()
+        other = Board()
+        np.copyto(other.tetris_field, board.tetris_field)
+        other.sync_field()
+        self.assertEqual(other.field_hash, board.field_hash)
+        self.assertNotEqual(other.field_hash, Board().field_hash)
+
+
+if __name__ == '__main__':
+    unittest.main()
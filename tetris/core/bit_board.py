@@ -0,0 +1,73 @@
+from .board import Board
+from .tetrimino import Tetrimino
+from .tetrimino_type import TetriminoType
+
+
+class BitBoard(Board):
+    """
+    Board engine keeping every row of the padded field as an integer bitmask.
+
+    Collision checks are a few ANDs between the row masks of the field and
+    the precomputed row masks of the tetrimino, and a full line is a single
+    comparison against a constant. `tetris_field` is still maintained, so
+    the public API and the resulting fields are identical to `Board`.
+    """
+    def __init__(self, width: int = 10, height: int = 20):
+        super().__init__(width, height)
+        self.full_row_mask: int = (1 << self.max_width) - 1
+        wall_mask = (1 << self.side_margin) - 1
+        self.empty_row_mask: int = (
+            wall_mask | wall_mask << (self.side_margin + self.width))
+        self.row_masks: list[int] = self._init_row_masks()
+
+    def _init_row_masks(self) -> list[int]:
+        return [self._get_row_mask(row) for row in range(self.max_height)]
+
+    def _get_row_mask(self, row: int) -> int:
+        mask = 0
+        for col, cell in enumerate(self.tetris_field[row].tolist()):
+            if cell:
+                mask |= 1 << col
+        return mask
+
+    def _sync_rows(self, y1: int, y2: int):
+        for row in range(y1, y2):
+            self.row_masks[row] = self._get_row_mask(row)
+
+    def _raise_rows(self, n_rows: int):
+        bottom = self.max_height - self.floor_margin
+        row_masks = self.row_masks
+        # The top rows pushed out are empty
+        del row_masks[:n_rows]
+        row_masks[bottom - n_rows:bottom - n_rows] = [
+            self._get_row_mask(row) for row in range(bottom - n_rows, bottom)]
+
+    def sync_field(self):
+        super().sync_field()
+        self.row_masks = self._init_row_masks()
+
+    def _lock_tetrimino(self, tetrimino: Tetrimino) -> list[int]:
+        touched_rows = super()._lock_tetrimino(tetrimino)
+        for row, mask in tetrimino.get_shape_info().row_masks:
+            self.row_masks[tetrimino.pos_y + row] |= mask << tetrimino.pos_x
+        return touched_rows
+
+    def _is_filled_line(self, row: int) -> bool:
+        return self.row_masks[row] == self.full_row_mask
+
+    def delete_lines(self, cleared_lines: list[int]):
+        super().delete_lines(cleared_lines)
+        if not cleared_lines:
+            return
+        for row in sorted(cleared_lines, reverse=True):
+            del self.row_masks[row]
+        self.row_masks[0:0] = [self.empty_row_mask] * len(cleared_lines)
+
+    def _collides_at(self, tetrimino: TetriminoType, rot: int,
+                     pos_x: int, pos_y: int) -> bool:
+        row_masks = self.row_masks
+        for row, mask in tetrimino.shape_info(rot).row_masks:
+            shifted = mask << pos_x if pos_x >= 0 else mask >> -pos_x
+            if row_masks[pos_y + row] & shifted:
+                return True
+        return False
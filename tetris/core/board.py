@@ -1,14 +1,22 @@
-import copy
 import math
+import time
 
+from collections import deque
+from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING
 
 import numpy as np
 
 from numpy.typing import NDArray
 
+from .instrumentation import Instrumentation
 from .tetrimino import Tetrimino
 from .tetrimino_type import TetriminoType
+from .zobrist import HASH_PRIME, get_zobrist_keys
+
+if TYPE_CHECKING:
+    from .replay import ReplayRecorder
 
 
 class MoveType(Enum):
@@ -21,28 +29,221 @@ class MoveType(Enum):
     ROTATE_CCW = 6
 
 
+# (dx, dy, drot) of the moves which are checked at one candidate position
+MOVE_DELTAS = {
+    MoveType.LEFT: (-1, 0, 0),
+    MoveType.RIGHT: (1, 0, 0),
+    MoveType.DOWN: (0, 1, 0),
+    MoveType.ROTATE_CW: (0, 0, 1),
+    MoveType.ROTATE_CCW: (0, 0, -1),
+}
+# Same deltas keyed by the bit of the move in `Board.legal_moves`
+MOVE_DELTA_BITS = tuple((1 << move.value, delta)
+                        for move, delta in MOVE_DELTAS.items())
+# NO_MOVE is not a move of the board and is never legal there
+ALWAYS_LEGAL_MOVES = 1 << MoveType.DROP.value
+# Cell ids after the Tetrimino ids
+WALL_ID = len(TetriminoType) + 1
+GARBAGE_ID = WALL_ID + 1
+
+
+@dataclass(frozen=True)
+class BoardSnapshot:
+    tetris_field: NDArray[np.uint8]
+    column_tops: tuple[int, ...]
+    active_tetrimino: Tetrimino | None
+    field_hash: int
+
+
+@dataclass
+class UndoFrame:
+    active_tetrimino: Tetrimino | None
+    column_tops: list[int]
+    field_hash: int
+    # (first row, copy of the rows) saved before each field change
+    row_blocks: list[tuple[int, NDArray[np.uint8]]]
+
+
+@dataclass(frozen=True)
+class Placement:
+    rot: int
+    pos_x: int
+    pos_y: int
+    path: tuple[MoveType, ...]
+
+
 class Board:
     def __init__(self, width: int = 10, height: int = 20):
         self.width: int = width
         self.height: int = height
         self.max_tetrimino_size = max([i.size for i in TetriminoType])
-        self.wall_id = len(TetriminoType) + 1
+        self.wall_id = WALL_ID
         self.ceil_margin: int = self.max_tetrimino_size - 1
         self.floor_margin: int = self.max_tetrimino_size - 1
         self.side_margin: int = math.ceil(self.max_tetrimino_size / 2)
         self.max_width = self.width + self.side_margin * 2
         self.max_height = self.height + self.ceil_margin + self.floor_margin
+        self.garbage_id = GARBAGE_ID
+        # tetris_field is a window of max_height rows over a row store
+        # three times as tall. Line clears and garbage slide the window
+        # instead of moving the whole stack; see delete_lines and
+        # insert_garbage. It is a sliding window rather than a ring buffer
+        # so that tetris_field stays a plain 2-D view for every reader.
+        # Sliding rebinds tetris_field: readers get it again, or a view
+        # from get_field_view, after field_version changed.
+        self._storage: NDArray[np.uint8] = np.full(
+            (self.max_height * 3, self.max_width), self.wall_id,
+            dtype=np.uint8)
+        self._offset = self.max_height
         self.tetris_field: NDArray[np.uint8] = self._init_field()
-        self.active_tetrimino: Tetrimino | None = None
+        self.empty_row: NDArray[np.uint8] = self.tetris_field[0].copy()
+        self.wall_row: NDArray[np.uint8] = self.tetris_field[-1].copy()
+        # Row of the highest filled cell in each column of tetris_field
+        self.column_tops: list[int] = self._init_column_tops()
+        self.zobrist = get_zobrist_keys(self.max_height, self.max_width,
+                                        self.garbage_id + 1, (self.wall_id,))
+        # Zobrist hash of tetris_field, updated on every lock, line clear
+        # and garbage insert
+        self.field_hash: int = self.zobrist.hash_field(self.tetris_field)
+        # Bumped on every change of tetris_field / active_tetrimino, so
+        # observers can skip unchanged frames
+        self.field_version: int = 0
+        self._active_version: int = 0
+        self._active_tetrimino: Tetrimino | None = None
+        self._active_pose: tuple | None = None
+        # (name, no_margin) -> (version, read-only array)
+        self._frame_cache: dict[tuple[str, bool], tuple] = {}
+        self.instrumentation: Instrumentation | None = None
+        self.recorder: 'ReplayRecorder | None' = None
+        self.undo_stack: list[UndoFrame] = []
 
     def _init_field(self):
-        w = self.width + self.side_margin * 2
-        h = self.height + self.ceil_margin + self.floor_margin
-        tetris_field = np.full((h, w), self.wall_id).astype(np.uint8)
+        tetris_field = self._storage[self._offset:
+                                     self._offset + self.max_height]
         tetris_field[0:self.max_height - self.floor_margin,
                      self.side_margin:self.width + self.side_margin] = 0
         return tetris_field
 
+    def _reserve_window(self, shift: int):
+        # Make room to slide the window by `shift` rows. When it would leave
+        # the store, it is copied back to the middle, which happens at most
+        # once every max_height rows of sliding: amortized O(width) per row.
+        offset = self._offset + shift
+        if 0 <= offset and offset + self.max_height <= len(self._storage):
+            return
+        middle = self.max_height
+        self._storage[middle:middle + self.max_height] = self.tetris_field
+        self._offset = middle
+        self.tetris_field = self._storage[middle:middle + self.max_height]
+
+    def _slide_window(self, shift: int):
+        # Rows of tetris_field move up by `shift` (down if negative)
+        self._offset += shift
+        self.tetris_field = self._storage[self._offset:
+                                          self._offset + self.max_height]
+
+    @property
+    def active_tetrimino(self) -> Tetrimino | None:
+        return self._active_tetrimino
+
+    @active_tetrimino.setter
+    def active_tetrimino(self, tetrimino: Tetrimino | None):
+        self._active_tetrimino = tetrimino
+        self._active_version += 1
+
+    @property
+    def active_version(self) -> int:
+        # Tetrimino is mutable, so a move in place (e.g. move_left on the
+        # active one) is caught by comparing its pose with the last one seen
+        tetrimino = self._active_tetrimino
+        pose = None if tetrimino is None else (
+            tetrimino.type, tetrimino.rot, tetrimino.pos_x, tetrimino.pos_y)
+        if pose != self._active_pose:
+            self._active_pose = pose
+            self._active_version += 1
+        return self._active_version
+
+    @active_version.setter
+    def active_version(self, version: int):
+        self._active_version = version
+
+    def _init_column_tops(self) -> list[int]:
+        return np.argmax(self.tetris_field > 0, axis=0).tolist()
+
+    def sync_field(self):
+        """Rebuild cached field state after `tetris_field` was edited."""
+        self.column_tops = self._init_column_tops()
+        self.field_hash = self.zobrist.hash_field(self.tetris_field)
+        self.field_version += 1
+
+    def state_hash(self) -> int:
+        """Zobrist hash of the field and the active Tetrimino."""
+        tetrimino = self.active_tetrimino
+        if tetrimino is None:
+            return self.field_hash
+        # Positions wrap around the key table. A wrapped position is never
+        # a valid one of the same shape, so keys stay unique.
+        rot = tetrimino.rot % len(tetrimino.type.shapes)
+        return self.field_hash ^ self.zobrist.piece_key_list[
+            tetrimino.type.id][rot][tetrimino.pos_y][tetrimino.pos_x]
+
+    def snapshot(self) -> BoardSnapshot:
+        return BoardSnapshot(self.tetris_field.copy(),
+                             tuple(self.column_tops),
+                             self._copy_active(), self.field_hash)
+
+    def restore(self, snapshot: BoardSnapshot):
+        np.copyto(self.tetris_field, snapshot.tetris_field)
+        self.column_tops = list(snapshot.column_tops)
+        # Copied so the snapshot can be restored again after moves
+        self.active_tetrimino = (None if snapshot.active_tetrimino is None
+                                 else snapshot.active_tetrimino.copy())
+        self.field_hash = snapshot.field_hash
+        self.field_version += 1
+        self._sync_rows(0, self.max_height)
+
+    def push_undo(self):
+        """
+        Start recording changes, to be rolled back by `pop_undo`.
+
+        Locks and line clears save only the rows they are about to change,
+        so rolling back costs time proportional to the touched rows.
+        """
+        self.undo_stack.append(UndoFrame(self._copy_active(),
+                                         self.column_tops.copy(),
+                                         self.field_hash, []))
+
+    def pop_undo(self):
+        frame = self.undo_stack.pop()
+        for y1, rows in reversed(frame.row_blocks):
+            y2 = y1 + len(rows)
+            self.tetris_field[y1:y2] = rows
+            self._sync_rows(y1, y2)
+        self.column_tops = frame.column_tops
+        self.field_hash = frame.field_hash
+        self.field_version += 1
+        self.active_tetrimino = frame.active_tetrimino
+
+    def _copy_active(self) -> Tetrimino | None:
+        # The active Tetrimino is mutable, keep its pose at this point
+        if self.active_tetrimino is None:
+            return None
+        return self.active_tetrimino.copy()
+
+    def _save_rows(self, y1: int, y2: int):
+        if self.undo_stack:
+            self.undo_stack[-1].row_blocks.append(
+                (y1, self.tetris_field[y1:y2].copy()))
+
+    def _sync_rows(self, y1: int, y2: int):
+        # Hook for engines caching per-row state of tetris_field
+        pass
+
+    def _raise_rows(self, n_rows: int):
+        # Hook: the rows above the floor moved up by n_rows, and the n_rows
+        # rows right above the floor are new
+        pass
+
     def create_new_tetrimino(self, tetrimino: TetriminoType, rot: int) -> bool:
         pos_x = math.floor((self.max_width - tetrimino.size) / 2)
         pos_y = self.max_tetrimino_size - tetrimino.size
@@ -53,13 +254,48 @@ class Board:
         return True
 
     def move_tetrimino(self, move: MoveType) -> bool:
-        collision, next_tetrimino = self.will_collide(move)
-        if not collision:
-            self.active_tetrimino = next_tetrimino
+        if self.instrumentation is None:
+            moved = self._move_tetrimino(move)
+        else:
+            start = time.perf_counter()
+            moved = self._move_tetrimino(move)
+            elapsed = time.perf_counter() - start
+            self.instrumentation.count('tetris_moves_total', move=move.name)
+            if not moved:
+                self.instrumentation.count('tetris_moves_rejected_total',
+                                           move=move.name)
+            self.instrumentation.observe('tetris_move_seconds', elapsed,
+                                         move=move.name)
+        if self.recorder is not None:
+            self.recorder.record_move(move, moved)
+        return moved
+
+    def _move_tetrimino(self, move: MoveType) -> bool:
+        # Collision is checked at the candidate position; a Tetrimino is
+        # only created once the move is accepted.
+        tetrimino = self.active_tetrimino
+        delta = MOVE_DELTAS.get(move)
+        if delta is None:
+            if move != MoveType.DROP:
+                raise ValueError('Unknown MoveType detected.')
+            self.active_tetrimino = Tetrimino(
+                tetrimino.type, tetrimino.pos_x,
+                tetrimino.pos_y + self.drop_distance(), tetrimino.rot)
             return True
-        elif next_tetrimino is None:
-            raise ValueError('Unknown MoveType detected.')
-        return False
+        dx, dy, drot = delta
+        rot = tetrimino.rot
+        if drot:
+            rot = (rot + drot) % len(tetrimino.type.shapes)
+        pos_x = tetrimino.pos_x + dx
+        pos_y = tetrimino.pos_y + dy
+        if self._collides_at(tetrimino.type, rot, pos_x, pos_y):
+            return False
+        self.active_tetrimino = Tetrimino(tetrimino.type, pos_x, pos_y, rot)
+        return True
+
+    def _crop(self, field: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        return field[self.ceil_margin:self.ceil_margin + self.height,
+                     self.side_margin:self.side_margin + self.width]
 
     def get_active_field(self, no_margin: bool = True) -> NDArray[np.uint8]:
         active_field = np.zeros((self.max_height, self.max_width),
@@ -70,83 +306,413 @@ class Board:
         y2 = y1 + self.active_tetrimino.size
         active_field[y1:y2, x1:x2] = self.active_tetrimino.get_state()
         if no_margin:
-            active_field = active_field[
-                self.ceil_margin:self.ceil_margin + self.height,
-                self.side_margin:self.side_margin + self.width
-                ]
+            active_field = self._crop(active_field)
         return active_field
 
     def get_play_field(self, no_margin: bool = True) -> NDArray[np.uint8]:
         current_field = self.tetris_field.copy()
         if no_margin:
-            current_field = current_field[
-                self.ceil_margin:self.ceil_margin + self.height,
-                self.side_margin:self.side_margin + self.width
-                ]
+            current_field = self._crop(current_field)
         return current_field
 
+    def get_field_view(self, no_margin: bool = True) -> NDArray[np.uint8]:
+        """
+        Read-only view of `tetris_field`.
+
+        The view is only valid until `field_version` changes: line clears
+        and garbage may move the field within its row store, leaving
+        earlier views on stale rows. Get a new view after a change, or copy
+        it to keep it.
+        """
+        view = self._crop(self.tetris_field) if no_margin \
+            else self.tetris_field.view()
+        view.flags.writeable = False
+        return view
+
+    def get_active_view(self, no_margin: bool = True) -> NDArray[np.uint8]:
+        """
+        Read-only active field, rebuilt only when `active_version` changed.
+        """
+        key = ('active', no_margin)
+        cached = self._frame_cache.get(key)
+        if cached is not None and cached[0] == self.active_version:
+            return cached[1]
+        if self.active_tetrimino is None:
+            shape = ((self.height, self.width) if no_margin
+                     else (self.max_height, self.max_width))
+            active_field = np.zeros(shape, dtype=np.uint8)
+        else:
+            active_field = self.get_active_field(no_margin)
+        active_field.flags.writeable = False
+        self._frame_cache[key] = (self.active_version, active_field)
+        return active_field
+
+    def get_frame(self, no_margin: bool = True) -> NDArray[np.uint8]:
+        """
+        Read-only field with the active Tetrimino drawn in.
+
+        The frame is cached and rebuilt only when `field_version` or
+        `active_version` changed, so polling an unchanged game costs no copy.
+        """
+        key = ('frame', no_margin)
+        version = (self.field_version, self.active_version)
+        cached = self._frame_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        active_field = self.get_active_view(no_margin)
+        frame = np.where(active_field != 0, active_field,
+                         self.get_field_view(no_margin))
+        frame.flags.writeable = False
+        self._frame_cache[key] = (version, frame)
+        return frame
+
+    def drop_distance(self) -> int:
+        tetrimino = self.active_tetrimino
+        return self._drop_distance_at(tetrimino.type, tetrimino.rot,
+                                      tetrimino.pos_x, tetrimino.pos_y)
+
+    def get_ghost_position(self) -> tuple[int, int]:
+        tetrimino = self.active_tetrimino
+        return tetrimino.pos_x, tetrimino.pos_y + self.drop_distance()
+
     def update_play_field(self) -> int:
-        self.tetris_field += self.get_active_field(no_margin=False)
+        if self.instrumentation is None:
+            return self._update_play_field()
+        start = time.perf_counter()
+        n_cleared_lines = self._update_play_field()
+        elapsed = time.perf_counter() - start
+        self.instrumentation.count('tetris_locks_total')
+        self.instrumentation.count('tetris_line_clears_total',
+                                   lines=str(n_cleared_lines))
+        self.instrumentation.observe('tetris_lock_seconds', elapsed)
+        return n_cleared_lines
+
+    def _update_play_field(self) -> int:
+        if self.undo_stack:
+            tetrimino = self.active_tetrimino
+            _, y_min, _, y_max = tetrimino.get_shape_info().bbox
+            self._save_rows(tetrimino.pos_y + y_min,
+                            tetrimino.pos_y + y_max + 1)
+        touched_rows = self._lock_tetrimino(self.active_tetrimino)
         self.active_tetrimino = None
-        filled_lines = np.where(~np.any(
-            self.tetris_field[:self.max_height - self.floor_margin] == 0,
-            axis=1))
-        filled_lines = filled_lines[0].tolist()
+        filled_lines = [row for row in touched_rows
+                        if self._is_filled_line(row)]
         self.delete_lines(filled_lines)
         return len(filled_lines)
 
     def delete_lines(self, cleared_lines: list[int]):
-        f_line_deleted = np.delete(self.tetris_field, cleared_lines, axis=0)
-        f_new_add_lines = np.full((len(cleared_lines), self.max_width),
-                                  self.wall_id).astype(np.uint8)
-        f_new_add_lines[:, self.side_margin:self.width + self.side_margin] = 0
-        self.tetris_field = np.vstack([f_new_add_lines, f_line_deleted])
+        if not cleared_lines:
+            return
+        cleared_lines = sorted(cleared_lines)
+        bottom = self.max_height - self.floor_margin
+        top = min(min(self.column_tops[self.side_margin:
+                                       self.side_margin + self.width]),
+                  cleared_lines[0])
+        n_lines = len(cleared_lines)
+        first = cleared_lines[0]
+        last = cleared_lines[-1]
+        self._save_rows(top, last + 1)
+        zobrist = self.zobrist
+        # Move and rehash the shorter side: the rows above the cleared
+        # lines down, or the rows below them up and the window with them.
+        if last - top <= bottom - first:
+            # Only rows in [top, last cleared line] change
+            field_hash = self.field_hash - zobrist.hash_rows(
+                self.tetris_field, top, last + 1)
+            self._shift_rows_above(cleared_lines, top)
+            field_hash += zobrist.hash_rows(self.tetris_field, top, last + 1)
+        else:
+            # Rows above the first cleared line all move down by n_lines
+            field_hash = zobrist.shift_up(
+                self.field_hash
+                - zobrist.hash_rows(self.tetris_field, first, bottom),
+                -n_lines)
+            self._shift_rows_below(cleared_lines)
+            field_hash += zobrist.hash_rows(self.tetris_field,
+                                            first + n_lines, bottom)
+        self.field_hash = field_hash % HASH_PRIME
+        self.field_version += 1
+        self._update_column_tops(first, last, n_lines)
+
+    def _update_column_tops(self, first: int, last: int, n_lines: int):
+        # A top above the first cleared line moves down with every cleared
+        # line and a top below the last one does not move. Only columns
+        # whose top was in a cleared line, or between cleared lines, are
+        # scanned again, from the first row which may be filled.
+        field = self.tetris_field
+        column_tops = self.column_tops
+        for col in range(self.side_margin, self.side_margin + self.width):
+            top = column_tops[col]
+            if top < first:
+                column_tops[col] = top + n_lines
+            elif top <= last:
+                start = first + n_lines
+                column_tops[col] = start + int(
+                    np.argmax(field[start:, col] > 0))
+
+    def _shift_rows_above(self, cleared_lines: list[int], top: int):
+        # Blocks of rows between cleared lines move down by the number of
+        # cleared lines below them, bottom block first. Rows above the
+        # highest filled cell are empty and stay untouched.
+        field = self.tetris_field
+        n_lines = len(cleared_lines)
+        for i in range(n_lines - 1, -1, -1):
+            y1 = cleared_lines[i - 1] + 1 if i > 0 else top
+            y2 = cleared_lines[i]
+            shift = n_lines - i
+            if y2 > y1:
+                field[y1 + shift:y2 + shift] = field[y1:y2]
+        field[top:top + n_lines] = self.empty_row
+
+    def _shift_rows_below(self, cleared_lines: list[int]):
+        # Blocks of rows below each cleared line move up by the number of
+        # cleared lines above them, top block first. Sliding the window
+        # down by the number of cleared lines then puts everything in place.
+        bottom = self.max_height - self.floor_margin
+        n_lines = len(cleared_lines)
+        self._reserve_window(-n_lines)
+        field = self._storage[self._offset - n_lines:
+                              self._offset + self.max_height]
+        for i in range(n_lines):
+            y1 = cleared_lines[i] + 1
+            y2 = cleared_lines[i + 1] if i + 1 < n_lines else bottom
+            if y2 > y1:
+                field[y1 + n_lines - i - 1:y2 + n_lines - i - 1] = \
+                    field[y1 + n_lines:y2 + n_lines]
+        field[:n_lines] = self.empty_row
+        self._slide_window(-n_lines)
+        self.tetris_field[bottom:] = self.wall_row
+
+    def insert_garbage(self, n_rows: int, hole: int,
+                       cell_id: int | None = None) -> bool:
+        """
+        Push `n_rows` garbage rows in from the bottom of the field.
+
+        Costs O(n_rows * width), independent of the stack height: the
+        window over the row store slides up (amortized, see
+        `_reserve_window`) so only the new rows and the floor are written,
+        the field hash is shifted with `ZobristKeys.shift_up` and only the
+        new rows are hashed, and `column_tops` and engine row state
+        (`_raise_rows`) are shifted. With an undo frame open, the rows of
+        the stack are saved as well. An active Tetrimino overlapping the
+        raised stack is pushed up by at most `n_rows`, and removed if it
+        still overlaps, so it is never locked into the stack.
+
+        Args:
+            n_rows (int): Number of garbage rows.
+            hole (int): Column of the empty cell in each row, 0 being the
+                leftmost playable column.
+            cell_id (int | None): Id of the garbage cells, `garbage_id` by
+                default.
+
+        Returns:
+            bool: False if the player tops out: with the field unchanged if
+                filled cells would be pushed out of the top of the field, or
+                with the garbage inserted and the active Tetrimino removed
+                if it can not be pushed clear of the raised stack.
+        """
+        if n_rows <= 0:
+            return True
+        x1 = self.side_margin
+        x2 = x1 + self.width
+        if not 0 <= hole < self.width:
+            raise ValueError('Hole column out of range: {}.'.format(hole))
+        bottom = self.max_height - self.floor_margin
+        top = min(self.column_tops[x1:x2])
+        if top < n_rows:
+            return False
+        self._save_rows(min(top, bottom) - n_rows, bottom)
+        self._reserve_window(n_rows)
+        self._slide_window(n_rows)
+        field = self.tetris_field
+        field[bottom - n_rows:bottom] = self.empty_row
+        field[bottom - n_rows:bottom, x1:x2] = (
+            cell_id if cell_id is not None else self.garbage_id)
+        field[bottom - n_rows:bottom, x1 + hole] = 0
+        field[bottom:] = self.wall_row
+        self.field_hash = (
+            self.zobrist.shift_up(self.field_hash, n_rows)
+            + self.zobrist.hash_rows(field, bottom - n_rows, bottom)
+        ) % HASH_PRIME
+        self.field_version += 1
+        for col in range(x1, x2):
+            if self.column_tops[col] < bottom:
+                self.column_tops[col] -= n_rows
+            elif col != x1 + hole:
+                self.column_tops[col] = bottom - n_rows
+        self._raise_rows(n_rows)
+
+        tetrimino = self.active_tetrimino
+        if tetrimino is not None and self._is_overlapping(tetrimino):
+            y_min = tetrimino.get_shape_info().bbox[1]
+            pos_y = tetrimino.pos_y
+            while (pos_y > tetrimino.pos_y - n_rows and pos_y + y_min > 0
+                   and self._collides_at(tetrimino.type, tetrimino.rot,
+                                         tetrimino.pos_x, pos_y)):
+                pos_y -= 1
+            if self._collides_at(tetrimino.type, tetrimino.rot,
+                                 tetrimino.pos_x, pos_y):
+                self.active_tetrimino = None
+                return False
+            self.active_tetrimino = Tetrimino(tetrimino.type,
+                                              tetrimino.pos_x, pos_y,
+                                              tetrimino.rot)
+        return True
+
+    def _lock_tetrimino(self, tetrimino: Tetrimino) -> list[int]:
+        field = self.tetris_field
+        cell_keys = self.zobrist.cell_key_list
+        type_id = tetrimino.type.id
+        field_hash = self.field_hash
+        touched_rows = []
+        for row, col in tetrimino.get_shape_info().cells:
+            row += tetrimino.pos_y
+            col += tetrimino.pos_x
+            field[row, col] = type_id
+            field_hash += cell_keys[row][col][type_id]
+            if row < self.column_tops[col]:
+                self.column_tops[col] = row
+            if row not in touched_rows:
+                touched_rows.append(row)
+        self.field_hash = field_hash % HASH_PRIME
+        self.field_version += 1
+        return touched_rows
+
+    def _is_filled_line(self, row: int) -> bool:
+        return bool(self.tetris_field[row].all())
+
+    def _drop_distance_at(self, tetrimino: TetriminoType, rot: int,
+                          pos_x: int, pos_y: int) -> int:
+        # Landing row comes from the bottom profile of the Tetrimino and the
+        # column tops. Only a column covered above the Tetrimino (it slid
+        # under an overhang) needs a scan of the field.
+        distance = self.max_height
+        for col, depth in enumerate(tetrimino.shape_info(rot).bottom_depths):
+            if depth < 0:
+                continue
+            col += pos_x
+            start = pos_y + depth + 1
+            top = self.column_tops[col]
+            if top < start:
+                below = self.tetris_field[start:, col] > 0
+                top = start + int(np.argmax(below))
+            distance = min(distance, top - start)
+        return distance
+
+    def enumerate_placements(self) -> tuple[list[Placement], int]:
+        """
+        List every final resting placement reachable by the active Tetrimino.
+
+        Runs a BFS over (rot, x, y) states with a visited table. Collision
+        results are cached per state, so each state is tested only once.
+
+        Returns:
+            tuple[list[Placement], int]: Placements unique by footprint with
+                their shortest move path, and the number of expanded states.
+        """
+        tetrimino_type = self.active_tetrimino.type
+        n_rot = len(tetrimino_type.shapes)
+        collisions = {}
+
+        def collides(state: tuple[int, int, int]) -> bool:
+            if state not in collisions:
+                collisions[state] = self._collides_at(tetrimino_type, *state)
+            return collisions[state]
+
+        start = (self.active_tetrimino.rot % n_rot,
+                 self.active_tetrimino.pos_x,
+                 self.active_tetrimino.pos_y)
+        parents = {start: None}
+        queue = deque([start])
+        footprints = set()
+        placements = []
+        n_expanded = 0
+        while queue:
+            state = queue.popleft()
+            n_expanded += 1
+            rot, x, y = state
+            next_states = (
+                (MoveType.LEFT, (rot, x - 1, y)),
+                (MoveType.RIGHT, (rot, x + 1, y)),
+                (MoveType.DOWN, (rot, x, y + 1)),
+                (MoveType.ROTATE_CW, ((rot + 1) % n_rot, x, y)),
+                (MoveType.ROTATE_CCW, ((rot - 1) % n_rot, x, y)),
+            )
+            for move, next_state in next_states:
+                if next_state in parents or collides(next_state):
+                    continue
+                parents[next_state] = (state, move)
+                queue.append(next_state)
+            if not collides((rot, x, y + 1)):
+                continue
+            footprint = frozenset(
+                (y + row, x + col)
+                for row, col in tetrimino_type.shape_info(rot).cells)
+            if footprint in footprints:
+                continue
+            footprints.add(footprint)
+            path = []
+            parent = parents[state]
+            while parent is not None:
+                path.append(parent[1])
+                parent = parents[parent[0]]
+            placements.append(Placement(rot, x, y, tuple(reversed(path))))
+        return placements, n_expanded
+
+    def legal_moves(self) -> int:
+        """
+        Moves accepted by `move_tetrimino` for the active Tetrimino.
+
+        Every move of `MOVE_DELTAS` is checked at its candidate position
+        with `_collides_at`, without creating any Tetrimino.
+
+        Returns:
+            int: Bitmask with bit `move.value` set for every legal
+                MoveType. DROP is always legal and NO_MOVE, which
+                `move_tetrimino` rejects, never is; the mask is 0 without an
+                active Tetrimino.
+        """
+        tetrimino = self.active_tetrimino
+        if tetrimino is None:
+            return 0
+        legal = ALWAYS_LEGAL_MOVES
+        tetrimino_type = tetrimino.type
+        rot = tetrimino.rot
+        pos_x = tetrimino.pos_x
+        pos_y = tetrimino.pos_y
+        n_rotations = len(tetrimino_type.shapes)
+        for bit, (dx, dy, drot) in MOVE_DELTA_BITS:
+            next_rot = (rot + drot) % n_rotations if drot else rot
+            if not self._collides_at(tetrimino_type, next_rot,
+                                     pos_x + dx, pos_y + dy):
+                legal |= bit
+        return legal
 
     def will_collide(self, move: MoveType) -> tuple[bool, Tetrimino | None]:
-        if move == MoveType.LEFT:
-            has_collision, next_tetrimino = self._will_collide_left()
-        elif move == MoveType.RIGHT:
-            has_collision, next_tetrimino = self._will_collide_right()
-        elif move == MoveType.DOWN:
-            has_collision, next_tetrimino = self._will_collide_down()
-        elif move == MoveType.ROTATE_CW:
-            has_collision, next_tetrimino = self._will_not_rotate_cw()
-        elif move == MoveType.ROTATE_CCW:
-            has_collision, next_tetrimino = self._will_not_rotate_ccw()
-        else:
-            has_collision = True
-            next_tetrimino = None
-        return has_collision, next_tetrimino
-
-    def _will_collide_left(self) -> tuple[bool, Tetrimino]:
-        ghost_tetrimino = copy.copy(self.active_tetrimino)
-        ghost_tetrimino.move_left()
-        return self._is_overlapping(ghost_tetrimino), ghost_tetrimino
-
-    def _will_collide_right(self) -> tuple[bool, Tetrimino]:
-        ghost_tetrimino = copy.copy(self.active_tetrimino)
-        ghost_tetrimino.move_right()
-        return self._is_overlapping(ghost_tetrimino), ghost_tetrimino
-
-    def _will_collide_down(self) -> tuple[bool, Tetrimino]:
-        ghost_tetrimino = copy.copy(self.active_tetrimino)
-        ghost_tetrimino.move_down()
-        return self._is_overlapping(ghost_tetrimino), ghost_tetrimino
-
-    def _will_not_rotate_cw(self) -> tuple[bool, Tetrimino]:
-        ghost_tetrimino = copy.copy(self.active_tetrimino)
-        ghost_tetrimino.rotate_clockwise()
-        return self._is_overlapping(ghost_tetrimino), ghost_tetrimino
-
-    def _will_not_rotate_ccw(self) -> tuple[bool, Tetrimino]:
-        ghost_tetrimino = copy.copy(self.active_tetrimino)
-        ghost_tetrimino.rotate_counter_clockwise()
-        return self._is_overlapping(ghost_tetrimino), ghost_tetrimino
+        tetrimino = self.active_tetrimino
+        delta = MOVE_DELTAS.get(move)
+        if delta is None:
+            if move != MoveType.DROP:
+                return True, None
+            return False, Tetrimino(tetrimino.type, tetrimino.pos_x,
+                                    tetrimino.pos_y + self.drop_distance(),
+                                    tetrimino.rot)
+        dx, dy, drot = delta
+        rot = tetrimino.rot
+        if drot:
+            rot = (rot + drot) % len(tetrimino.type.shapes)
+        next_tetrimino = Tetrimino(tetrimino.type, tetrimino.pos_x + dx,
+                                   tetrimino.pos_y + dy, rot)
+        return self._is_overlapping(next_tetrimino), next_tetrimino
 
     def _is_overlapping(self, tetrimino: Tetrimino) -> bool:
-        x1 = tetrimino.pos_x
-        x2 = x1 + tetrimino.size
-        y1 = tetrimino.pos_y
-        y2 = y1 + tetrimino.size
-        cropped = self.tetris_field[y1:y2, x1:x2]
-        return np.any(np.logical_and(tetrimino.get_state() > 0, cropped > 0))
+        return self._collides_at(tetrimino.type, tetrimino.rot,
+                                 tetrimino.pos_x, tetrimino.pos_y)
+
+    def _collides_at(self, tetrimino: TetriminoType, rot: int,
+                     pos_x: int, pos_y: int) -> bool:
+        field = self.tetris_field
+        for row, col in tetrimino.shape_info(rot).cells:
+            if field[pos_y + row, pos_x + col]:
+                return True
+        return False
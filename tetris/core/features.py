@@ -0,0 +1,127 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from numpy.typing import NDArray
+
+from .board import Board
+from .tetrimino import Tetrimino
+
+# Every function takes the play field without margins, e.g. the output of
+# `Board.get_play_field()`, either as one (H, W) field or as an (N, H, W)
+# stack. Rows run from top to bottom and any nonzero cell is filled.
+
+
+@dataclass
+class BoardFeatures:
+    # (..., W) height of the highest filled cell above the floor
+    heights: NDArray[np.int64]
+    # (..., W) empty cells below the highest filled cell
+    holes: NDArray[np.int64]
+    # (...) sum of height differences between neighbouring columns
+    bumpiness: NDArray[np.int64]
+    # (...) filled/empty changes along the rows, walls count as filled
+    row_transitions: NDArray[np.int64]
+    # (..., W) depth of each column below its lower neighbour
+    well_depths: NDArray[np.int64]
+
+
+def column_heights(fields: NDArray) -> NDArray[np.int64]:
+    filled = fields != 0
+    height = fields.shape[-2]
+    first = np.argmax(filled, axis=-2)
+    return np.where(filled.any(axis=-2), height - first, 0)
+
+
+def column_holes(fields: NDArray) -> NDArray[np.int64]:
+    filled = fields != 0
+    # Cells at or below the highest filled cell of their column
+    covered = np.logical_or.accumulate(filled, axis=-2)
+    return np.count_nonzero(covered & ~filled, axis=-2)
+
+
+def bumpiness(heights: NDArray) -> NDArray[np.int64]:
+    return np.abs(np.diff(heights, axis=-1)).sum(axis=-1)
+
+
+def row_transitions(fields: NDArray) -> NDArray[np.int64]:
+    """Filled/empty changes of each row, shape (..., H)."""
+    filled = fields != 0
+    wall = np.ones(filled.shape[:-1] + (1,), dtype=bool)
+    padded = np.concatenate([wall, filled, wall], axis=-1)
+    return np.count_nonzero(padded[..., 1:] != padded[..., :-1], axis=-1)
+
+
+def well_depths(heights: NDArray, max_height: int) -> NDArray[np.int64]:
+    wall = np.full(heights.shape[:-1] + (1,), max_height, dtype=np.int64)
+    padded = np.concatenate([wall, heights, wall], axis=-1)
+    neighbours = np.minimum(padded[..., :-2], padded[..., 2:])
+    return np.maximum(neighbours - heights, 0)
+
+
+def extract_features(fields: NDArray) -> BoardFeatures:
+    heights = column_heights(fields)
+    return BoardFeatures(
+        heights=heights,
+        holes=column_holes(fields),
+        bumpiness=bumpiness(heights),
+        row_transitions=row_transitions(fields).sum(axis=-1),
+        well_depths=well_depths(heights, fields.shape[-2]))
+
+
+class IncrementalFeatures:
+    """
+    Features of a `Board` kept up to date lock by lock.
+
+    Call `update` after each `Board.update_play_field` with the locked
+    Tetrimino. Without a line clear only the columns and rows covered by
+    the Tetrimino are recomputed; a line clear shifts every row above it,
+    so it falls back to `sync`. Call `sync` as well after editing the field
+    in any other way, e.g. `Board.pop_undo`.
+    """
+    def __init__(self, board: Board):
+        self.board = board
+        self.heights: NDArray[np.int64] = np.zeros(board.width,
+                                                   dtype=np.int64)
+        self.holes: NDArray[np.int64] = np.zeros(board.width, dtype=np.int64)
+        self.row_transitions: NDArray[np.int64] = np.zeros(board.height,
+                                                           dtype=np.int64)
+        self.sync()
+
+    def _get_field(self) -> NDArray[np.uint8]:
+        board = self.board
+        return board.tetris_field[
+            board.ceil_margin:board.ceil_margin + board.height,
+            board.side_margin:board.side_margin + board.width]
+
+    def sync(self):
+        field = self._get_field()
+        self.heights = column_heights(field)
+        self.holes = column_holes(field)
+        self.row_transitions = row_transitions(field)
+
+    def update(self, tetrimino: Tetrimino, n_cleared_lines: int):
+        if n_cleared_lines:
+            self.sync()
+            return
+        board = self.board
+        cells = tetrimino.get_shape_info().cells
+        cols = sorted({col + tetrimino.pos_x - board.side_margin
+                       for _, col in cells})
+        rows = [row for row in {row + tetrimino.pos_y - board.ceil_margin
+                                for row, _ in cells}
+                if 0 <= row < board.height]
+        field = self._get_field()
+        columns = field[:, cols]
+        self.heights[cols] = column_heights(columns)
+        self.holes[cols] = column_holes(columns)
+        if rows:
+            self.row_transitions[rows] = row_transitions(field[rows])
+
+    def get_features(self) -> BoardFeatures:
+        return BoardFeatures(
+            heights=self.heights.copy(),
+            holes=self.holes.copy(),
+            bumpiness=bumpiness(self.heights),
+            row_transitions=self.row_transitions.sum(),
+            well_depths=well_depths(self.heights, self.board.height))
@@ -0,0 +1,161 @@
+import bisect
+import json
+import os
+import tempfile
+import time
+
+from collections import Counter
+from pathlib import Path
+
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4,
+                   5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2)
+
+
+class LatencyHistogram:
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        # Last slot counts the values above the largest bucket (+Inf)
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+    def to_dict(self) -> dict:
+        return {
+            'buckets': list(self.buckets),
+            'counts': list(self.counts),
+            'sum': self.sum,
+            'count': self.count,
+        }
+
+
+class Instrumentation:
+    """
+    Opt-in counters and latency histograms.
+
+    Metrics are keyed by name and labels, e.g.
+    `count('tetris_moves_total', move='LEFT')`. Attach an instance to
+    `Board.instrumentation` or pass it to `TetrisCli`; while it is None the
+    instrumented code only pays one attribute check.
+    """
+    def __init__(self, sinks: list | None = None,
+                 buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.sinks = sinks if sinks is not None else []
+        self.buckets = buckets
+        self.counters: Counter = Counter()
+        self.histograms: dict[tuple, LatencyHistogram] = {}
+
+    def count(self, name: str, value: int = 1, **labels: str):
+        self.counters[name, tuple(sorted(labels.items()))] += value
+
+    def observe(self, name: str, seconds: float, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = LatencyHistogram(self.buckets)
+        histogram.observe(seconds)
+
+    def get_count(self, name: str, **labels: str) -> int:
+        return self.counters[name, tuple(sorted(labels.items()))]
+
+    def get_histogram(self, name: str,
+                      **labels: str) -> LatencyHistogram | None:
+        return self.histograms.get((name, tuple(sorted(labels.items()))))
+
+    def snapshot(self) -> dict:
+        return {
+            'timestamp': time.time(),
+            'counters': [
+                {'name': name, 'labels': dict(labels), 'value': value}
+                for (name, labels), value in sorted(self.counters.items())],
+            'histograms': [
+                {'name': name, 'labels': dict(labels), **histogram.to_dict()}
+                for (name, labels), histogram
+                in sorted(self.histograms.items(), key=lambda i: i[0])],
+        }
+
+    def flush(self):
+        snapshot = self.snapshot()
+        for sink in self.sinks:
+            sink.write(snapshot)
+
+    def reset(self):
+        self.counters.clear()
+        self.histograms.clear()
+
+
+class InMemorySink:
+    def __init__(self):
+        self.snapshots: list[dict] = []
+
+    def write(self, snapshot: dict):
+        self.snapshots.append(snapshot)
+
+
+class JsonLinesSink:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def write(self, snapshot: dict):
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(snapshot) + '\n')
+
+
+class PrometheusTextSink:
+    """
+    Dump the latest snapshot in the Prometheus text exposition format.
+
+    The file is replaced atomically, so it can be read by the node exporter
+    textfile collector at any time.
+    """
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def write(self, snapshot: dict):
+        text = format_prometheus(snapshot)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent,
+                                        prefix=self.path.name)
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        os.replace(tmp_path, self.path)
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join('{}="{}"'.format(key, value)
+                          for key, value in labels.items()) + '}'
+
+
+def format_prometheus(snapshot: dict) -> str:
+    lines = []
+    typed = set()
+    for counter in snapshot['counters']:
+        if counter['name'] not in typed:
+            lines.append('# TYPE {} counter'.format(counter['name']))
+            typed.add(counter['name'])
+        lines.append('{}{} {}'.format(counter['name'],
+                                      _format_labels(counter['labels']),
+                                      counter['value']))
+    for histogram in snapshot['histograms']:
+        name = histogram['name']
+        if name not in typed:
+            lines.append('# TYPE {} histogram'.format(name))
+            typed.add(name)
+        cumulative = 0
+        bounds = [repr(b) for b in histogram['buckets']] + ['+Inf']
+        for bound, count in zip(bounds, histogram['counts']):
+            cumulative += count
+            labels = dict(histogram['labels'], le=bound)
+            lines.append('{}_bucket{} {}'.format(
+                name, _format_labels(labels), cumulative))
+        labels = _format_labels(histogram['labels'])
+        lines.append('{}_sum{} {}'.format(name, labels, histogram['sum']))
+        lines.append('{}_count{} {}'.format(name, labels,
+                                            histogram['count']))
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,344 @@
+import io
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+import numpy as np
+
+from numpy.typing import NDArray
+
+from .board import Board, MoveType
+from .player_status import PlayerStatus
+from .tetrimino import Tetrimino
+from .tetrimino_type import TetriminoType
+
+# File layout:
+#   header   MAGIC, version, varints (width, height, seed, keyframe interval)
+#   events   one tag byte each, keyframes followed by a varint payload
+#   END
+#
+# Tag byte:
+#   0000 ammm  MOVE      m: MoveType value, a: accepted
+#   01cr rttt  SPAWN     t: TetriminoType id, r: rotation % 4, c: created
+#   10.. .nnn  LOCK      n: number of cleared lines
+#   1100 0000  KEYFRAME  varints (event index, score, lines, level, active
+#                        type id or 0, rot, x, y), then the field as 4-bit
+#                        packed cell ids (3-bit in version 1 files)
+#   1100 0001  END
+MAGIC = b'TTRP'
+VERSION = 2
+TAG_MASK = 0xC0
+MOVE = 0x00
+SPAWN = 0x40
+LOCK = 0x80
+KEYFRAME = 0xC0
+END = 0xC1
+CELL_BITS = 4
+# Bits per keyframe cell of each readable version. Version 1 had no room
+# for the garbage id.
+VERSION_CELL_BITS = {1: 3, 2: CELL_BITS}
+
+
+def write_varint(f: BinaryIO, value: int):
+    if value < 0:
+        raise ValueError('Negative varint: {}.'.format(value))
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            break
+    f.write(out)
+
+
+def read_varint(f: BinaryIO) -> int:
+    value = 0
+    shift = 0
+    while True:
+        byte = f.read(1)
+        if not byte:
+            raise EOFError('Truncated varint.')
+        value |= (byte[0] & 0x7F) << shift
+        if not byte[0] & 0x80:
+            return value
+        shift += 7
+
+
+def pack_cells(cells: NDArray[np.uint8],
+               cell_bits: int = CELL_BITS) -> bytes:
+    if cells.size and int(cells.max()) >= 1 << cell_bits:
+        raise ValueError('Cell id does not fit in {} bits.'
+                         .format(cell_bits))
+    bits = np.unpackbits(cells.reshape(-1, 1), axis=1)[:, -cell_bits:]
+    return np.packbits(bits).tobytes()
+
+
+def unpack_cells(data: bytes, n_cells: int,
+                 cell_bits: int = CELL_BITS) -> NDArray[np.uint8]:
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+    bits = bits[:n_cells * cell_bits].reshape(n_cells, cell_bits)
+    weights = 1 << np.arange(cell_bits - 1, -1, -1, dtype=np.uint8)
+    return (bits * weights).sum(axis=1).astype(np.uint8)
+
+
+@dataclass(frozen=True)
+class ReplayEvent:
+    kind: int
+    move: MoveType | None = None
+    accepted: bool = False
+    tetrimino: TetriminoType | None = None
+    rot: int = 0
+    n_cleared_lines: int = 0
+
+
+@dataclass(frozen=True)
+class ReplayHeader:
+    width: int
+    height: int
+    seed: int
+    keyframe_interval: int
+
+
+@dataclass
+class ReplayState:
+    event_index: int
+    board: Board
+    player_status: PlayerStatus
+
+
+def _field_region(board: Board) -> tuple[slice, slice]:
+    # Playable columns of every row above the floor, ceil rows included
+    return (slice(0, board.max_height - board.floor_margin),
+            slice(board.side_margin, board.side_margin + board.width))
+
+
+def _n_field_bytes(board: Board, cell_bits: int = CELL_BITS) -> int:
+    n_cells = (board.max_height - board.floor_margin) * board.width
+    return (n_cells * cell_bits + 7) // 8
+
+
+class ReplayRecorder:
+    """
+    Record a game as a compact binary stream.
+
+    Attach it with `TetrisCli(recorder=...)`. Moves are recorded by
+    `Board.move_tetrimino`, spawns and locks by `TetrisCli` once the score
+    is updated. Every event is one byte, and a keyframe of the field is
+    written every `keyframe_interval` events so readers can seek without
+    replaying the whole game.
+    """
+    def __init__(self, file: str | Path | BinaryIO,
+                 keyframe_interval: int = 256):
+        if isinstance(file, (str, Path)):
+            self.file = open(file, 'wb')
+            self.owns_file = True
+        else:
+            self.file = file
+            self.owns_file = False
+        self.keyframe_interval = keyframe_interval
+        self.board: Board | None = None
+        self.player_status: PlayerStatus | None = None
+        self.n_events = 0
+
+    def start(self, board: Board, player_status: PlayerStatus, seed: int):
+        self.board = board
+        self.player_status = player_status
+        self.file.write(MAGIC)
+        self.file.write(bytes([VERSION]))
+        for value in (board.width, board.height, seed,
+                      self.keyframe_interval):
+            write_varint(self.file, value)
+        self._write_keyframe()
+
+    def record_spawn(self, tetrimino: TetriminoType, rot: int, created: bool):
+        self._write_event(SPAWN | created << 5 | (rot % 4) << 3
+                          | tetrimino.id)
+
+    def record_move(self, move: MoveType, accepted: bool):
+        self._write_event(MOVE | accepted << 3 | move.value)
+
+    def record_lock(self, n_cleared_lines: int):
+        self._write_event(LOCK | n_cleared_lines)
+
+    def close(self):
+        self.file.write(bytes([END]))
+        if self.owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+
+    def _write_event(self, tag: int):
+        self.file.write(bytes([tag]))
+        self.n_events += 1
+        if self.n_events % self.keyframe_interval == 0:
+            self._write_keyframe()
+
+    def _write_keyframe(self):
+        board = self.board
+        status = self.player_status
+        tetrimino = board.active_tetrimino
+        self.file.write(bytes([KEYFRAME]))
+        values = [self.n_events, status.score, status.lines, status.level]
+        if tetrimino is None:
+            values += [0, 0, 0, 0]
+        else:
+            values += [tetrimino.type.id, tetrimino.rot % 4,
+                       tetrimino.pos_x, tetrimino.pos_y]
+        for value in values:
+            write_varint(self.file, value)
+        self.file.write(pack_cells(board.tetris_field[_field_region(board)]))
+
+
+class ReplayReader:
+    """
+    Stream events of a replay and seek to any event.
+
+    The file is read sequentially through its buffer and never loaded
+    whole. `seek` restores the nearest keyframe and re-simulates the events
+    after it.
+    """
+    def __init__(self, file: str | Path | BinaryIO):
+        if isinstance(file, (str, Path)):
+            self.file = open(file, 'rb')
+            self.owns_file = True
+        else:
+            self.file = file
+            self.owns_file = False
+        if self.file.read(len(MAGIC)) != MAGIC:
+            raise ValueError('Not a replay file.')
+        version = self.file.read(1)[0]
+        if version not in VERSION_CELL_BITS:
+            raise ValueError('Unsupported replay version: {}.'
+                             .format(version))
+        self.cell_bits = VERSION_CELL_BITS[version]
+        self.header = ReplayHeader(*(read_varint(self.file)
+                                     for _ in range(4)))
+        self.events_offset = self.file.tell()
+        self._template = Board(self.header.width, self.header.height)
+        # (event index, file offset) of keyframes seen so far
+        self.keyframes: list[tuple[int, int]] = []
+        self._is_indexed = False
+
+    def close(self):
+        if self.owns_file:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def events(self) -> Iterator[ReplayEvent]:
+        """Iterate over all spawn, move and lock events."""
+        self.file.seek(self.events_offset)
+        for event, _ in self._iter_records():
+            if event is not None:
+                yield event
+
+    def seek(self, event_index: int) -> ReplayState:
+        """
+        Restore the game state after the first `event_index` events.
+        """
+        self._build_index()
+        offset = self.events_offset
+        for keyframe_index, keyframe_offset in self.keyframes:
+            if keyframe_index > event_index:
+                break
+            offset = keyframe_offset
+        self.file.seek(offset)
+        state = None
+        for event, keyframe in self._iter_records():
+            if keyframe is not None:
+                if state is None:
+                    state = keyframe
+                continue
+            if state.event_index >= event_index:
+                break
+            self._apply(state, event)
+        if state.event_index < event_index:
+            raise IndexError('Replay has only {} events.'
+                             .format(state.event_index))
+        return state
+
+    def _build_index(self):
+        if self._is_indexed:
+            return
+        self.file.seek(self.events_offset)
+        while True:
+            offset = self.file.tell()
+            tag = self.file.read(1)
+            if not tag or tag[0] == END:
+                break
+            if tag[0] == KEYFRAME:
+                event_index = read_varint(self.file)
+                self.keyframes.append((event_index, offset))
+                for _ in range(7):
+                    read_varint(self.file)
+                self.file.seek(_n_field_bytes(self._template,
+                                              self.cell_bits), io.SEEK_CUR)
+        self._is_indexed = True
+
+    def _iter_records(self) -> Iterator[tuple[ReplayEvent | None,
+                                              ReplayState | None]]:
+        while True:
+            tag = self.file.read(1)
+            if not tag or tag[0] == END:
+                return
+            tag = tag[0]
+            kind = tag & TAG_MASK
+            if tag == KEYFRAME:
+                yield None, self._read_keyframe()
+            elif kind == MOVE:
+                yield ReplayEvent(MOVE, move=MoveType(tag & 0x07),
+                                  accepted=bool(tag & 0x08)), None
+            elif kind == SPAWN:
+                yield ReplayEvent(
+                    SPAWN, tetrimino=self._get_type(tag & 0x07),
+                    rot=(tag >> 3) & 0x03, accepted=bool(tag & 0x20)), None
+            else:
+                yield ReplayEvent(LOCK, n_cleared_lines=tag & 0x07), None
+
+    def _read_keyframe(self) -> ReplayState:
+        event_index, score, lines, level, type_id, rot, pos_x, pos_y = (
+            read_varint(self.file) for _ in range(8))
+        board = Board(self.header.width, self.header.height)
+        data = self.file.read(_n_field_bytes(board, self.cell_bits))
+        rows, cols = _field_region(board)
+        shape = (rows.stop - rows.start, cols.stop - cols.start)
+        board.tetris_field[rows, cols] = unpack_cells(
+            data, shape[0] * shape[1], self.cell_bits).reshape(shape)
+        board.sync_field()
+        if type_id:
+            board.active_tetrimino = Tetrimino(self._get_type(type_id),
+                                               pos_x, pos_y, rot)
+        player_status = PlayerStatus(score=score, lines=lines, level=level)
+        return ReplayState(event_index, board, player_status)
+
+    @staticmethod
+    def _get_type(type_id: int) -> TetriminoType:
+        for tetrimino in TetriminoType:
+            if tetrimino.id == type_id:
+                return tetrimino
+        raise ValueError('Unknown Tetrimino id: {}.'.format(type_id))
+
+    @staticmethod
+    def _apply(state: ReplayState, event: ReplayEvent):
+        board = state.board
+        if event.kind == SPAWN:
+            board.create_new_tetrimino(event.tetrimino, event.rot)
+        elif event.kind == MOVE:
+            if board.move_tetrimino(event.move) != event.accepted:
+                raise ValueError('Replay diverged at event {}.'
+                                 .format(state.event_index))
+        else:
+            n_cleared_lines = board.update_play_field()
+            if n_cleared_lines != event.n_cleared_lines:
+                raise ValueError('Replay diverged at event {}.'
+                                 .format(state.event_index))
+            state.player_status.add_score(n_cleared_lines)
+        state.event_index += 1
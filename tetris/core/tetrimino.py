@@ -1,7 +1,9 @@
-from .tetrimino_type import TetriminoType
+from .tetrimino_type import ShapeInfo, TetriminoType
 
 
 class Tetrimino:
+    __slots__ = ('type', 'pos_x', 'pos_y', 'rot', 'size')
+
     def __init__(self,
                  tetrimino_type: TetriminoType,
                  pos_x: int | None = None,
@@ -14,6 +16,9 @@ class Tetrimino:
         self.rot = rot
         self.size = tetrimino_type.size
 
+    def copy(self) -> 'Tetrimino':
+        return Tetrimino(self.type, self.pos_x, self.pos_y, self.rot)
+
     def rotate_clockwise(self):
         if self.rot is None:
             raise ValueError('Rotation is not set.')
@@ -45,4 +50,7 @@ class Tetrimino:
         self.pos_y = pos_y
 
     def get_state(self):
-        return self.type.shape(self.rot)
\ No newline at end of file
+        return self.type.shape(self.rot)
+
+    def get_shape_info(self) -> ShapeInfo:
+        return self.type.shape_info(self.rot)
@@ -1,28 +1,110 @@
-import random
 import time
 
+import numpy as np
+
+from numpy.typing import NDArray
+
 from .tetrimino_type import TetriminoType
 
+# Pieces and rotations are drawn from the random state in blocks of this
+# many pieces (whole bags), whatever the buffer size
+BLOCK_SIZE = 7 * 32
+
 
 class TetriminoFactory:
-    def __init__(self, seed: int = -1):
+    """
+    Generate Tetriminos from a random state owned by the instance.
+
+    Pieces and rotations are drawn `buffer_size` at a time as NumPy arrays
+    and served from that buffer, so `generate_random` is a list lookup. With
+    `bag=True` every run of 7 pieces is a shuffle of all Tetriminos (7-bag
+    randomizer), otherwise pieces are drawn uniformly. The random state is
+    always consumed in blocks of BLOCK_SIZE pieces, so the sequence only
+    depends on the seed and the mode, not on `buffer_size`, on other
+    factories or on how it is consumed.
+    """
+    def __init__(self, seed: int = -1, bag: bool = False,
+                 buffer_size: int = 1024):
         if not isinstance(seed, int) or seed < 0:
             seed = time.time_ns()
-        random.seed(seed)
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.is_bag = bag
         self.tetrimino_choices = [i.name for i in TetriminoType]
         self.rotation_choices = [i for i in range(4)]
+        self.tetriminos = list(TetriminoType)
+        # Whole blocks per refill
+        self.buffer_size = -(-buffer_size // BLOCK_SIZE) * BLOCK_SIZE
+        self.type_ids: NDArray[np.int64] = np.array(
+            [t.id for t in self.tetriminos])
+        self._indices: NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+        self._rots: NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+        self._index_list: list[int] = []
+        self._rot_list: list[int] = []
+        self._position = 0
 
     def generate_random(self) -> tuple[TetriminoType, int]:
-        tetrimino_name = random.choice(self.tetrimino_choices)
-        rotation = random.choice(self.rotation_choices)
-        tetrimino = self._generate_tetrimino(tetrimino_name)
-        return tetrimino, rotation
+        if self._position >= len(self._index_list):
+            self._fill(1)
+        position = self._position
+        self._position += 1
+        return (self.tetriminos[self._index_list[position]],
+                self._rot_list[position])
+
+    def generate_bulk(self, n: int) -> tuple[NDArray[np.int64],
+                                             NDArray[np.int64]]:
+        """
+        Take the next `n` pieces at once.
+
+        Returns:
+            tuple[NDArray[np.int64], NDArray[np.int64]]: TetriminoType ids
+                and rotations, e.g. for `VectorBoard.create_new_tetrimino`.
+        """
+        self._fill(n)
+        start = self._position
+        self._position += n
+        return (self.type_ids[self._indices[start:start + n]],
+                self._rots[start:start + n].copy())
+
+    def peek(self, n: int) -> list[tuple[TetriminoType, int]]:
+        """Next `n` pieces of `generate_random`, without consuming them."""
+        self._fill(n)
+        start = self._position
+        return [(self.tetriminos[index], rot) for index, rot
+                in zip(self._index_list[start:start + n],
+                       self._rot_list[start:start + n])]
 
     def generate_fixed(self, tetrimino_name: str,
                        rotation: int) -> tuple[TetriminoType, int]:
         tetrimino = self._generate_tetrimino(tetrimino_name)
         return tetrimino, rotation
 
+    def _fill(self, n: int):
+        # Ensure n pieces are buffered after the current position
+        n_buffered = len(self._indices) - self._position
+        if n_buffered >= n:
+            return
+        n_chunks = -(-(n - n_buffered) // self.buffer_size)
+        indices = [self._indices[self._position:]]
+        rots = [self._rots[self._position:]]
+        for _ in range(n_chunks * self.buffer_size // BLOCK_SIZE):
+            indices.append(self._draw_indices())
+            rots.append(self.rng.integers(0, len(self.rotation_choices),
+                                          BLOCK_SIZE))
+        self._indices = np.concatenate(indices)
+        self._rots = np.concatenate(rots)
+        self._index_list = self._indices.tolist()
+        self._rot_list = self._rots.tolist()
+        self._position = 0
+
+    def _draw_indices(self) -> NDArray[np.int64]:
+        n_tetriminos = len(self.tetriminos)
+        if not self.is_bag:
+            return self.rng.integers(0, n_tetriminos, BLOCK_SIZE)
+        bags = np.tile(np.arange(n_tetriminos),
+                       (BLOCK_SIZE // n_tetriminos, 1))
+        return self.rng.permuted(bags, axis=1).ravel()
+
     def _generate_tetrimino(self, tetrimino_name: str) -> TetriminoType:
         try:
             tetrimino = TetriminoType[tetrimino_name]
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from enum import Enum, unique
 from typing import List
 
@@ -6,6 +7,51 @@ import numpy as np
 from numpy.typing import NDArray
 
 
+@dataclass(frozen=True)
+class ShapeInfo:
+    """
+    Precomputed, immutable description of one rotation of a Tetrimino.
+
+    All offsets are relative to the top left corner of the shape matrix.
+
+    Attributes:
+        shape (NDArray[np.uint8]): Read-only shape matrix.
+        cells (tuple[tuple[int, int], ...]): (row, col) of occupied cells.
+        bbox (tuple[int, int, int, int]): (x_min, y_min, x_max, y_max) of
+            the occupied cells, both ends inclusive.
+        bottom_depths (tuple[int, ...]): Lowest occupied row per column,
+            -1 for empty columns.
+        row_masks (tuple[tuple[int, int], ...]): (row, bitmask) for every
+            non-empty row. Bit n stands for column n of the shape.
+    """
+    shape: NDArray[np.uint8]
+    cells: tuple[tuple[int, int], ...]
+    bbox: tuple[int, int, int, int]
+    bottom_depths: tuple[int, ...]
+    row_masks: tuple[tuple[int, int], ...]
+
+
+def _build_shape_info(shape: NDArray) -> ShapeInfo:
+    shape = shape.astype(np.uint8)
+    shape.flags.writeable = False
+    cells = tuple((int(row), int(col)) for row, col in np.argwhere(shape))
+    rows = [row for row, _ in cells]
+    cols = [col for _, col in cells]
+    bottom_depths = tuple(
+        max([row for row, col in cells if col == icol], default=-1)
+        for icol in range(shape.shape[1]))
+    row_masks = []
+    for irow in range(shape.shape[0]):
+        mask = sum(1 << col for row, col in cells if row == irow)
+        if mask:
+            row_masks.append((irow, mask))
+    return ShapeInfo(shape=shape,
+                     cells=cells,
+                     bbox=(min(cols), min(rows), max(cols), max(rows)),
+                     bottom_depths=bottom_depths,
+                     row_masks=tuple(row_masks))
+
+
 @unique
 class TetriminoType(Enum):
     I = (1, [np.array([[0, 0, 0, 0],
@@ -69,14 +115,25 @@ class TetriminoType(Enum):
 
     def __init__(self, id_value, shapes):
         self.id: int = id_value
-        self.shapes: List[NDArray[np.uint8]] = shapes
+        # Built once at import, shared by every Tetrimino and Board
+        self.shape_infos: tuple[ShapeInfo, ...] = tuple(
+            _build_shape_info(ishape) for ishape in shapes)
+        self.shapes: List[NDArray[np.uint8]] = [
+            info.shape for info in self.shape_infos]
         self.size: int = self.shapes[0].shape[0]
+        self.rot_index: dict[tuple, int] = {
+            (ishape.shape, ishape.tobytes()): i
+            for i, ishape in enumerate(self.shapes)}
 
     def shape(self, rotation: int = 0) -> NDArray[np.uint8]:
-        return self.shapes[rotation % len(self.shapes)].astype(np.uint8)
+        return self.shapes[rotation % len(self.shapes)]
+
+    def shape_info(self, rotation: int = 0) -> ShapeInfo:
+        return self.shape_infos[rotation % len(self.shape_infos)]
 
     def rot(self, shape: NDArray) -> int:
-        for i, ishape in enumerate(self.shapes):
-            if np.array_equal(ishape, shape):
-                return i
-        raise ValueError('Can not find the shape.')
+        shape = np.asarray(shape).astype(np.uint8)
+        try:
+            return self.rot_index[shape.shape, shape.tobytes()]
+        except KeyError as exc:
+            raise ValueError('Can not find the shape.') from exc
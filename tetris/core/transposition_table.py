@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from enum import Enum
+from typing import Any
+
+
+class ReplacementPolicy(Enum):
+    LRU = 0
+    DEPTH = 1
+
+
+class TranspositionTable:
+    """
+    Bounded cache of evaluations keyed by board state hash.
+
+    With `ReplacementPolicy.LRU` the least recently used entry is evicted.
+    With `ReplacementPolicy.DEPTH` the table is direct-mapped on
+    `key % capacity` and a slot is only replaced by an entry searched at
+    least as deep as the one it holds.
+    """
+    def __init__(self, capacity: int,
+                 policy: ReplacementPolicy = ReplacementPolicy.LRU):
+        if capacity <= 0:
+            raise ValueError('Capacity must be positive: {}.'
+                             .format(capacity))
+        self.capacity = capacity
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._slots: list[tuple[int, Any, int] | None] = (
+            [None] * capacity if policy == ReplacementPolicy.DEPTH else [])
+
+    @property
+    def hit_rate(self) -> float:
+        n_lookups = self.hits + self.misses
+        return self.hits / n_lookups if n_lookups else 0.0
+
+    def __len__(self) -> int:
+        if self.policy == ReplacementPolicy.LRU:
+            return len(self._entries)
+        return sum(slot is not None for slot in self._slots)
+
+    def get(self, key: int, min_depth: int = 0) -> Any | None:
+        if self.policy == ReplacementPolicy.LRU:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] >= min_depth:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        else:
+            slot = self._slots[key % self.capacity]
+            if slot is not None and slot[0] == key and slot[2] >= min_depth:
+                self.hits += 1
+                return slot[1]
+        self.misses += 1
+        return None
+
+    def put(self, key: int, value: Any, depth: int = 0):
+        if self.policy == ReplacementPolicy.LRU:
+            self._entries[key] = (value, depth)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+            return
+        index = key % self.capacity
+        slot = self._slots[index]
+        if slot is None or slot[0] == key or depth >= slot[2]:
+            self._slots[index] = (key, value, depth)
+
+    def clear(self):
+        self.hits = 0
+        self.misses = 0
+        self._entries.clear()
+        if self.policy == ReplacementPolicy.DEPTH:
+            self._slots = [None] * self.capacity
@@ -0,0 +1,253 @@
+import numpy as np
+
+from numpy.typing import NDArray
+
+from .board import Board, MoveType
+from .tetrimino_type import TetriminoType
+
+
+def _build_cell_tables() -> tuple[NDArray, NDArray, NDArray, NDArray]:
+    # Tables indexed by [type id, rotation]. Index 0 is "no tetrimino".
+    # Every Tetrimino has the same number of cells, so offsets fit in arrays.
+    n_ids = max(t.id for t in TetriminoType) + 1
+    n_cells = len(TetriminoType.I.shape_info().cells)
+    cell_rows = np.zeros((n_ids, 4, n_cells), dtype=np.int64)
+    cell_cols = np.zeros((n_ids, 4, n_cells), dtype=np.int64)
+    n_rotations = np.ones(n_ids, dtype=np.int64)
+    sizes = np.zeros(n_ids, dtype=np.int64)
+    for t in TetriminoType:
+        n_rotations[t.id] = len(t.shapes)
+        sizes[t.id] = t.size
+        for rot in range(4):
+            cells = np.array(t.shape_info(rot).cells)
+            cell_rows[t.id, rot] = cells[:, 0]
+            cell_cols[t.id, rot] = cells[:, 1]
+    return cell_rows, cell_cols, n_rotations, sizes
+
+
+CELL_ROWS, CELL_COLS, N_ROTATIONS, SIZES = _build_cell_tables()
+
+# (dx, dy, drot) indexed by MoveType value
+MOVE_DELTAS = np.zeros((len(MoveType), 3), dtype=np.int64)
+MOVE_DELTAS[MoveType.LEFT.value] = (-1, 0, 0)
+MOVE_DELTAS[MoveType.RIGHT.value] = (1, 0, 0)
+MOVE_DELTAS[MoveType.DOWN.value] = (0, 1, 0)
+MOVE_DELTAS[MoveType.ROTATE_CW.value] = (0, 0, 1)
+MOVE_DELTAS[MoveType.ROTATE_CCW.value] = (0, 0, -1)
+# Moves whose legality depends on a collision check
+CHECKED_MOVES = np.array([MoveType.LEFT.value, MoveType.RIGHT.value,
+                          MoveType.DOWN.value, MoveType.ROTATE_CW.value,
+                          MoveType.ROTATE_CCW.value])
+
+
+class VectorBoard:
+    """
+    N boards stepped together with batched NumPy operations.
+
+    Fields are stored as one (N, H, W) padded array with the same layout as
+    `Board.tetris_field`, and the active Tetriminos as parallel arrays of
+    type id, rotation and position. Every method mirrors the `Board` method
+    of the same name and gives the same result as N independent boards.
+    `MoveType.NO_MOVE` leaves a board untouched.
+    """
+    def __init__(self, n_boards: int, width: int = 10, height: int = 20):
+        template = Board(width, height)
+        self.n_boards: int = n_boards
+        self.width: int = template.width
+        self.height: int = template.height
+        self.max_tetrimino_size: int = template.max_tetrimino_size
+        self.wall_id: int = template.wall_id
+        self.ceil_margin: int = template.ceil_margin
+        self.floor_margin: int = template.floor_margin
+        self.side_margin: int = template.side_margin
+        self.max_width: int = template.max_width
+        self.max_height: int = template.max_height
+        self.empty_row: NDArray[np.uint8] = template.tetris_field[0].copy()
+        self.tetris_fields: NDArray[np.uint8] = np.repeat(
+            template.tetris_field[np.newaxis], n_boards, axis=0)
+        self.type_ids: NDArray[np.int64] = np.zeros(n_boards, dtype=np.int64)
+        self.rots: NDArray[np.int64] = np.zeros(n_boards, dtype=np.int64)
+        self.pos_x: NDArray[np.int64] = np.zeros(n_boards, dtype=np.int64)
+        self.pos_y: NDArray[np.int64] = np.zeros(n_boards, dtype=np.int64)
+        self.is_active: NDArray[np.bool_] = np.zeros(n_boards, dtype=bool)
+
+    def create_new_tetrimino(self, type_ids: NDArray, rots: NDArray,
+                             mask: NDArray | None = None) -> NDArray[np.bool_]:
+        boards = self._select(mask)
+        type_ids = np.asarray(type_ids, dtype=np.int64)[boards]
+        rots = np.asarray(rots, dtype=np.int64)[boards]
+        pos_x = (self.max_width - SIZES[type_ids]) // 2
+        pos_y = self.max_tetrimino_size - SIZES[type_ids]
+        overlapping = self._is_overlapping(boards, type_ids, rots,
+                                           pos_x, pos_y)
+        created = boards[~overlapping]
+        self.type_ids[created] = type_ids[~overlapping]
+        self.rots[created] = rots[~overlapping]
+        self.pos_x[created] = pos_x[~overlapping]
+        self.pos_y[created] = pos_y[~overlapping]
+        self.is_active[created] = True
+        status = np.zeros(self.n_boards, dtype=bool)
+        status[created] = True
+        return status
+
+    def move_tetrimino(self, moves: NDArray) -> NDArray[np.bool_]:
+        moves = np.asarray(moves, dtype=np.int64)
+        if np.any((moves < 0) | (moves >= len(MoveType))):
+            raise ValueError('Unknown MoveType detected.')
+        boards = np.nonzero(self.is_active
+                            & (moves != MoveType.NO_MOVE.value))[0]
+        deltas = MOVE_DELTAS[moves[boards]]
+        type_ids = self.type_ids[boards]
+        rots = (self.rots[boards] + deltas[:, 2]) % N_ROTATIONS[type_ids]
+        rots = np.where(deltas[:, 2] == 0, self.rots[boards], rots)
+        pos_x = self.pos_x[boards] + deltas[:, 0]
+        pos_y = self.pos_y[boards] + deltas[:, 1]
+        drops = moves[boards] == MoveType.DROP.value
+        pos_y[drops] += self._drop_distances(
+            boards[drops], type_ids[drops], rots[drops], pos_x[drops],
+            pos_y[drops])
+        collision = self._is_overlapping(boards, type_ids, rots, pos_x, pos_y)
+        moved = boards[~collision]
+        self.rots[moved] = rots[~collision]
+        self.pos_x[moved] = pos_x[~collision]
+        self.pos_y[moved] = pos_y[~collision]
+        status = np.zeros(self.n_boards, dtype=bool)
+        status[moved] = True
+        return status
+
+    def legal_moves(self) -> NDArray[np.bool_]:
+        """
+        Moves accepted by `move_tetrimino`, for all boards at once.
+
+        The candidate positions of every checked move of every active board
+        are tested in one `_is_overlapping` call.
+
+        Returns:
+            NDArray[np.bool_]: (N, len(MoveType)) mask indexed by MoveType
+                value, all False for boards without an active Tetrimino.
+                NO_MOVE, which moves nothing, is never set.
+        """
+        legal = np.zeros((self.n_boards, len(MoveType)), dtype=bool)
+        boards = np.nonzero(self.is_active)[0]
+        legal[boards, MoveType.DROP.value] = True
+        n_moves = len(CHECKED_MOVES)
+        deltas = MOVE_DELTAS[CHECKED_MOVES]
+        type_ids = np.repeat(self.type_ids[boards], n_moves)
+        rots = np.repeat(self.rots[boards], n_moves)
+        drots = np.tile(deltas[:, 2], len(boards))
+        rots = np.where(drots == 0, rots,
+                        (rots + drots) % N_ROTATIONS[type_ids])
+        pos_x = (self.pos_x[boards, np.newaxis] + deltas[:, 0]).ravel()
+        pos_y = (self.pos_y[boards, np.newaxis] + deltas[:, 1]).ravel()
+        collision = self._is_overlapping(np.repeat(boards, n_moves),
+                                         type_ids, rots, pos_x, pos_y)
+        legal[boards[:, np.newaxis], CHECKED_MOVES] = \
+            ~collision.reshape(len(boards), n_moves)
+        return legal
+
+    def update_play_field(self,
+                          mask: NDArray | None = None) -> NDArray[np.int64]:
+        boards = self._select(mask)
+        boards = boards[self.is_active[boards]]
+        rows, cols = self._get_cells(boards, self.type_ids[boards],
+                                     self.rots[boards], self.pos_x[boards],
+                                     self.pos_y[boards])
+        self.tetris_fields[boards[:, np.newaxis], rows, cols] = \
+            self.type_ids[boards, np.newaxis]
+        self.is_active[boards] = False
+
+        n_cleared = np.zeros(self.n_boards, dtype=np.int64)
+        bottom = self.max_height - self.floor_margin
+        fields = self.tetris_fields[boards, :bottom]
+        filled = np.all(fields != 0, axis=2)
+        n_filled = filled.sum(axis=1)
+        n_cleared[boards] = n_filled
+        cleared = n_filled > 0
+        if not np.any(cleared):
+            return n_cleared
+
+        # Move filled rows to the top keeping the order of the others,
+        # then blank them.
+        boards = boards[cleared]
+        fields = fields[cleared]
+        order = np.argsort(~filled[cleared], axis=1, kind='stable')
+        fields = np.take_along_axis(fields, order[:, :, np.newaxis], axis=1)
+        is_new = np.arange(bottom) < n_filled[cleared, np.newaxis]
+        fields[is_new] = self.empty_row
+        self.tetris_fields[boards, :bottom] = fields
+        return n_cleared
+
+    def step(self, moves: NDArray) -> NDArray[np.int64]:
+        """
+        Apply one move per board and lock the Tetriminos which were dropped
+        or could not move down.
+
+        Args:
+            moves (NDArray): MoveType values, one per board.
+
+        Returns:
+            NDArray[np.int64]: Number of cleared lines per board.
+        """
+        moves = np.asarray(moves, dtype=np.int64)
+        moved = self.move_tetrimino(moves)
+        landed = self.is_active & (
+            (~moved & (moves == MoveType.DOWN.value))
+            | (moves == MoveType.DROP.value))
+        return self.update_play_field(landed)
+
+    def get_active_field(self, no_margin: bool = True) -> NDArray[np.uint8]:
+        active_fields = np.zeros_like(self.tetris_fields)
+        boards = np.nonzero(self.is_active)[0]
+        rows, cols = self._get_cells(boards, self.type_ids[boards],
+                                     self.rots[boards], self.pos_x[boards],
+                                     self.pos_y[boards])
+        active_fields[boards[:, np.newaxis], rows, cols] = \
+            self.type_ids[boards, np.newaxis]
+        if no_margin:
+            active_fields = self._crop(active_fields)
+        return active_fields
+
+    def get_play_field(self, no_margin: bool = True) -> NDArray[np.uint8]:
+        current_fields = self.tetris_fields.copy()
+        if no_margin:
+            current_fields = self._crop(current_fields)
+        return current_fields
+
+    def _crop(self, fields: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        return fields[:,
+                      self.ceil_margin:self.ceil_margin + self.height,
+                      self.side_margin:self.side_margin + self.width]
+
+    def _select(self, mask: NDArray | None) -> NDArray[np.int64]:
+        if mask is None:
+            return np.arange(self.n_boards)
+        return np.nonzero(mask)[0]
+
+    @staticmethod
+    def _get_cells(boards: NDArray, type_ids: NDArray, rots: NDArray,
+                   pos_x: NDArray, pos_y: NDArray) -> tuple[NDArray, NDArray]:
+        rots = rots % N_ROTATIONS[type_ids]
+        rows = pos_y[:, np.newaxis] + CELL_ROWS[type_ids, rots]
+        cols = pos_x[:, np.newaxis] + CELL_COLS[type_ids, rots]
+        return rows, cols
+
+    def _drop_distances(self, boards: NDArray, type_ids: NDArray,
+                        rots: NDArray, pos_x: NDArray,
+                        pos_y: NDArray) -> NDArray[np.int64]:
+        # Distance from every cell to the first filled cell below it in its
+        # column. Cells of the Tetrimino are not in the field, so the minimum
+        # over all cells is the drop distance.
+        rows, cols = self._get_cells(boards, type_ids, rots, pos_x, pos_y)
+        all_rows = np.arange(self.max_height)
+        columns = self.tetris_fields[boards[:, np.newaxis, np.newaxis],
+                                     all_rows, cols[:, :, np.newaxis]]
+        below = (columns != 0) & (all_rows > rows[:, :, np.newaxis])
+        first_filled = np.argmax(below, axis=2)
+        return np.min(first_filled - rows - 1, axis=1)
+
+    def _is_overlapping(self, boards: NDArray, type_ids: NDArray,
+                        rots: NDArray, pos_x: NDArray,
+                        pos_y: NDArray) -> NDArray[np.bool_]:
+        rows, cols = self._get_cells(boards, type_ids, rots, pos_x, pos_y)
+        cells = self.tetris_fields[boards[:, np.newaxis], rows, cols]
+        return np.any(cells != 0, axis=1)
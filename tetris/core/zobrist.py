@@ -0,0 +1,68 @@
+from functools import lru_cache
+
+import numpy as np
+
+from numpy.typing import NDArray
+
+ZOBRIST_SEED = 20240917
+# Field hashes are taken modulo this Mersenne prime
+HASH_PRIME = (1 << 61) - 1
+
+
+class ZobristKeys:
+    """
+    Random keys for every (col, cell id) of a padded field and every
+    (type id, rotation, row, col) of an active Tetrimino.
+
+    A cell holding id i at (row, col) adds `column_keys[col][i]` times
+    `base ** (max_height - 1 - row)` to the field hash, modulo HASH_PRIME.
+    Rows only enter through the power of `base`, so moving every row of a
+    field up by k rows multiplies its hash by `base ** k` (`shift_up`)
+    without rehashing any row. Keys of empty cells and of `static_ids`
+    (walls, which never move) are 0.
+    """
+    def __init__(self, max_height: int, max_width: int, n_ids: int,
+                 static_ids: tuple[int, ...] = (), seed: int = ZOBRIST_SEED):
+        rng = np.random.default_rng(seed)
+        self.base: int = int(rng.integers(2, HASH_PRIME))
+        column_keys = rng.integers(1, HASH_PRIME, size=(max_width, n_ids),
+                                   dtype=np.uint64)
+        column_keys[:, 0] = 0
+        column_keys[:, list(static_ids)] = 0
+        self.column_keys: list = column_keys.tolist()
+        row_weights = [pow(self.base, max_height - 1 - row, HASH_PRIME)
+                       for row in range(max_height)]
+        # Term of each (row, col, id) in the field hash
+        self.cell_keys: NDArray[np.uint64] = np.array(
+            [[[key * weight % HASH_PRIME for key in keys]
+              for keys in self.column_keys] for weight in row_weights],
+            dtype=np.uint64)
+        self.piece_keys: NDArray[np.uint64] = rng.integers(
+            0, 2 ** 63, size=(n_ids, 4, max_height, max_width),
+            dtype=np.uint64)
+        # Nested lists are faster than NumPy for scalar lookups
+        self.cell_key_list: list = self.cell_keys.tolist()
+        self.piece_key_list: list = self.piece_keys.tolist()
+
+    def hash_rows(self, field: NDArray[np.uint8], y1: int, y2: int) -> int:
+        rows = np.arange(y1, y2)[:, np.newaxis]
+        cols = np.arange(field.shape[1])
+        keys = self.cell_keys[rows, cols, field[y1:y2]]
+        # Terms are below 2 ** 61, sum them as Python ints to not overflow
+        return sum(keys.ravel().tolist()) % HASH_PRIME
+
+    def hash_field(self, field: NDArray[np.uint8]) -> int:
+        return self.hash_rows(field, 0, field.shape[0])
+
+    def shift_up(self, field_hash: int, n_rows: int) -> int:
+        """
+        Hash of the field after all its rows moved up by `n_rows`, or down
+        if negative. Rows moved in must be empty.
+        """
+        return field_hash * pow(self.base, n_rows, HASH_PRIME) % HASH_PRIME
+
+
+@lru_cache(maxsize=None)
+def get_zobrist_keys(max_height: int, max_width: int, n_ids: int,
+                     static_ids: tuple[int, ...] = ()) -> ZobristKeys:
+    return ZobristKeys(max_height, max_width, n_ids, static_ids)
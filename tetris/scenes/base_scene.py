@@ -14,3 +14,6 @@ class BaseScene(ABC):
     @abstractmethod
     def handle_input(self, key: int):
         pass
+
+    def is_finished(self) -> bool:
+        return False
@@ -0,0 +1,232 @@
+import asyncio
+import itertools
+import json
+import time
+
+import numpy as np
+
+from numpy.typing import NDArray
+
+from ..core.instrumentation import Instrumentation, LatencyHistogram
+from .tetris_cli_controller import TetrisCli
+from .tetris_scene import TetrisScene
+
+# Protocol: newline delimited, one key per line from the client ('a', 'd',
+# 's', 'x', 'e', 'w' as in the CLI, 'q' to leave) and one JSON object per
+# line from the server. The first object is the full state:
+#   {"type": "full", "session": id, "width": w, "height": h,
+#    "board": [[...], ...], "active": [[row, col, id], ...], "score": n}
+# followed by deltas holding only what changed since the last one sent:
+#   {"type": "delta", "rows": {"row": [...]}, "active": [...],
+#    "score": n, "game_over": true}
+
+
+class GameSession:
+    def __init__(self, session_id: int, scene: TetrisScene,
+                 writer: asyncio.StreamWriter | None = None):
+        self.session_id = session_id
+        self.scene = scene
+        self.writer = writer
+        self.inputs: list[int] = []
+        self.last_active = time.monotonic()
+        self.tick_latency = LatencyHistogram()
+        self.sent_field: NDArray[np.uint8] | None = None
+        self.sent_versions: tuple[int, int] = (-1, -1)
+
+    @property
+    def controller(self) -> TetrisCli:
+        return self.scene.controller
+
+    def full_state(self) -> dict:
+        board = self.controller.board
+        self.sent_field = board.get_field_view().copy()
+        self.sent_versions = (board.field_version, board.active_version)
+        return {
+            'type': 'full',
+            'session': self.session_id,
+            'width': board.width,
+            'height': board.height,
+            'board': self.sent_field.tolist(),
+            'active': self._active_cells(),
+            'score': self.controller.player_status.score,
+        }
+
+    def delta(self) -> dict | None:
+        """Changes since the last state sent, or None if there are none."""
+        board = self.controller.board
+        versions = (board.field_version, board.active_version)
+        if versions == self.sent_versions:
+            return None
+        message = {'type': 'delta'}
+        if versions[0] != self.sent_versions[0]:
+            field = board.get_field_view()
+            rows = np.nonzero((field != self.sent_field).any(axis=1))[0]
+            message['rows'] = {int(row): field[row].tolist() for row in rows}
+            self.sent_field[rows] = field[rows]
+            message['score'] = self.controller.player_status.score
+        if versions[1] != self.sent_versions[1]:
+            message['active'] = self._active_cells()
+        if self.controller.is_game_over():
+            message['game_over'] = True
+        self.sent_versions = versions
+        return message
+
+    def _active_cells(self) -> list[list[int]]:
+        active = self.controller.board.get_active_view()
+        rows, cols = np.nonzero(active)
+        return [[int(row), int(col), int(active[row, col])]
+                for row, col in zip(rows, cols)]
+
+
+class GameServer:
+    """
+    Host many Tetris sessions on one asyncio event loop.
+
+    A single scheduler task wakes up `tick_rate` times per second and runs
+    one pass over every session: queued keys are applied, gravity advances
+    by one tick and a delta of the rows, active cells and score that changed
+    is sent. Nothing is sent to a client whose write buffer is above
+    `max_write_buffer`; it gets a larger delta once it catches up, or the
+    final one with `game_over` when its game ends. Sessions without input
+    for `idle_timeout` seconds are evicted.
+
+    The time spent on each session per tick is recorded per session and in
+    `tick_latency`; `stats()['sessions_per_core']` is the number of
+    sessions one core could tick at `tick_rate` at the mean latency.
+    """
+    def __init__(self, host: str = '127.0.0.1', port: int = 0,
+                 tick_rate: float = 60.0, gravity_interval: float = 0.5,
+                 idle_timeout: float = 300.0,
+                 max_write_buffer: int = 1 << 16,
+                 instrumentation: Instrumentation | None = None):
+        self.host = host
+        self.port = port
+        self.dt = 1.0 / tick_rate
+        self.gravity_interval = gravity_interval
+        self.idle_timeout = idle_timeout
+        self.max_write_buffer = max_write_buffer
+        self.instrumentation = instrumentation
+        self.sessions: dict[int, GameSession] = {}
+        self.tick_latency = LatencyHistogram()
+        self.pass_latency = LatencyHistogram()
+        self.n_evicted = 0
+        self.n_finished = 0
+        self._session_ids = itertools.count(1)
+        self._server: asyncio.Server | None = None
+        self._scheduler: asyncio.Task | None = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle_client,
+                                                  self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._scheduler = asyncio.create_task(self._run_scheduler())
+
+    async def close(self):
+        if self._scheduler is not None:
+            self._scheduler.cancel()
+        for session_id in list(self.sessions):
+            self.remove_session(session_id)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def add_session(self, writer: asyncio.StreamWriter | None = None,
+                    seed: int = -1) -> GameSession:
+        scene = TetrisScene(TetrisCli(seed=seed), self.gravity_interval)
+        session = GameSession(next(self._session_ids), scene, writer)
+        self.sessions[session.session_id] = session
+        self._send(session, session.full_state())
+        return session
+
+    def remove_session(self, session_id: int):
+        session = self.sessions.pop(session_id, None)
+        if session is not None and session.writer is not None:
+            session.writer.close()
+
+    def tick(self):
+        """Run one scheduler pass over all sessions."""
+        pass_start = now = time.perf_counter()
+        for session in list(self.sessions.values()):
+            scene = session.scene
+            for key in session.inputs:
+                scene.handle_input(key)
+            session.inputs.clear()
+            scene.update(self.dt)
+            if scene.is_finished():
+                # The final state is sent even to a congested client
+                message = session.delta() or {'type': 'delta'}
+                message['game_over'] = True
+                self._send(session, message)
+                self.remove_session(session.session_id)
+                self.n_finished += 1
+            elif not self._is_congested(session):
+                message = session.delta()
+                if message is not None:
+                    self._send(session, message)
+            end = time.perf_counter()
+            session.tick_latency.observe(end - now)
+            self.tick_latency.observe(end - now)
+            if self.instrumentation is not None:
+                self.instrumentation.observe('tetris_session_tick_seconds',
+                                             end - now)
+            now = end
+        self.pass_latency.observe(now - pass_start)
+        self._evict_idle()
+
+    def stats(self) -> dict:
+        mean = (self.tick_latency.sum / self.tick_latency.count
+                if self.tick_latency.count else 0.0)
+        return {
+            'sessions': len(self.sessions),
+            'evicted': self.n_evicted,
+            'finished': self.n_finished,
+            'tick_latency': self.tick_latency.to_dict(),
+            'pass_latency': self.pass_latency.to_dict(),
+            'sessions_per_core': int(self.dt / mean) if mean else None,
+        }
+
+    async def _run_scheduler(self):
+        next_tick = time.perf_counter()
+        while True:
+            self.tick()
+            next_tick += self.dt
+            delay = next_tick - time.perf_counter()
+            if delay < 0:
+                # Overloaded: skip the missed ticks instead of bursting
+                next_tick = time.perf_counter()
+                delay = 0.0
+            await asyncio.sleep(delay)
+
+    async def _handle_client(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter):
+        session = self.add_session(writer)
+        try:
+            async for line in reader:
+                key = line.strip()
+                if key == b'q':
+                    break
+                if len(key) == 1:
+                    session.inputs.append(key[0])
+                    session.last_active = time.monotonic()
+        except ConnectionError:
+            pass
+        finally:
+            self.remove_session(session.session_id)
+
+    def _evict_idle(self):
+        deadline = time.monotonic() - self.idle_timeout
+        for session in list(self.sessions.values()):
+            if session.last_active < deadline:
+                self.remove_session(session.session_id)
+                self.n_evicted += 1
+
+    def _is_congested(self, session: GameSession) -> bool:
+        writer = session.writer
+        return (writer is not None and
+                writer.transport.get_write_buffer_size()
+                > self.max_write_buffer)
+
+    @staticmethod
+    def _send(session: GameSession, message: dict):
+        if session.writer is not None and not session.writer.is_closing():
+            session.writer.write(json.dumps(message).encode() + b'\n')
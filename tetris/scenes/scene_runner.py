@@ -0,0 +1,121 @@
+import asyncio
+import time
+
+from typing import Awaitable, Callable
+
+from ..core.instrumentation import Instrumentation, LatencyHistogram
+from .base_scene import BaseScene
+
+
+class SceneRunner:
+    """
+    Drive a `BaseScene` on asyncio with a fixed timestep.
+
+    Elapsed wall time is added to an accumulator and consumed by calls of
+    `scene.update(1 / tick_rate)`, so the game advances at the same rate
+    whatever the frame rate. After a stall at most `max_catch_up` updates
+    run in one pass and the rest of the backlog is dropped. Keys posted with
+    `post_input` are queued without blocking and handled before the next
+    update. Frames are rendered at most `max_fps` times per second and
+    passed to `on_frame`.
+
+    Jitter is the distance between when the loop should have woken up and
+    when it did, and between the frame period and the actual one. Both go to
+    latency histograms, and to `instrumentation` if set.
+
+    `clock` and `sleep` default to `time.perf_counter` and `asyncio.sleep`;
+    a fake pair makes runs deterministic.
+    """
+    def __init__(self, scene: BaseScene, tick_rate: float = 60.0,
+                 max_fps: float = 30.0, max_catch_up: int = 5,
+                 on_frame: Callable[[object], None] | None = None,
+                 instrumentation: Instrumentation | None = None,
+                 clock: Callable[[], float] = time.perf_counter,
+                 sleep: Callable[[float], Awaitable] = asyncio.sleep):
+        self.scene = scene
+        self.dt = 1.0 / tick_rate
+        self.frame_period = 1.0 / max_fps
+        self.max_catch_up = max_catch_up
+        self.on_frame = on_frame
+        self.instrumentation = instrumentation
+        self.clock = clock
+        self.sleep = sleep
+        self.input_queue: asyncio.Queue = asyncio.Queue()
+        self.n_ticks = 0
+        self.n_frames = 0
+        self.n_dropped_ticks = 0
+        self.wakeup_jitter = LatencyHistogram()
+        self.frame_jitter = LatencyHistogram()
+        self.is_running = False
+
+    def post_input(self, key: int):
+        self.input_queue.put_nowait(key)
+
+    def stop(self):
+        self.is_running = False
+
+    async def run(self, duration: float | None = None):
+        """
+        Run until `stop` is called, the scene is finished or `duration`
+        seconds have passed.
+        """
+        self.is_running = True
+        start = previous = last_frame = self.clock()
+        accumulator = 0.0
+        self._render(start, None)
+        while self.is_running and not self.scene.is_finished():
+            now = self.clock()
+            if duration is not None and now - start >= duration:
+                break
+            accumulator += now - previous
+            previous = now
+            while not self.input_queue.empty():
+                self.scene.handle_input(self.input_queue.get_nowait())
+
+            n_updates = 0
+            while accumulator >= self.dt:
+                if n_updates == self.max_catch_up:
+                    n_dropped = int(accumulator // self.dt)
+                    self.n_dropped_ticks += n_dropped
+                    accumulator -= n_dropped * self.dt
+                    break
+                self.scene.update(self.dt)
+                accumulator -= self.dt
+                n_updates += 1
+            self.n_ticks += n_updates
+
+            if now - last_frame >= self.frame_period:
+                self._render(now, last_frame)
+                last_frame = now
+
+            next_tick = now + self.dt - accumulator
+            deadline = min(next_tick, last_frame + self.frame_period)
+            await self.sleep(max(deadline - self.clock(), 0.0))
+            self._observe(self.wakeup_jitter, 'tetris_loop_jitter_seconds',
+                          abs(self.clock() - deadline))
+        self._render(self.clock(), None)
+        self.is_running = False
+
+    def stats(self) -> dict:
+        return {
+            'ticks': self.n_ticks,
+            'frames': self.n_frames,
+            'dropped_ticks': self.n_dropped_ticks,
+            'wakeup_jitter': self.wakeup_jitter.to_dict(),
+            'frame_jitter': self.frame_jitter.to_dict(),
+        }
+
+    def _render(self, now: float, last_frame: float | None):
+        frame = self.scene.render()
+        self.n_frames += 1
+        if self.on_frame is not None:
+            self.on_frame(frame)
+        if last_frame is not None:
+            self._observe(self.frame_jitter, 'tetris_frame_jitter_seconds',
+                          abs(now - last_frame - self.frame_period))
+
+    def _observe(self, histogram: LatencyHistogram, name: str,
+                 seconds: float):
+        histogram.observe(seconds)
+        if self.instrumentation is not None:
+            self.instrumentation.observe(name, seconds)
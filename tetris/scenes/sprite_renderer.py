@@ -0,0 +1,203 @@
+import weakref
+
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from numpy.typing import NDArray
+
+from ..core.board import GARBAGE_ID, WALL_ID, Board
+from ..core.tetrimino_type import TetriminoType
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / 'assets'
+TILE_FILE = 'frustum_{}.png'
+TILE_COLORS = {
+    TetriminoType.I: 'cyan',
+    TetriminoType.O: 'yellow',
+    TetriminoType.T: 'purple',
+    TetriminoType.S: 'green',
+    TetriminoType.Z: 'red',
+    TetriminoType.J: 'blue',
+    TetriminoType.L: 'orange',
+}
+# Empty cell, Tetrimino ids, wall and garbage
+N_IDS = GARBAGE_ID + 1
+# Atlas row drawn for any other id
+FALLBACK_ID = N_IDS
+
+
+def build_sprite_atlas(tiles: dict[int, NDArray],
+                       background: tuple[int, int, int] = (0, 0, 0),
+                       wall: tuple[int, int, int] = (128, 128, 128),
+                       garbage: tuple[int, int, int] = (80, 80, 80),
+                       fallback: tuple[int, int, int] = (255, 0, 255)
+                       ) -> NDArray[np.uint8]:
+    """
+    Stack RGB(A) tiles into an atlas indexed by cell id.
+
+    Transparent pixels are blended over `background`. Ids without a tile
+    are filled with `background`, except the wall and garbage ids which
+    are filled with `wall` and `garbage`. The last row, `FALLBACK_ID`, is
+    filled with `fallback` and drawn for unknown ids.
+
+    Args:
+        tiles (dict[int, NDArray]): (h, w, 3) RGB or (h, w, 4) RGBA tile
+            per cell id, all of the same size.
+        background (tuple[int, int, int]): RGB of empty cells.
+        wall (tuple[int, int, int]): RGB of wall cells.
+        garbage (tuple[int, int, int]): RGB of garbage cells.
+        fallback (tuple[int, int, int]): RGB of unknown ids.
+
+    Returns:
+        NDArray[np.uint8]: Read-only (N_IDS + 1, h, w, 3) atlas.
+    """
+    shapes = {tile.shape[:2] for tile in tiles.values()}
+    if len(shapes) != 1:
+        raise ValueError('Tiles must all have the same size.')
+    tile_height, tile_width = shapes.pop()
+    atlas = np.empty((N_IDS + 1, tile_height, tile_width, 3),
+                     dtype=np.uint8)
+    atlas[:] = background
+    atlas[WALL_ID] = wall
+    atlas[GARBAGE_ID] = garbage
+    atlas[FALLBACK_ID] = fallback
+    for cell_id, tile in tiles.items():
+        rgb = tile[..., :3].astype(np.float64)
+        if tile.shape[2] == 4:
+            alpha = tile[..., 3:].astype(np.float64) / 255
+            rgb = rgb * alpha + np.array(background) * (1 - alpha)
+        atlas[cell_id] = np.rint(rgb)
+    atlas.flags.writeable = False
+    return atlas
+
+
+def load_tile(path: str | Path) -> NDArray[np.uint8]:
+    """Read a PNG tile as an (h, w, 4) RGBA array with OpenCV."""
+    try:
+        import cv2
+    except ImportError as exc:
+        raise ImportError('OpenCV (cv2) is required to load sprite tiles.'
+                          ) from exc
+    tile = cv2.imread(str(path), cv2.IMREAD_UNCHANGED)
+    if tile is None:
+        raise FileNotFoundError('Can not read the tile "{}".'.format(path))
+    if tile.ndim == 2:
+        return cv2.cvtColor(tile, cv2.COLOR_GRAY2RGBA)
+    if tile.shape[2] == 3:
+        return cv2.cvtColor(tile, cv2.COLOR_BGR2RGBA)
+    return cv2.cvtColor(tile, cv2.COLOR_BGRA2RGBA)
+
+
+@lru_cache(maxsize=None)
+def load_sprite_atlas(directory: str | Path = ASSETS_DIR
+                      ) -> NDArray[np.uint8]:
+    """
+    Atlas of the `frustum_*.png` tiles of `directory`, loaded once per
+    directory and shared by every renderer.
+    """
+    directory = Path(directory)
+    return build_sprite_atlas({
+        tetrimino.id: load_tile(directory / TILE_FILE.format(color))
+        for tetrimino, color in TILE_COLORS.items()})
+
+
+class SpriteRenderer:
+    """
+    Compose RGB frames of a board from a sprite atlas.
+
+    A frame is one `np.take` of atlas rows with a (H, tile_height, W) index
+    built from the cell ids, written straight into an output buffer laid out
+    as (H, tile_height, W, tile_width, 3), which is the (H * tile_height,
+    W * tile_width, 3) image. The id, index and output buffers are allocated
+    for the first field shape and reused for every later frame, so the
+    returned frame is overwritten by the next call; copy it to keep it.
+    Fields may have leading batch dimensions, e.g. `VectorBoard` fields.
+    Ids without a tile are drawn with the last tile of the atlas, the
+    fallback tile of `build_sprite_atlas`.
+    """
+    def __init__(self, atlas: NDArray[np.uint8] | None = None):
+        if atlas is None:
+            atlas = load_sprite_atlas()
+        self.atlas = atlas
+        n_ids, self.tile_height, self.tile_width, _ = atlas.shape
+        self.fallback_id = n_ids - 1
+        # Row r of the tile of id i is row i * tile_height + r
+        self.atlas_rows: NDArray[np.uint8] = atlas.reshape(
+            n_ids * self.tile_height, self.tile_width, 3)
+        self.tile_rows: NDArray[np.intp] = np.arange(
+            self.tile_height)[:, np.newaxis]
+        self.frame: NDArray[np.uint8] | None = None
+        self._shape: tuple[int, ...] | None = None
+        self._ids: NDArray[np.intp] | None = None
+        self._index: NDArray[np.intp] | None = None
+        self._tiles: NDArray[np.uint8] | None = None
+        self._board: weakref.ref | None = None
+        self._version: tuple[int, int] | None = None
+
+    def compose(self, field: NDArray[np.uint8],
+                active: NDArray[np.uint8] | None = None
+                ) -> NDArray[np.uint8]:
+        """
+        Draw `field` with the `active` cells on top.
+
+        Args:
+            field (NDArray[np.uint8]): (..., H, W) cell ids, e.g. from
+                `get_play_field` or `get_field_view`.
+            active (NDArray[np.uint8] | None): Active cell ids of the same
+                shape, e.g. from `get_active_field`.
+
+        Returns:
+            NDArray[np.uint8]: (..., H * tile_height, W * tile_width, 3)
+                RGB frame in the reused output buffer.
+        """
+        self._allocate(field.shape)
+        ids = self._ids
+        if active is None:
+            np.copyto(ids, field)
+        else:
+            # Active cells are never on filled cells
+            np.maximum(field, active, out=ids)
+        np.minimum(ids, self.fallback_id, out=ids)
+        np.multiply(ids, self.tile_height, out=ids)
+        np.add(ids[..., np.newaxis, :], self.tile_rows, out=self._index)
+        # The index is in range, 'clip' only avoids buffering the output
+        np.take(self.atlas_rows, self._index, axis=0, out=self._tiles,
+                mode='clip')
+        self._version = None
+        return self.frame
+
+    def render(self, board: Board) -> NDArray[np.uint8]:
+        """
+        Frame of `board`, composed only when its field or active Tetrimino
+        changed since the previous call.
+        """
+        version = (board.field_version, board.active_version)
+        # A weak reference, as the id of a freed board can be reused
+        if (self._board is not None and self._board() is board
+                and version == self._version):
+            return self.frame
+        frame = self.compose(board.get_field_view(),
+                             board.get_active_view())
+        self._board = weakref.ref(board)
+        self._version = version
+        return frame
+
+    def invalidate(self):
+        """Compose the next `render` even if the board did not change."""
+        self._version = None
+
+    def _allocate(self, shape: tuple[int, ...]):
+        if shape == self._shape:
+            return
+        *batch, height, width = shape
+        batch = tuple(batch)
+        self._shape = shape
+        self._ids = np.empty(shape, dtype=np.intp)
+        self._index = np.empty(batch + (height, self.tile_height, width),
+                               dtype=np.intp)
+        self.frame = np.empty(batch + (height * self.tile_height,
+                                       width * self.tile_width, 3),
+                              dtype=np.uint8)
+        self._tiles = self.frame.reshape(
+            batch + (height, self.tile_height, width, self.tile_width, 3))
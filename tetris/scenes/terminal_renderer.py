@@ -0,0 +1,94 @@
+import sys
+
+from typing import TextIO
+
+import numpy as np
+
+from numpy.typing import NDArray
+
+from ..core.board import GARBAGE_ID
+
+# Empty cell, Tetrimino ids, wall and garbage
+N_IDS = GARBAGE_ID + 1
+# ANSI escape sequences
+CLEAR_SCREEN = '\x1b[2J'
+CLEAR_LINE = '\x1b[K'
+CLEAR_BELOW = '\x1b[J'
+MOVE_CURSOR = '\x1b[{};1H'
+
+
+class TerminalRenderer:
+    """
+    Draw frames on an ANSI terminal, sending only the rows that changed.
+
+    A frame is built in one step by indexing a glyph lookup table with the
+    cell ids of the board and active arrays, instead of walking the cells.
+    Each changed row is written in place after a cursor move, and the cursor
+    is left on the line below the frame.
+    """
+    def __init__(self, stream: TextIO | None = None, empty: str = '.',
+                 block: str = '#', active: str = 'o'):
+        if not len(empty) == len(block) == len(active) > 0:
+            raise ValueError('Glyphs must have the same nonzero length.')
+        self.stream = stream if stream is not None else sys.stdout
+        # Cell ids 0..N_IDS-1 are locked cells, N_IDS.. are active cells
+        self.lut: NDArray[np.str_] = np.array(
+            [empty] + [block] * (N_IDS - 1) + [empty] + [active] * (N_IDS - 1))
+        self.previous: list[str] = []
+        self.previous_key: tuple | None = None
+
+    def build_frame(self, board: NDArray[np.uint8],
+                    active: NDArray[np.uint8]) -> list[str]:
+        codes = np.where(board != 0, board, active.astype(np.intp) + N_IDS)
+        chars = np.ascontiguousarray(self.lut[codes])
+        # Joining the glyphs of a row is a view as one string per row, in
+        # the byte order of the glyphs
+        n_chars = chars.shape[1] * (chars.dtype.itemsize // 4)
+        row_dtype = '{}U{}'.format(chars.dtype.byteorder, n_chars)
+        return chars.view(row_dtype).ravel().tolist()
+
+    def invalidate(self):
+        """Redraw the whole screen on the next frame."""
+        self.previous = []
+        self.previous_key = None
+
+    def render(self, data: dict, footer: list[str] | None = None) -> int:
+        """
+        Draw the board and score of `TetrisCli.render_data`.
+
+        Nothing is built when the 'version' of the data and the footer are
+        the same as for the previous frame.
+
+        Args:
+            data (dict): Render data with 'board', 'active' and 'score'.
+            footer (list[str] | None): Extra lines drawn below the score.
+
+        Returns:
+            int: Number of rows written to the terminal.
+        """
+        key = (data.get('version'), tuple(footer or ()))
+        if key[0] is not None and key == self.previous_key:
+            return 0
+        self.previous_key = key
+        lines = self.build_frame(data['board'], data['active'])
+        lines += ['', ' SCORE: {}'.format(data['score'])]
+        if footer:
+            lines += footer
+        return self.render_lines(lines)
+
+    def render_lines(self, lines: list[str]) -> int:
+        out = []
+        if not self.previous:
+            out.append(CLEAR_SCREEN)
+        previous = self.previous
+        n_written = 0
+        for row, line in enumerate(lines):
+            if row < len(previous) and previous[row] == line:
+                continue
+            out.append(MOVE_CURSOR.format(row + 1) + line + CLEAR_LINE)
+            n_written += 1
+        out.append(MOVE_CURSOR.format(len(lines) + 1) + CLEAR_BELOW)
+        self.stream.write(''.join(out))
+        self.stream.flush()
+        self.previous = lines
+        return n_written
@@ -1,21 +1,40 @@
+import time
+
 from ..core.board import Board, MoveType
+from ..core.instrumentation import Instrumentation
 from ..core.player_status import PlayerStatus
+from ..core.replay import ReplayRecorder
 from ..core.tetrimino_factory import TetriminoFactory
 
 
 class TetrisCli:
-    def __init__(self, lock_delay_thr: int = 4):
-        self.board = Board()
-        self.tetrimino_factory = TetriminoFactory()
+    def __init__(self, lock_delay_thr: int = 4, seed: int = -1,
+                 instrumentation: Instrumentation | None = None,
+                 recorder: ReplayRecorder | None = None,
+                 board: Board | None = None):
+        self.board = board if board is not None else Board()
+        self.board.instrumentation = instrumentation
+        self.instrumentation = instrumentation
+        self.tetrimino_factory = TetriminoFactory(seed)
         self.lock_delay_thr = lock_delay_thr
         self.lock_delay_counter = 0
         self.is_playing = True
         self.player_status = PlayerStatus()
+        self.recorder = recorder
+        if recorder is not None:
+            recorder.start(self.board, self.player_status,
+                           self.tetrimino_factory.seed)
+            self.board.recorder = recorder
 
     def create_new_tetrimino(self):
         new_tetrimino, rot = self.tetrimino_factory.generate_random()
-        if not self.board.create_new_tetrimino(new_tetrimino, rot):
+        created = self.board.create_new_tetrimino(new_tetrimino, rot)
+        if self.recorder is not None:
+            self.recorder.record_spawn(new_tetrimino, rot, created)
+        if not created:
             self.is_playing = False
+            if self.instrumentation is not None:
+                self.instrumentation.count('tetris_games_over_total')
 
     def move_left(self):
         self.board.move_tetrimino(MoveType.LEFT)
@@ -32,6 +51,12 @@ class TetrisCli:
         if self.lock_delay_counter < self.lock_delay_thr:
             self.step()
 
+    def drop(self):
+        if not self.is_playing:
+            return
+        self.board.move_tetrimino(MoveType.DROP)
+        self.lock_tetrimino()
+
     def rotate_cw(self):
         self.board.move_tetrimino(MoveType.ROTATE_CW)
 
@@ -41,22 +66,40 @@ class TetrisCli:
     def step(self):
         if not self.is_playing:
             return
+        if self.instrumentation is None:
+            self._step()
+            return
+        start = time.perf_counter()
+        self._step()
+        self.instrumentation.observe('tetris_step_seconds',
+                                     time.perf_counter() - start)
+
+    def _step(self):
         status = self.board.move_tetrimino(MoveType.DOWN)
         if status:
             self.lock_delay_counter = 0
         else:
             self.lock_delay_counter += 1
         if self.lock_delay_counter >= self.lock_delay_thr:
-            n_cleared_lines = self.board.update_play_field()
-            self.player_status.add_score(n_cleared_lines)
-            self.create_new_tetrimino()
+            self.lock_tetrimino()
+
+    def lock_tetrimino(self):
+        n_cleared_lines = self.board.update_play_field()
+        self.player_status.add_score(n_cleared_lines)
+        if self.recorder is not None:
+            self.recorder.record_lock(n_cleared_lines)
+        self.create_new_tetrimino()
 
     def is_game_over(self):
         return not self.is_playing
 
     def render_data(self) -> dict:
+        # Read-only arrays owned by the board, only rebuilt when the game
+        # changed. 'version' is equal between two calls when nothing did.
         return {
-            'board': self.board.get_play_field(),
-            'active': self.board.get_active_field(),
+            'board': self.board.get_field_view(),
+            'active': self.board.get_active_view(),
             'score': self.player_status.score,
+            'version': (self.board.field_version,
+                        self.board.active_version),
         }
@@ -0,0 +1,109 @@
+import numpy as np
+
+from numpy.typing import NDArray
+
+from ..core.board import Board, MoveType
+from ..core.player_status import PlayerStatus
+from ..core.tetrimino_factory import TetriminoFactory
+from .tetris_cli_controller import TetrisCli
+
+# Bit of each MoveType in `Board.legal_moves`, in MoveType value order
+MOVE_BITS = 1 << np.arange(len(MoveType))
+# NO_MOVE only lets gravity act, which is always possible while playing
+NO_MOVE_BIT = 1 << MoveType.NO_MOVE.value
+
+
+class TetrisEnv:
+    """
+    Headless Tetris environment with a reset/step interface.
+
+    The game is a `TetrisCli`, so gravity, lock delay and scoring follow the
+    interactive game exactly. One `step` applies an action to the board,
+    then runs one `TetrisCli.step` gravity tick; `MoveType.DROP` is
+    `TetrisCli.drop`, which hard drops and locks the Tetrimino at once. No
+    array is copied during a step; fields are only built when `observe` is
+    called.
+
+    Target: at least 50,000 steps per second on one core with random actions
+    on the default `Board`. Measure with `python -m benchmarks.bench_env`.
+    """
+    def __init__(self, lock_delay_thr: int = 4, width: int = 10,
+                 height: int = 20, board_class: type[Board] = Board):
+        self.lock_delay_thr = lock_delay_thr
+        self.width = width
+        self.height = height
+        self.board_class = board_class
+        self.controller: TetrisCli | None = None
+        self.n_steps = 0
+
+    @property
+    def board(self) -> Board | None:
+        return self.controller.board if self.controller else None
+
+    @property
+    def tetrimino_factory(self) -> TetriminoFactory | None:
+        return (self.controller.tetrimino_factory if self.controller
+                else None)
+
+    @property
+    def player_status(self) -> PlayerStatus | None:
+        return self.controller.player_status if self.controller else None
+
+    @property
+    def is_playing(self) -> bool:
+        return self.controller is not None and self.controller.is_playing
+
+    @is_playing.setter
+    def is_playing(self, is_playing: bool):
+        self.controller.is_playing = is_playing
+
+    def reset(self, seed: int = -1):
+        self.controller = TetrisCli(
+            self.lock_delay_thr, seed,
+            board=self.board_class(self.width, self.height))
+        self.n_steps = 0
+        self.controller.create_new_tetrimino()
+
+    def step(self, action: MoveType | int) -> tuple[int, bool]:
+        """
+        Advance the game by one action and one gravity tick.
+
+        Args:
+            action (MoveType | int): Move to apply. NO_MOVE only lets
+                gravity act.
+
+        Returns:
+            tuple[int, bool]: Score gained by this step and whether the game
+                is over.
+        """
+        controller = self.controller
+        if controller is None or not controller.is_playing:
+            raise RuntimeError('Game is over. Call reset() first.')
+        if not isinstance(action, MoveType):
+            action = MoveType(action)
+        self.n_steps += 1
+        score = controller.player_status.score
+        if action == MoveType.DROP:
+            controller.drop()
+        else:
+            if action != MoveType.NO_MOVE:
+                controller.board.move_tetrimino(action)
+            controller.step()
+        return (controller.player_status.score - score,
+                not controller.is_playing)
+
+    def action_mask(self) -> NDArray[np.bool_]:
+        if not self.is_playing:
+            return np.zeros(len(MoveType), dtype=bool)
+        return ((self.board.legal_moves() | NO_MOVE_BIT) & MOVE_BITS) != 0
+
+    def observe(self) -> dict:
+        return {
+            'board': self.board.get_play_field(),
+            'active': (self.board.get_active_field() if self.is_playing
+                       else np.zeros((self.height, self.width),
+                                     dtype=np.uint8)),
+            'score': self.player_status.score,
+            'lines': self.player_status.lines,
+            'level': self.player_status.level,
+        }
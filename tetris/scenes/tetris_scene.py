@@ -0,0 +1,46 @@
+from .base_scene import BaseScene
+from .tetris_cli_controller import TetrisCli
+
+
+class TetrisScene(BaseScene):
+    """
+    Real-time Tetris scene driven by elapsed time instead of keystrokes.
+
+    `update` runs one `TetrisCli.step` (gravity and lock delay) every
+    `gravity_interval` seconds of game time. Keys are mapped to controller
+    actions by `key_map`, with the same keys as the CLI example.
+    """
+    def __init__(self, controller: TetrisCli | None = None,
+                 gravity_interval: float = 0.5,
+                 key_map: dict[int, str] | None = None):
+        self.controller = controller if controller is not None \
+            else TetrisCli()
+        self.gravity_interval = gravity_interval
+        self.key_map = key_map if key_map is not None else {
+            ord('a'): 'move_left',
+            ord('d'): 'move_right',
+            ord('s'): 'move_down',
+            ord('x'): 'drop',
+            ord('e'): 'rotate_cw',
+            ord('w'): 'rotate_ccw',
+        }
+        self.elapsed = 0.0
+        if self.controller.board.active_tetrimino is None:
+            self.controller.create_new_tetrimino()
+
+    def update(self, dt: float):
+        self.elapsed += dt
+        while self.elapsed >= self.gravity_interval:
+            self.elapsed -= self.gravity_interval
+            self.controller.step()
+
+    def render(self) -> dict:
+        return self.controller.render_data()
+
+    def handle_input(self, key: int):
+        action = self.key_map.get(key)
+        if action is not None and not self.controller.is_game_over():
+            getattr(self.controller, action)()
+
+    def is_finished(self) -> bool:
+        return self.controller.is_game_over()
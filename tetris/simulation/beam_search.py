@@ -0,0 +1,189 @@
+import time
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from numpy.typing import NDArray
+
+from ..core.board import Board, MoveType, Placement
+from ..core.features import extract_features
+from ..core.tetrimino import Tetrimino
+from ..core.tetrimino_type import TetriminoType
+from ..scenes.tetris_env import TetrisEnv
+
+
+@dataclass(frozen=True)
+class FeatureWeights:
+    # Defaults from the genetic search of Yiyuan Lee's Tetris AI
+    height: float = -0.510066
+    lines: float = 0.760666
+    holes: float = -0.35663
+    bumpiness: float = -0.184483
+    row_transitions: float = 0.0
+    wells: float = 0.0
+
+
+@dataclass
+class SearchNode:
+    # (TetriminoType, Placement) locked from the root, in order
+    placements: list[tuple[TetriminoType, Placement]]
+    n_lines: int
+    score: float
+
+
+@dataclass
+class SearchResult:
+    placement: Placement | None
+    score: float
+    depth: int
+    n_nodes: int
+    elapsed: float
+    nodes_per_second: float
+    # Placements of the best line, one per searched piece
+    line: list[Placement] = field(default_factory=list)
+
+
+class BeamSearchAgent:
+    """
+    Beam search over the placements of the current and preview pieces.
+
+    Each level expands every node of the beam with all placements of the
+    next piece from `Board.enumerate_placements`. Boards are never cloned:
+    a node is rebuilt by locking its placements inside `Board.push_undo` /
+    `pop_undo`, so each lock only saves the rows it changes. The fields of
+    all children of a level are stacked and scored in one batched
+    `extract_features` call, children with the same field (equal Zobrist
+    hash) are merged into the best scoring one and the `beam_width` best
+    ones are kept.
+
+    The search stops early once `max_nodes` children were evaluated or
+    `time_budget` seconds passed, and returns the best node of the deepest
+    level finished.
+    """
+    def __init__(self, beam_width: int = 8, depth: int = 2,
+                 weights: FeatureWeights = FeatureWeights(),
+                 max_nodes: int | None = None,
+                 time_budget: float | None = None):
+        self.beam_width = beam_width
+        self.depth = depth
+        self.weights = weights
+        self.max_nodes = max_nodes
+        self.time_budget = time_budget
+
+    def search(self, board: Board,
+               pieces: list[tuple[TetriminoType, int]]) -> SearchResult:
+        """
+        Find the best placement of the active Tetrimino of `board`.
+
+        Args:
+            board (Board): Board with the current piece active. It is left
+                unchanged.
+            pieces (list[tuple[TetriminoType, int]]): Preview pieces and
+                their spawn rotations, after the current one.
+
+        Returns:
+            SearchResult: First placement of the best line, its score and
+                search statistics.
+        """
+        start = time.perf_counter()
+        current = board.active_tetrimino
+        pieces = [(current.type, current.rot)] + list(pieces)
+        beam = [SearchNode([], 0, 0.0)]
+        best = None
+        n_nodes = 0
+        depth = 0
+        for piece in pieces[:self.depth]:
+            children = []
+            fields = []
+            seen = {}
+            for node in beam:
+                if self._is_over_budget(start, n_nodes):
+                    break
+                n_nodes += self._expand(board, node, piece, children,
+                                        fields, seen)
+            if not children:
+                break
+            self._score(children, fields)
+            children.sort(key=lambda child: child.score, reverse=True)
+            beam = children[:self.beam_width]
+            best = beam[0]
+            depth += 1
+            if self._is_over_budget(start, n_nodes):
+                break
+        elapsed = time.perf_counter() - start
+        return SearchResult(
+            placement=best.placements[0][1] if best is not None else None,
+            score=best.score if best is not None else float('-inf'),
+            depth=depth,
+            n_nodes=n_nodes,
+            elapsed=elapsed,
+            nodes_per_second=n_nodes / elapsed if elapsed > 0 else 0.0,
+            line=[p for _, p in best.placements] if best is not None else [])
+
+    def act(self, env: TetrisEnv) -> SearchResult:
+        """Search with the preview of the env and play the placement."""
+        preview = env.tetrimino_factory.peek(self.depth - 1)
+        result = self.search(env.board, preview)
+        if result.placement is not None:
+            for move in result.placement.path:
+                env.board.move_tetrimino(move)
+        env.step(MoveType.DROP)
+        return result
+
+    def _expand(self, board: Board, node: SearchNode,
+                piece: tuple[TetriminoType, int],
+                children: list[SearchNode], fields: list[NDArray],
+                seen: dict[int, int]) -> int:
+        board.push_undo()
+        try:
+            for tetrimino, placement in node.placements:
+                self._lock(board, tetrimino, placement)
+            if node.placements and not board.create_new_tetrimino(*piece):
+                return 0
+            tetrimino = board.active_tetrimino.type
+            placements, _ = board.enumerate_placements()
+            for placement in placements:
+                board.push_undo()
+                n_lines = self._lock(board, tetrimino, placement)
+                child = SearchNode(node.placements + [(tetrimino, placement)],
+                                   node.n_lines + n_lines, 0.0)
+                index = seen.get(board.field_hash)
+                if index is None:
+                    seen[board.field_hash] = len(children)
+                    children.append(child)
+                    fields.append(board.get_field_view().copy())
+                elif (self.weights.lines * child.n_lines
+                      > self.weights.lines * children[index].n_lines):
+                    # Same field, so the scores only differ by the lines
+                    children[index] = child
+                board.pop_undo()
+            return len(placements)
+        finally:
+            board.pop_undo()
+
+    @staticmethod
+    def _lock(board: Board, tetrimino: TetriminoType,
+              placement: Placement) -> int:
+        board.active_tetrimino = Tetrimino(tetrimino, placement.pos_x,
+                                           placement.pos_y, placement.rot)
+        return board.update_play_field()
+
+    def _score(self, children: list[SearchNode], fields: list[NDArray]):
+        features = extract_features(np.stack(fields))
+        weights = self.weights
+        n_lines = np.array([child.n_lines for child in children])
+        scores = (weights.height * features.heights.sum(axis=-1)
+                  + weights.lines * n_lines
+                  + weights.holes * features.holes.sum(axis=-1)
+                  + weights.bumpiness * features.bumpiness
+                  + weights.row_transitions * features.row_transitions
+                  + weights.wells * features.well_depths.sum(axis=-1))
+        for child, score in zip(children, scores.tolist()):
+            child.score = score
+
+    def _is_over_budget(self, start: float, n_nodes: int) -> bool:
+        if self.max_nodes is not None and n_nodes >= self.max_nodes:
+            return True
+        return (self.time_budget is not None
+                and time.perf_counter() - start >= self.time_budget)
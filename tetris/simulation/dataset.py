@@ -0,0 +1,264 @@
+import json
+import os
+import queue
+import threading
+
+from pathlib import Path
+
+import numpy as np
+
+from numpy.typing import NDArray
+
+from ..core.board import Board, MoveType
+from ..scenes.tetris_env import TetrisEnv
+
+INDEX_FILE = 'index.json'
+SHARD_FILE = 'shard_{:05d}.bin'
+
+
+def record_dtype(width: int, height: int) -> np.dtype:
+    """
+    Fixed layout of one step. The field is the occupancy of the play field
+    without margins, bit-packed row-major. 'piece' is the TetriminoType id
+    of the active Tetrimino (0 if none) and 'x', 'y' its padded position.
+    """
+    return np.dtype([
+        ('field', np.uint8, ((width * height + 7) // 8,)),
+        ('piece', np.uint8),
+        ('rot', np.uint8),
+        ('x', np.int8),
+        ('y', np.int8),
+        ('action', np.uint8),
+        ('reward', np.int32),
+        ('done', np.bool_),
+    ])
+
+
+class DatasetWriter:
+    """
+    Stream steps to memory-mapped shard files.
+
+    Steps are packed into an in-memory buffer of `buffer_size` records.
+    Full buffers are handed to a background thread through a queue of at
+    most `max_pending` buffers, which copies them into the current shard and
+    starts a new shard every `shard_size` records. The simulation loop only
+    blocks if the thread falls `max_pending` buffers behind. `close` flushes
+    everything and writes the index.
+    """
+    def __init__(self, directory: str | Path, width: int = 10,
+                 height: int = 20, shard_size: int = 1 << 16,
+                 buffer_size: int = 4096, max_pending: int = 8):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.width = width
+        self.height = height
+        self.dtype = record_dtype(width, height)
+        self.shard_size = shard_size
+        self.buffer_size = buffer_size
+        self.shards: list[dict] = []
+        self.n_records = 0
+        self._buffer = np.zeros(buffer_size, dtype=self.dtype)
+        self._n_buffered = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._error: Exception | None = None
+        self._shard: np.memmap | None = None
+        self._thread = threading.Thread(target=self._run_flush, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def add(self, board: Board, action: MoveType | int, reward: int,
+            done: bool):
+        """Record the current state of `board` with the step outcome."""
+        record = self._next_record()
+        self._write_state(record, board)
+        self._write_outcome(record, action, reward, done)
+
+    def record_step(self, env: TetrisEnv,
+                    action: MoveType | int) -> tuple[int, bool]:
+        """
+        Step `env` and record the state before the step with its outcome.
+        """
+        record = self._next_record()
+        self._write_state(record, env.board)
+        reward, done = env.step(action)
+        self._write_outcome(record, action, reward, done)
+        return reward, done
+
+    def close(self):
+        if self._n_buffered:
+            self._enqueue()
+        self._queue.put(None)
+        self._thread.join()
+        self._raise_error()
+
+    def _next_record(self) -> np.void:
+        if self._n_buffered == self.buffer_size:
+            self._enqueue()
+        record = self._buffer[self._n_buffered]
+        self._n_buffered += 1
+        self.n_records += 1
+        return record
+
+    def _write_state(self, record: np.void, board: Board):
+        record['field'] = np.packbits(board.get_field_view() != 0)
+        tetrimino = board.active_tetrimino
+        if tetrimino is None:
+            record['piece'] = 0
+            return
+        record['piece'] = tetrimino.type.id
+        record['rot'] = tetrimino.rot % len(tetrimino.type.shapes)
+        record['x'] = tetrimino.pos_x
+        record['y'] = tetrimino.pos_y
+
+    @staticmethod
+    def _write_outcome(record: np.void, action: MoveType | int, reward: int,
+                       done: bool):
+        record['action'] = (action.value if isinstance(action, MoveType)
+                            else action)
+        record['reward'] = reward
+        record['done'] = done
+
+    def _enqueue(self):
+        self._raise_error()
+        self._queue.put(self._buffer[:self._n_buffered])
+        self._buffer = np.zeros(self.buffer_size, dtype=self.dtype)
+        self._n_buffered = 0
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise RuntimeError('Dataset flush failed.') from self._error
+
+    def _run_flush(self):
+        while True:
+            records = self._queue.get()
+            if records is None:
+                break
+            if self._error is not None:
+                continue
+            try:
+                self._write_records(records)
+            except Exception as exc:
+                self._error = exc
+        try:
+            self._close_shard()
+            self._write_index()
+        except Exception as exc:
+            self._error = exc
+
+    def _write_records(self, records: NDArray):
+        while len(records):
+            if self._shard is None:
+                self._open_shard()
+            shard = self.shards[-1]
+            start = shard['n_records']
+            n = min(len(records), self.shard_size - start)
+            self._shard[start:start + n] = records[:n]
+            shard['n_records'] += n
+            records = records[n:]
+            if shard['n_records'] == self.shard_size:
+                self._close_shard()
+
+    def _open_shard(self):
+        name = SHARD_FILE.format(len(self.shards))
+        self._shard = np.memmap(self.directory / name, dtype=self.dtype,
+                                mode='w+', shape=(self.shard_size,))
+        self.shards.append({'file': name, 'n_records': 0})
+
+    def _close_shard(self):
+        if self._shard is None:
+            return
+        self._shard.flush()
+        self._shard = None
+        shard = self.shards[-1]
+        # Drop the unused tail of the last shard
+        os.truncate(self.directory / shard['file'],
+                    shard['n_records'] * self.dtype.itemsize)
+        self._write_index()
+
+    def _write_index(self):
+        index = {
+            'width': self.width,
+            'height': self.height,
+            'shards': self.shards,
+        }
+        tmp_path = self.directory / (INDEX_FILE + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self.directory / INDEX_FILE)
+
+
+class DatasetReader:
+    """
+    Random access to the steps written by `DatasetWriter`.
+
+    Shards are memory-mapped read-only, so `get_shard` and `__getitem__` on
+    a slice return views without copying. `sample` gathers random records
+    across shards into one array.
+    """
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        with open(self.directory / INDEX_FILE) as f:
+            index = json.load(f)
+        self.width: int = index['width']
+        self.height: int = index['height']
+        self.dtype = record_dtype(self.width, self.height)
+        self.shards: list[np.memmap] = [
+            np.memmap(self.directory / shard['file'], dtype=self.dtype,
+                      mode='r', shape=(shard['n_records'],))
+            for shard in index['shards'] if shard['n_records']]
+        # Global index of the first record of each shard
+        self.offsets: NDArray[np.int64] = np.cumsum(
+            [0] + [len(shard) for shard in self.shards])
+
+    def __len__(self) -> int:
+        return int(self.offsets[-1])
+
+    def get_shard(self, index: int) -> np.memmap:
+        return self.shards[index]
+
+    def __getitem__(self, index: int | slice) -> NDArray:
+        """
+        One record, or a slice of records within one shard as a view.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            shard = int(np.searchsorted(self.offsets, start, 'right')) - 1
+            offset = self.offsets[shard]
+            if stop > self.offsets[shard + 1]:
+                raise IndexError('Slice spans several shards.')
+            return self.shards[shard][start - offset:stop - offset:step]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Record index out of range: {}.'.format(index))
+        shard = int(np.searchsorted(self.offsets, index, 'right')) - 1
+        return self.shards[shard][index - self.offsets[shard]]
+
+    def sample(self, batch_size: int,
+               rng: np.random.Generator | None = None) -> NDArray:
+        """
+        Records at `batch_size` uniform random indices, in drawn order.
+        Indices are sorted only to read each shard in one ascending pass.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        indices = rng.integers(0, len(self), batch_size)
+        order = np.argsort(indices, kind='stable')
+        indices = indices[order]
+        shards = np.searchsorted(self.offsets, indices, 'right') - 1
+        batch = np.empty(batch_size, dtype=self.dtype)
+        for shard in np.unique(shards):
+            selected = shards == shard
+            batch[order[selected]] = self.shards[shard][
+                indices[selected] - self.offsets[shard]]
+        return batch
+
+    def unpack_fields(self, records: NDArray) -> NDArray[np.uint8]:
+        """Occupancy fields of records, shape (..., height, width)."""
+        n_cells = self.width * self.height
+        fields = np.unpackbits(records['field'], axis=-1, count=n_cells)
+        return fields.reshape(records.shape + (self.height, self.width))
@@ -0,0 +1,179 @@
+import math
+import random
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Callable, Iterable
+
+from ..core.board import MoveType
+from ..scenes.tetris_env import TetrisEnv
+
+
+Policy = Callable[[TetrisEnv, random.Random], MoveType]
+
+
+def random_policy(env: TetrisEnv, rng: random.Random) -> MoveType:
+    return rng.choice(list(MoveType))
+
+
+@dataclass(frozen=True)
+class EpisodeResult:
+    seed: int
+    score: int
+    lines: int
+    level: int
+    steps: int
+
+
+@dataclass(frozen=True)
+class Distribution:
+    count: int
+    mean: float
+    std: float
+    ci_low: float
+    ci_high: float
+    min: int
+    max: int
+    percentiles: dict[int, int]
+
+
+@dataclass
+class StatsAccumulator:
+    """
+    Streaming statistics of integer samples.
+
+    Only exact integer sums and a histogram are kept, so the summary does not
+    depend on the order in which samples arrive.
+    """
+    count: int = 0
+    total: int = 0
+    total_sq: int = 0
+    histogram: Counter = field(default_factory=Counter)
+
+    def add(self, value: int):
+        self.count += 1
+        self.total += value
+        self.total_sq += value * value
+        self.histogram[value] += 1
+
+    def summary(self, confidence: float = 0.95,
+                percentiles: Iterable[int] = (5, 25, 50, 75, 95)
+                ) -> Distribution:
+        if self.count == 0:
+            raise ValueError('No samples to summarize.')
+        mean = self.total / self.count
+        if self.count > 1:
+            variance = ((self.total_sq * self.count - self.total ** 2)
+                        / (self.count * (self.count - 1)))
+        else:
+            variance = 0.0
+        std = math.sqrt(variance)
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        half_width = z * std / math.sqrt(self.count)
+        values = sorted(self.histogram)
+        return Distribution(
+            count=self.count,
+            mean=mean,
+            std=std,
+            ci_low=mean - half_width,
+            ci_high=mean + half_width,
+            min=values[0],
+            max=values[-1],
+            percentiles={p: self._percentile(values, p) for p in percentiles})
+
+    def _percentile(self, values: list[int], percentile: int) -> int:
+        # Nearest-rank percentile from the histogram
+        rank = max(1, math.ceil(percentile / 100 * self.count))
+        seen = 0
+        for value in values:
+            seen += self.histogram[value]
+            if seen >= rank:
+                return value
+        return values[-1]
+
+
+@dataclass(frozen=True)
+class EvaluationResult:
+    n_episodes: int
+    score: Distribution
+    lines: Distribution
+    level: Distribution
+    steps: Distribution
+
+
+def episode_seeds(base_seed: int, n_episodes: int) -> list[int]:
+    """
+    Derive one TetriminoFactory seed per episode.
+
+    Seeds are bound to episodes, not to workers, so a seed set gives the
+    same games whatever the number of workers.
+    """
+    rng = random.Random(base_seed)
+    return [rng.getrandbits(63) for _ in range(n_episodes)]
+
+
+def run_episode(seed: int, policy: Policy = random_policy,
+                max_steps: int = 10000) -> EpisodeResult:
+    env = TetrisEnv()
+    env.reset(seed)
+    rng = random.Random(seed)
+    done = False
+    while not done and env.n_steps < max_steps:
+        _, done = env.step(policy(env, rng))
+    status = env.player_status
+    return EpisodeResult(seed, status.score, status.lines, status.level,
+                         env.n_steps)
+
+
+def _run_chunk(seeds: list[int], policy: Policy,
+               max_steps: int) -> list[EpisodeResult]:
+    return [run_episode(seed, policy, max_steps) for seed in seeds]
+
+
+def evaluate(seeds: list[int], policy: Policy = random_policy,
+             n_workers: int = 1, chunk_size: int = 64,
+             max_steps: int = 10000,
+             confidence: float = 0.95) -> EvaluationResult:
+    """
+    Play one episode per seed on a process pool and aggregate the results.
+
+    Chunks of seeds are scheduled on the workers and their results are
+    folded into the statistics as soon as a chunk completes. Aggregates are
+    identical for any `n_workers` and `chunk_size`.
+
+    Args:
+        seeds (list[int]): TetriminoFactory seed of each episode.
+        policy (Policy): Picklable function choosing the next move.
+        n_workers (int): Number of processes. 1 runs in this process.
+        chunk_size (int): Number of episodes per scheduled task.
+        max_steps (int): Step limit of an episode.
+        confidence (float): Level of the confidence intervals.
+
+    Returns:
+        EvaluationResult: Distributions of score, lines, level and steps.
+    """
+    stats = {name: StatsAccumulator()
+             for name in ('score', 'lines', 'level', 'steps')}
+
+    def aggregate(results: list[EpisodeResult]):
+        for result in results:
+            stats['score'].add(result.score)
+            stats['lines'].add(result.lines)
+            stats['level'].add(result.level)
+            stats['steps'].add(result.steps)
+
+    chunks = [seeds[i:i + chunk_size]
+              for i in range(0, len(seeds), chunk_size)]
+    if n_workers <= 1:
+        for chunk in chunks:
+            aggregate(_run_chunk(chunk, policy, max_steps))
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(_run_chunk, chunk, policy, max_steps)
+                       for chunk in chunks]
+            for future in as_completed(futures):
+                aggregate(future.result())
+    summaries = {name: acc.summary(confidence) for name, acc in stats.items()}
+    return EvaluationResult(n_episodes=len(seeds), **summaries)
@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+import numpy as np
+
+from ..scenes.tetris_env import TetrisEnv
+
+# Garbage rows sent for 0, 1, 2, 3 and 4 cleared lines
+DEFAULT_ATTACK_TABLE = (0, 0, 1, 2, 4)
+
+
+class Agent(Protocol):
+    def act(self, env: TetrisEnv):
+        """Play the active Tetrimino of `env` until it is locked."""
+
+
+@dataclass
+class VersusResult:
+    # Index of the last player standing, None on a draw or at max_rounds
+    winner: int | None
+    n_rounds: int
+    lines_cleared: list[int]
+    lines_sent: list[int]
+    lines_received: list[int]
+
+
+class VersusMatch:
+    """
+    Versus match between any number of players in one process.
+
+    Players take turns placing one Tetrimino each. Lines cleared on a turn
+    are converted to garbage rows by `attack_table` and sent to the next
+    player still alive. Pending garbage is inserted with
+    `Board.insert_garbage` at the start of the receiver's turn, with one
+    random hole column per attack. A player loses when its game is over,
+    garbage pushes its stack out of the field or garbage leaves no room
+    for its active Tetrimino.
+    """
+    def __init__(self, agents: list[Agent], seed: int = 0,
+                 attack_table: tuple[int, ...] = DEFAULT_ATTACK_TABLE,
+                 **env_kwargs):
+        self.agents = agents
+        self.attack_table = attack_table
+        self.rng = np.random.default_rng(seed)
+        seeds = self.rng.integers(0, 2 ** 63, len(agents)).tolist()
+        self.envs = [TetrisEnv(**env_kwargs) for _ in agents]
+        for env, env_seed in zip(self.envs, seeds):
+            env.reset(env_seed)
+        # Garbage rows waiting to be inserted, one entry per attack
+        self.pending: list[list[int]] = [[] for _ in agents]
+        self.lines_sent = [0] * len(agents)
+        self.lines_received = [0] * len(agents)
+
+    def is_alive(self, player: int) -> bool:
+        return self.envs[player].is_playing
+
+    def play_turn(self, player: int):
+        env = self.envs[player]
+        pending = self.pending[player]
+        while pending:
+            n_rows = pending.pop(0)
+            self.lines_received[player] += n_rows
+            hole = int(self.rng.integers(env.width))
+            if not env.board.insert_garbage(n_rows, hole):
+                env.is_playing = False
+                return
+        lines = env.player_status.lines
+        self.agents[player].act(env)
+        n_cleared = env.player_status.lines - lines
+        attack = self.attack_table[min(n_cleared, len(self.attack_table) - 1)]
+        target = self._next_alive(player)
+        if attack and target is not None:
+            self.pending[target].append(attack)
+            self.lines_sent[player] += attack
+
+    def run(self, max_rounds: int = 1000) -> VersusResult:
+        n_rounds = 0
+        while n_rounds < max_rounds:
+            alive = [i for i in range(len(self.envs)) if self.is_alive(i)]
+            if len(alive) <= 1 and len(self.envs) > 1:
+                break
+            for player in alive:
+                if self.is_alive(player):
+                    self.play_turn(player)
+            n_rounds += 1
+        alive = [i for i in range(len(self.envs)) if self.is_alive(i)]
+        return VersusResult(
+            winner=(alive[0] if len(alive) == 1 and len(self.envs) > 1
+                    else None),
+            n_rounds=n_rounds,
+            lines_cleared=[env.player_status.lines for env in self.envs],
+            lines_sent=list(self.lines_sent),
+            lines_received=list(self.lines_received))
+
+    def _next_alive(self, player: int) -> int | None:
+        n_players = len(self.envs)
+        for i in range(1, n_players):
+            target = (player + i) % n_players
+            if self.is_alive(target):
+                return target
+        return None